@@ -12,6 +12,8 @@ from typing import List, Dict, Any
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.core.keyword_matcher import KeywordMatcher
+
 # 配置日志 - 同时输出到控制台和文件
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +28,32 @@ logger = logging.getLogger(__name__)
 REVIEW_LOG_PATH = os.path.join(os.path.dirname(__file__), '..', 'memory', 'review_log.json')
 BATCH_DIR = os.path.join(os.path.dirname(__file__), '..', 'memory')
 
+# 各评分项的关键词
+WHAT_IS_KEYWORDS = ['是一个', '是一款', '是用于', '主要解决', '提供']
+FEATURE_KEYWORDS = ['功能包括', '可以做', '能够', '支持', '提供了']
+TECH_KEYWORDS = ['使用', '基于', '采用', '实现', '技术', '代码', '架构']
+USAGE_KEYWORDS = ['安装', '使用', '配置', '运行', '开始', '上手']
+SCENARIO_KEYWORDS = ['场景', '时候', '情况', '用于', '适合', '当', '如果']
+COMPARISON_KEYWORDS = ['比', '相比', '优势', '更好', '更快', '更轻量', '区别']
+AUDIENCE_KEYWORDS = ['用户', '开发者', '普通人', '新手', '个人', '团队']
+FEEDBACK_KEYWORDS = ['评论区', '有人', '用户', '反馈', '说', '提到', '作者']
+LIMITATION_KEYWORDS = ['缺点', '问题', '不足', '限制', '坑', '注意', '小心']
+EMPTY_PHRASES = [
+    '针对痛点', '解决需求', '功能设计', '务实', '专注',
+    '讨论的焦点', '关注点主要', '从...来看', '整体来说'
+]
+TEMPLATE_PHRASES = [
+    '第一', '第二', '第三', '首先', '其次', '最后',
+    '从...来看', '综上所述', '总的来说', '综上所述'
+]
+
+# 所有关键词编译成一个匹配器，每篇内容只扫描一次
+REVIEW_MATCHER = KeywordMatcher(
+    WHAT_IS_KEYWORDS + FEATURE_KEYWORDS + TECH_KEYWORDS + USAGE_KEYWORDS + SCENARIO_KEYWORDS
+    + COMPARISON_KEYWORDS + AUDIENCE_KEYWORDS + FEEDBACK_KEYWORDS + LIMITATION_KEYWORDS
+    + EMPTY_PHRASES + TEMPLATE_PHRASES
+)
+
 def load_batch(batch_id: str) -> Dict:
     """加载批次内容"""
     batch_file = os.path.join(BATCH_DIR, f'batch_{batch_id}.json')
@@ -65,6 +93,9 @@ def review_content(content: Dict) -> Dict:
     
     logger.info(f"字数: {word_count} | 段落数: {len(paragraphs)}")
     
+    # 一次扫描找出所有命中的评分关键词
+    found = set(REVIEW_MATCHER.findall(text))
+    
     # 初始化评分维度
     scores = {
         "information": 0,      # 信息量 (4分)
@@ -81,7 +112,7 @@ def review_content(content: Dict) -> Dict:
     logger.info("分析信息量...")
     
     # 检查是否说明了"是什么"
-    if any(keyword in text.lower() for keyword in ['是一个', '是一款', '是用于', '主要解决', '提供']):
+    if found.intersection(WHAT_IS_KEYWORDS):
         scores["information"] += 1
         strengths.append("清楚说明了这是什么工具/项目")
     else:
@@ -89,7 +120,7 @@ def review_content(content: Dict) -> Dict:
         suggestions.append("开头应明确：这是一个XX，用于YY")
     
     # 检查是否说明了"能做什么"
-    if any(keyword in text.lower() for keyword in ['功能包括', '可以做', '能够', '支持', '提供了']):
+    if found.intersection(FEATURE_KEYWORDS):
         scores["information"] += 1
         strengths.append("说明了核心功能")
     else:
@@ -97,7 +128,7 @@ def review_content(content: Dict) -> Dict:
         suggestions.append("增加具体功能列表：支持XX、能够YY")
     
     # 检查是否有技术/实现细节
-    if any(keyword in text.lower() for keyword in ['使用', '基于', '采用', '实现', '技术', '代码', '架构']):
+    if found.intersection(TECH_KEYWORDS):
         scores["information"] += 1
         strengths.append("包含技术实现细节")
     else:
@@ -105,7 +136,7 @@ def review_content(content: Dict) -> Dict:
         suggestions.append("增加技术实现：使用XX技术，基于YY架构")
     
     # 检查是否有使用方式
-    if any(keyword in text.lower() for keyword in ['安装', '使用', '配置', '运行', '开始', '上手']):
+    if found.intersection(USAGE_KEYWORDS):
         scores["information"] += 1
         strengths.append("说明了使用方式")
     else:
@@ -113,11 +144,7 @@ def review_content(content: Dict) -> Dict:
         suggestions.append("增加使用方式：安装方法、配置步骤")
     
     # 扣分：空话检测
-    empty_phrases = [
-        '针对痛点', '解决需求', '功能设计', '务实', '专注',
-        '讨论的焦点', '关注点主要', '从...来看', '整体来说'
-    ]
-    empty_count = sum(1 for phrase in empty_phrases if phrase in text)
+    empty_count = sum(1 for phrase in EMPTY_PHRASES if phrase in found)
     if empty_count > 2:
         scores["information"] = max(0, scores["information"] - 1)
         weaknesses.append(f"包含{empty_count}处空话套话")
@@ -127,9 +154,7 @@ def review_content(content: Dict) -> Dict:
     logger.info("分析实用性...")
     
     # 检查是否有具体场景
-    if any(keyword in text.lower() for keyword in [
-        '场景', '时候', '情况', '用于', '适合', '当', '如果'
-    ]):
+    if found.intersection(SCENARIO_KEYWORDS):
         scores["practicality"] += 1.5
         strengths.append("说明了适用场景")
     else:
@@ -137,9 +162,7 @@ def review_content(content: Dict) -> Dict:
         suggestions.append("增加使用场景：适合在XX时候使用，当YY情况下")
     
     # 检查是否有对比优势
-    if any(keyword in text.lower() for keyword in [
-        '比', '相比', '优势', '更好', '更快', '更轻量', '区别'
-    ]):
+    if found.intersection(COMPARISON_KEYWORDS):
         scores["practicality"] += 1
         strengths.append("说明了与替代方案的对比")
     else:
@@ -147,9 +170,7 @@ def review_content(content: Dict) -> Dict:
         suggestions.append("增加对比：比XX快YY%，比ZZ轻量")
     
     # 检查是否适合"我"
-    if any(keyword in text.lower() for keyword in [
-        '用户', '开发者', '普通人', '新手', '个人', '团队'
-    ]):
+    if found.intersection(AUDIENCE_KEYWORDS):
         scores["practicality"] += 0.5
     else:
         suggestions.append("明确目标用户：适合XX人群使用")
@@ -167,9 +188,7 @@ def review_content(content: Dict) -> Dict:
         suggestions.append("增加数据：如'处理速度提升50%'、'已有1万用户'")
     
     # 检查是否有用户反馈/来源引用
-    if any(keyword in text.lower() for keyword in [
-        '评论区', '有人', '用户', '反馈', '说', '提到', '作者'
-    ]):
+    if found.intersection(FEEDBACK_KEYWORDS):
         scores["credibility"] += 1
         strengths.append("引用了用户反馈或讨论")
     else:
@@ -177,9 +196,7 @@ def review_content(content: Dict) -> Dict:
         suggestions.append("增加HN/Reddit评论区反馈：有人提到XX")
     
     # 检查是否有局限性说明
-    if any(keyword in text.lower() for keyword in [
-        '缺点', '问题', '不足', '限制', '坑', '注意', '小心'
-    ]):
+    if found.intersection(LIMITATION_KEYWORDS):
         scores["credibility"] += 0.5
         strengths.append("提到了潜在问题或限制")
     else:
@@ -189,11 +206,7 @@ def review_content(content: Dict) -> Dict:
     logger.info("分析阅读体验...")
     
     # 检查是否有固定套路
-    template_phrases = [
-        '第一', '第二', '第三', '首先', '其次', '最后',
-        '从...来看', '综上所述', '总的来说', '综上所述'
-    ]
-    template_count = sum(1 for phrase in template_phrases if phrase in text)
+    template_count = sum(1 for phrase in TEMPLATE_PHRASES if phrase in found)
     
     if template_count == 0 and empty_count <= 1:
         scores["experience"] = 1
@@ -240,8 +253,8 @@ def review_content(content: Dict) -> Dict:
     
     # 打印评审结果
     logger.info(f"评分结果: {total_score}/10")
-    logger.info(f"  信息量: {scores["information"]}/4 | 实用性: {scores["practicality"]}/3")
-    logger.info(f"  可信度: {scores["credibility"]}/2 | 体验: {scores["experience"]}/1")
+    logger.info(f"  信息量: {scores['information']}/4 | 实用性: {scores['practicality']}/3")
+    logger.info(f"  可信度: {scores['credibility']}/2 | 体验: {scores['experience']}/1")
     
     if strengths:
         logger.info(f"优点:")
@@ -315,7 +328,7 @@ def review_batch(batch_id: str):
     logger.info("评审完成汇总")
     logger.info('='*60)
     logger.info(f"总平均分: {avg_score:.1f}/10")
-    logger.info(f"高分内容(≥8): {sum(1 for r in reviews if r["total_score"] >= 8)}/{len(reviews)}")
+    logger.info(f"高分内容(≥8): {sum(1 for r in reviews if r['total_score'] >= 8)}/{len(reviews)}")
     logger.info(f"状态: {'建议发布' if avg_score >= 8 else '建议优化'}")
     
     # 生成优化建议汇总
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Article 内存占用基准
+用 tracemalloc 测量构造 N 篇文章（按各数据源的真实 metadata 形态混合）占用的内存，
+对比原来的 dataclass 版本（每篇带 __dict__ 和 metadata 字典，收集时再写入 collector_source）
+与当前 __slots__ 版本
+
+    python3 benchmarks/article_memory.py
+    python3 benchmarks/article_memory.py --count 200000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sources.base import Article
+
+@dataclass
+class LegacyArticle:
+    """改为 __slots__ 之前的 Article 定义"""
+    title: str
+    url: str
+    summary: str = ""
+    source: str = ""
+    published_at: Optional[datetime] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+def sample_fields(i: int) -> Dict[str, Any]:
+    """按各数据源 metadata 的实际形态生成第 i 篇文章的字段"""
+    kind = i % 5
+    if kind == 0:
+        source, metadata = 'hackernews', {'score': i % 900, 'comments': i % 300, 'type': 'top'}
+    elif kind == 1:
+        source, metadata = 'reddit', {'subreddit': 'LocalLLaMA', 'score': i % 2000, 'comments': i % 150}
+    elif kind == 2:
+        source, metadata = 'github_trending', {'language': 'Python', 'stars': i % 50000}
+    elif kind == 3:
+        source, metadata = 'producthunt', {'votes': i % 700, 'comments': i % 80, 'topics': ['Artificial Intelligence']}
+    else:
+        source, metadata = 'twitter', {'author': 'someone', 'likes': i % 5000, 'retweets': i % 400}
+    return {
+        'title': f"Article title number {i}",
+        'url': f"https://example.com/{source}/{i}",
+        'summary': "A short summary of the article that is long enough to look realistic.",
+        # 来源名来自各条记录的解析结果（如 JSON 解码），不是同一个字符串对象
+        'source': ''.join(source),
+        'metadata': metadata,
+    }
+
+def build(factory: Callable[..., Any], rows: List[Dict[str, Any]], tag_collector: bool) -> List[Any]:
+    articles = []
+    for row in rows:
+        article = factory(row['title'], row['url'], row['summary'], row['source'], None, dict(row['metadata']))
+        if tag_collector:
+            # 原来的收集流程：每篇文章都写入 collector_source
+            article.metadata['collector_source'] = row['source']
+        articles.append(article)
+    return articles
+
+def measure(label: str, factory: Callable[..., Any], rows: List[Dict[str, Any]], tag_collector: bool) -> float:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    articles = build(factory, rows, tag_collector)
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # 读取开销：按 calculate_hot_score 的方式经 metadata 访问常用字段；
+    # __slots__ 版本另测直接读数值槽位（打分、聚类、趋势索引等热路径的写法）
+    started = time.perf_counter()
+    for article in articles:
+        metadata = article.metadata
+        metadata.get('score', 0) + metadata.get('comments', 0) + metadata.get('stars', 0)
+    read_elapsed = time.perf_counter() - started
+    slot_read = ''
+    if isinstance(articles[0], Article):
+        started = time.perf_counter()
+        for article in articles:
+            (article.score or 0) + (article.comments or 0) + (article.stars or 0)
+        slot_read = f"  槽位读取 {time.perf_counter() - started:6.2f}s"
+
+    per_article = current / len(articles)
+    print(f"{label:<28} {current / 1024 / 1024:8.1f} MB  {per_article:7.0f} B/篇  "
+          f"构造 {elapsed:6.2f}s  metadata 读取 {read_elapsed:6.2f}s{slot_read}")
+    del articles
+    return current
+
+def main():
+    parser = argparse.ArgumentParser(description='Article 内存占用基准')
+    parser.add_argument('--count', type=int, default=100000, help='文章数量')
+    args = parser.parse_args()
+
+    rows = [sample_fields(i) for i in range(args.count)]
+    print(f"📦 {args.count} 篇文章（hackernews/reddit/github_trending/producthunt/twitter 各占 1/5）\n")
+    legacy = measure('dataclass + collector_source', LegacyArticle, rows, tag_collector=True)
+    measure('dataclass', LegacyArticle, rows, tag_collector=False)
+    current = measure('__slots__', Article, rows, tag_collector=False)
+    print(f"\n➜ 相比原来的收集流程节省 {(legacy - current) / 1024 / 1024:.1f} MB ({(legacy - current) / legacy:.0%})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+入口模块冷启动导入耗时基准
+用 python -X importtime 导入入口模块，汇总总耗时、已导入的数据源模块和耗时最高的模块；
+指定 --ref 时同时测量该 git 版本（git archive 导出到临时目录），对比冷启动差异
+
+    python3 benchmarks/import_time.py
+    python3 benchmarks/import_time.py --ref HEAD~1 --repeat 7
+    python3 benchmarks/import_time.py --module src.hourly --top 15
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODULES = ['src.__main__', 'src.hourly']
+
+# import time:       self [us] |  cumulative | imported package
+_LINE_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+def measure_once(module: str, root: str) -> List[Tuple[str, int, int, int]]:
+    """
+    在新的解释器中导入一次模块
+
+    Returns:
+        [(模块名, 自身耗时us, 累计耗时us, 嵌套深度)]
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [root, env.get('PYTHONPATH')]))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=root, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败:\n{proc.stderr[-2000:]}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = _LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+def measure(module: str, root: str, repeat: int) -> Dict[str, object]:
+    """多次测量取中位数（首次运行用于生成 .pyc，不计入）"""
+    measure_once(module, root)
+    runs = [measure_once(module, root) for _ in range(repeat)]
+
+    totals = [sum(row[1] for row in rows) for rows in runs]
+    median_run = runs[totals.index(sorted(totals)[len(totals) // 2])]
+    project_modules = [row for row in median_run if row[0] == 'src' or row[0].startswith(('src.', 'publishers'))]
+    return {
+        'total_ms': statistics.median(totals) / 1000,
+        'modules': len(median_run),
+        'project_modules': len(project_modules),
+        'sources_loaded': sorted(row[0] for row in median_run
+                                 if row[0].startswith('src.sources.') and row[0] != 'src.sources.base'),
+        'top': sorted(median_run, key=lambda row: row[1], reverse=True),
+    }
+
+def export_ref(ref: str, target: str):
+    """把指定 git 版本导出到目录"""
+    archive = subprocess.run(['git', 'archive', ref], cwd=REPO_ROOT, capture_output=True, check=True)
+    subprocess.run(['tar', '-x', '-C', target], input=archive.stdout, check=True)
+
+def print_report(label: str, module: str, result: Dict[str, object], top: int):
+    print(f"\n⏱️  {label} import {module}: {result['total_ms']:.1f} ms, "
+          f"{result['modules']} 个模块（项目 {result['project_modules']} 个）")
+    print(f"   已导入数据源: {', '.join(result['sources_loaded']) or '(无)'}")
+    for name, self_us, cumulative_us, depth in result['top'][:top]:
+        print(f"   {self_us / 1000:8.2f} ms self {cumulative_us / 1000:8.2f} ms cum  {'  ' * depth}{name}")
+
+def main():
+    parser = argparse.ArgumentParser(description='入口模块冷启动导入耗时基准')
+    parser.add_argument('--module', action='append', help='要测量的模块（可多次指定），默认 src.__main__ 和 src.hourly')
+    parser.add_argument('--ref', help='对比的 git 版本（如 HEAD~1）')
+    parser.add_argument('--repeat', type=int, default=5, help='重复次数，取中位数')
+    parser.add_argument('--top', type=int, default=10, help='显示自身耗时最高的模块数')
+    args = parser.parse_args()
+
+    modules = args.module or DEFAULT_MODULES
+    with tempfile.TemporaryDirectory() as ref_root:
+        if args.ref:
+            export_ref(args.ref, ref_root)
+
+        for module in modules:
+            current = measure(module, REPO_ROOT, args.repeat)
+            print_report('当前工作区', module, current, args.top)
+            if args.ref:
+                baseline = measure(module, ref_root, args.repeat)
+                print_report(args.ref, module, baseline, args.top)
+                saved = baseline['total_ms'] - current['total_ms']
+                print(f"   ➜ 相比 {args.ref}: 节省 {saved:.1f} ms "
+                      f"({saved / baseline['total_ms']:.0%})，少导入 {baseline['modules'] - current['modules']} 个模块")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+关键词匹配基准
+在合成的中英文标题 + 摘要上，对比各数据源原来的 `any(kw in text.lower() for kw in 关键词列表)` 循环
+与编译后的 KeywordMatcher：
+  - 判断是否命中（数据源的 AI 过滤）
+  - 返回全部命中的关键词（原来需要对每个关键词各扫描一遍）
+  - 评审员的 9 组评分关键词 + 空话/套路短语（原来每个关键词都重新 lower() 一次全文）
+并统计两者判定不一致的条数（主要是 "ai" 命中 "said" / "email" 这类子串误判；
+整词匹配会漏掉 "AutoGPT" 这类标识符里的关键词，github_trending 的匹配器按大小写 / 数字切分后再匹配一遍，
+原文未命中的文本要多扫描一遍，这一行明显慢于原来的循环；每次抓取只有几十个仓库，绝对开销可以忽略）
+
+    python3 benchmarks/keyword_matching.py
+    python3 benchmarks/keyword_matching.py --count 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.keyword_matcher import KeywordMatcher
+from src.sources.github_trending import GitHubTrendingSource
+from src.sources.hackernews import HackerNewsSource
+from src.sources.producthunt import ProductHuntSource
+from src.sources.twitter import TwitterSource
+from agents import reviewer
+
+EN_WORDS = ("the team said an email update will ship with a faster compiler for web apps and a new database "
+            "engine while maintainers explain how the release affects performance security and memory usage "
+            "in production systems developers detail benchmarks pricing plans and migration notes").split()
+ZH_WORDS = ['这是一个', '开源', '工具', '团队', '发布', '新版本', '性能', '提升', '用户', '反馈', '支持', '数据库',
+            '编译器', '使用', '场景', '相比', '更快', '问题', '安装', '配置', '评论区', '有人', '提到']
+AI_WORDS = ['OpenAI', 'LLM', 'AI', 'Claude', 'DeepSeek', 'machine learning', 'agent', 'Kimi', '国产大模型',
+            'transformer', 'RAG', 'gpt-4', '通义千问', 'Gemini', 'AutoGPT', 'vllm-project/vllm']
+
+def make_texts(count: int, seed: int) -> List[str]:
+    """约三成包含 AI 词，英文 / 中文各半，长度与标题 + 摘要相当（约 200 字符）"""
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            words = rng.choices(EN_WORDS, k=30)
+            sep = ' '
+        else:
+            words = rng.choices(ZH_WORDS, k=30)
+            sep = ''
+        if rng.random() < 0.3:
+            words.insert(rng.randrange(len(words)), rng.choice(AI_WORDS))
+        texts.append(sep.join(words))
+    return texts
+
+def timed(fn: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+def compare(label: str, keywords: List[str], texts: List[str], identifiers: bool = False):
+    matcher = KeywordMatcher(keywords, identifiers=identifiers)
+
+    def legacy_any_of(text: str) -> bool:
+        text = text.lower()
+        return any(kw in text for kw in keywords)
+
+    def legacy_all_of(text: str) -> List[str]:
+        text = text.lower()
+        return [kw for kw in keywords if kw in text]
+
+    legacy_hits = []
+    legacy_any = timed(lambda: legacy_hits.extend(legacy_any_of(t) for t in texts))
+    hits = []
+    compiled_any = timed(lambda: hits.extend(matcher.matches(t) for t in texts))
+
+    legacy_all = timed(lambda: [legacy_all_of(t) for t in texts])
+    compiled_all = timed(lambda: [matcher.findall(t) for t in texts])
+
+    # 只有原来命中：子串误判（如 "said" 中的 "ai"）；只有现在命中：原来漏掉的复数、大小写等
+    legacy_only = sum(1 for a, b in zip(legacy_hits, hits) if a and not b)
+    compiled_only = sum(1 for a, b in zip(legacy_hits, hits) if b and not a)
+    print(f"{label:<16} {len(keywords):3d} 词  命中判断 {legacy_any:6.3f}s → {compiled_any:6.3f}s "
+          f"({legacy_any / compiled_any:4.1f}x)  全部命中词 {legacy_all:6.3f}s → {compiled_all:6.3f}s "
+          f"({legacy_all / compiled_all:4.1f}x)  命中 {sum(legacy_hits)} → {sum(hits)} "
+          f"(去掉子串误判 {legacy_only}，新增 {compiled_only})")
+
+def compare_reviewer(texts: List[str]):
+    groups = [reviewer.WHAT_IS_KEYWORDS, reviewer.FEATURE_KEYWORDS, reviewer.TECH_KEYWORDS,
+              reviewer.USAGE_KEYWORDS, reviewer.SCENARIO_KEYWORDS, reviewer.COMPARISON_KEYWORDS,
+              reviewer.AUDIENCE_KEYWORDS, reviewer.FEEDBACK_KEYWORDS, reviewer.LIMITATION_KEYWORDS]
+    phrases = [reviewer.EMPTY_PHRASES, reviewer.TEMPLATE_PHRASES]
+
+    def legacy(text: str):
+        flags = [any(keyword in text.lower() for keyword in group) for group in groups]
+        return flags, [sum(1 for phrase in group if phrase in text) for group in phrases]
+
+    def compiled(text: str):
+        found = set(reviewer.REVIEW_MATCHER.findall(text))
+        flags = [bool(found.intersection(group)) for group in groups]
+        return flags, [sum(1 for phrase in group if phrase in found) for group in phrases]
+
+    expected, actual = [], []
+    legacy_time = timed(lambda: expected.extend(legacy(t) for t in texts))
+    compiled_time = timed(lambda: actual.extend(compiled(t) for t in texts))
+    diff = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"{'reviewer':<16} {len(reviewer.REVIEW_MATCHER):3d} 词  全部评分项 {legacy_time:6.3f}s → "
+          f"{compiled_time:6.3f}s ({legacy_time / compiled_time:4.1f}x)  结果不同 {diff} 条")
+
+def main():
+    parser = argparse.ArgumentParser(description='关键词匹配基准')
+    parser.add_argument('--count', type=int, default=20000, help='文本数量')
+    parser.add_argument('--seed', type=int, default=42, help='随机种子')
+    args = parser.parse_args()
+
+    texts = make_texts(args.count, args.seed)
+    print(f"📦 {len(texts)} 条文本（中英文各半，约三成含 AI 词）\n")
+    compare('hackernews', HackerNewsSource.AI_KEYWORDS, texts)
+    compare('github_trending', GitHubTrendingSource.AI_KEYWORDS, texts,
+            identifiers=GitHubTrendingSource.AI_MATCHER.identifiers)
+    compare('producthunt', ProductHuntSource.AI_KEYWORDS, texts)
+    # 原来的推特关键词混有大写，对 lower() 后的文本永远命中不了（KeywordMatcher 不区分大小写）
+    compare('twitter', TwitterSource.AI_KEYWORDS, texts)
+    # 各数据源关键词合并成一组
+    merged = list(dict.fromkeys(kw.lower() for kw in (
+        HackerNewsSource.AI_KEYWORDS + GitHubTrendingSource.AI_KEYWORDS
+        + ProductHuntSource.AI_KEYWORDS + TwitterSource.AI_KEYWORDS
+    )))
+    compare('合并', merged, texts)
+    compare_reviewer(texts)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+发布模块吞吐量基准测试
+对本地 webhook 模拟服务（benchmarks/webhook_sink.py）分别运行
+ForumPublisher、TextPublisher（逐条/合并 Embed）和 DiscordWebhookSender，
+统计吞吐量、429 重试次数和发布耗时分位数
+
+    python3 benchmarks/publisher_bench.py --posts 30 --limit 5 --window 2 --burst-rate 0.05
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from webhook_sink import WebhookSink
+
+def percentile(values: List[float], pct: float) -> float:
+    """最近秩分位数"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+def make_contents(count: int) -> List[Dict[str, Any]]:
+    """生成测试内容（长度交替，覆盖合并消息的字符上限）"""
+    return [
+        {
+            'name': f"Benchmark item {i}",
+            'content': ("AiTrend benchmark content. " * (10 if i % 2 else 40)).strip(),
+            'url': f"https://example.com/item/{i}",
+            'source': 'benchmark',
+        }
+        for i in range(count)
+    ]
+
+def run_case(name: str, sink: WebhookSink, run: Callable[[List[Dict[str, Any]], List[float]], int],
+             contents: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """运行一个用例并汇总结果"""
+    before = sink.stats()
+    latencies: List[float] = []
+    started = time.perf_counter()
+    success = run(contents, latencies)
+    elapsed = time.perf_counter() - started
+    after = sink.stats()
+
+    return {
+        'case': name,
+        'posts': len(contents),
+        'success': success,
+        'requests': after['requests'] - before['requests'],
+        'retries_429': after['rate_limited'] - before['rate_limited'],
+        'rejected_400': after['rejected'] - before['rejected'],
+        'seconds': round(elapsed, 3),
+        'posts_per_sec': round(success / elapsed, 2) if elapsed else 0.0,
+        'p50': round(percentile(latencies, 50), 3),
+        'p95': round(percentile(latencies, 95), 3),
+        'p99': round(percentile(latencies, 99), 3),
+    }
+
+def timed(fn: Callable[[Dict[str, Any]], bool]) -> Callable[[List[Dict[str, Any]], List[float]], int]:
+    """逐条发布并记录每条耗时"""
+    def run(contents: List[Dict[str, Any]], latencies: List[float]) -> int:
+        success = 0
+        for content in contents:
+            started = time.perf_counter()
+            success += bool(fn(content))
+            latencies.append(time.perf_counter() - started)
+        return success
+    return run
+
+def main():
+    parser = argparse.ArgumentParser(description='发布模块吞吐量基准测试')
+    parser.add_argument('--posts', type=int, default=30, help='每个用例发布的条数')
+    parser.add_argument('--limit', type=int, default=5, help='模拟桶：每个窗口允许的请求数')
+    parser.add_argument('--window', type=float, default=2.0, help='模拟桶：窗口秒数')
+    parser.add_argument('--burst-rate', type=float, default=0.05, help='随机 429 的概率')
+    parser.add_argument('--latency', type=float, default=0.01, help='模拟服务处理延迟（秒）')
+    parser.add_argument('--json', action='store_true', help='输出 JSON')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    from publishers import ForumPublisher, TextPublisher
+    from src.core.webhook_sender import DiscordWebhookSender
+
+    sink = WebhookSink(limit=args.limit, window=args.window, burst_rate=args.burst_rate,
+                       latency=args.latency, seed=42).start()
+    contents = make_contents(args.posts)
+
+    forum = ForumPublisher({'webhook_url': sink.webhook_url('forum')})
+    text = TextPublisher({'webhook_url': sink.webhook_url('text'), 'use_embed': True})
+    batched = TextPublisher({'webhook_url': sink.webhook_url('batched')})
+    sender = DiscordWebhookSender(sink.webhook_url('sender'))
+
+    def run_batched(items: List[Dict[str, Any]], latencies: List[float]) -> int:
+        started = time.perf_counter()
+        success = batched.publish_batch(items, batched=True)
+        latencies.append(time.perf_counter() - started)
+        return success
+
+    cases = [
+        ('ForumPublisher', timed(forum.publish)),
+        ('TextPublisher(embed)', timed(text.publish)),
+        ('TextPublisher(batched)', run_batched),
+        ('DiscordWebhookSender', timed(lambda c: sender.send_to_forum(c['name'], c['content']))),
+    ]
+
+    try:
+        results = [run_case(name, sink, run, contents) for name, run in cases]
+    finally:
+        sink.stop()
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"\n📊 发布基准: {args.posts} 条/用例, 桶 {args.limit}/{args.window}s, 随机429 {args.burst_rate:.0%}")
+    header = f"{'用例':<24}{'成功':>6}{'请求':>6}{'429':>6}{'耗时s':>9}{'条/秒':>8}{'p50':>8}{'p95':>8}{'p99':>8}"
+    print(header)
+    print('-' * len(header))
+    for r in results:
+        print(f"{r['case']:<24}{r['success']:>6}{r['requests']:>6}{r['retries_429']:>6}{r['seconds']:>9}"
+              f"{r['posts_per_sec']:>8}{r['p50']:>8}{r['p95']:>8}{r['p99']:>8}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+标题去重基准
+生成中英文混合的合成标题（若干“事件”，每个事件有 1~4 个改写版本：加来源标签、换标点、增删修饰语、调整语序），
+对比原来的 HotspotSelector 去重（包含检查 + 字符集合 Jaccard > 0.7，两两比较）
+与 MinHash LSH 去重（英文单词 + 中文字符二元组）的准确率和耗时
+
+    python3 benchmarks/title_dedup.py
+    python3 benchmarks/title_dedup.py --events 3000 --threshold 0.5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, List, Set, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.minhash import dedupe_titles, jaccard, title_shingles
+
+COMPANIES = ['OpenAI', 'Google', 'Anthropic', 'Meta', 'Mistral', 'DeepSeek', 'NVIDIA', 'Microsoft',
+             'Apple', 'Hugging Face', 'Stability AI', 'Cohere', 'xAI', 'Perplexity', 'Runway']
+PRODUCTS = ['GPT-5', 'Gemini 2', 'Claude', 'Llama 4', 'Codestral', 'R2', 'Blackwell', 'Copilot',
+            'Siri', 'Transformers', 'Stable Diffusion 4', 'Command R', 'Grok 3', 'Sonar', 'Gen-4']
+EN_VERBS = ['releases', 'launches', 'open-sources', 'announces', 'updates', 'benchmarks', 'delays', 'prices']
+EN_TOPICS = ['reasoning model', 'coding agent', 'video generator', 'inference chip', 'voice assistant',
+             'embedding API', 'robotics stack', 'search engine', 'safety report', 'context window']
+EN_EXTRAS = ['with 1M context', 'for enterprises', 'under Apache 2.0', 'beating GPT-4o', 'on-device',
+             'in 40 languages', 'at half the cost', 'for developers']
+
+ZH_COMPANIES = ['阿里', '腾讯', '字节跳动', '百度', '智谱', '月之暗面', '华为', '小米', '商汤', '科大讯飞']
+ZH_PRODUCTS = ['通义千问', '混元', '豆包', '文心一言', 'GLM-5', 'Kimi', '盘古', '小爱同学', '日日新', '星火']
+ZH_VERBS = ['发布', '开源', '推出', '升级', '公布', '上线']
+ZH_TOPICS = ['推理大模型', '编程智能体', '视频生成模型', '多模态模型', '语音助手', '端侧模型', '长文本能力',
+             '图像编辑工具', 'AI 搜索', '机器人平台']
+ZH_EXTRAS = ['性能超越 GPT-4o', '免费开放 API', '支持百万上下文', '价格下调九成', '面向企业用户', '首批开发者可用']
+
+# 同一产品的不同规格视为不同事件（如 "Llama 4 70B" 与 "Llama 4 8B"）
+SIZES = ['1.5B', '3B', '7B', '8B', '14B', '32B', '70B', '72B', '235B', '405B', 'mini', 'pro', 'turbo', 'lite']
+
+TAGS = ['[HN] ', '[Show HN] ', '[Reddit] ', '【快讯】', '[Product Hunt] ', '']
+
+def make_event(rng: random.Random, seen: Set[Tuple[str, ...]]) -> List[str]:
+    """一个事件的若干表述（第一条为原始标题）；主体、产品、动作、话题都相同的视为同一事件，重复时返回空列表"""
+    if rng.random() < 0.5:
+        company, product = rng.choice(COMPANIES), f"{rng.choice(PRODUCTS)} {rng.choice(SIZES)}"
+        verb, topic, extra = rng.choice(EN_VERBS), rng.choice(EN_TOPICS), rng.choice(EN_EXTRAS)
+        if (company, product, verb, topic) in seen:
+            return []
+        seen.add((company, product, verb, topic))
+        base = f"{company} {verb} {product}, a new {topic} {extra}"
+        variants = [
+            f"{company} {verb} {product} {topic} {extra}",
+            f"{company}'s {product}: {topic} {extra}",
+            f"{company} {verb} {product}, a new {topic}",
+            f"{company} {verb} {product} - {topic} {extra} (2026)",
+        ]
+    else:
+        company, product = rng.choice(ZH_COMPANIES), f"{rng.choice(ZH_PRODUCTS)} {rng.choice(SIZES)}"
+        verb, topic, extra = rng.choice(ZH_VERBS), rng.choice(ZH_TOPICS), rng.choice(ZH_EXTRAS)
+        if (company, product, verb, topic) in seen:
+            return []
+        seen.add((company, product, verb, topic))
+        base = f"{company}{verb}{product}{topic}，{extra}"
+        variants = [
+            f"{company}正式{verb}{product}{topic}：{extra}",
+            f"{company}{verb}{product}{topic}",
+            f"重磅！{company}{verb}{product}{topic}，{extra}",
+            f"{company} {verb} {product} {topic}, {extra}",
+        ]
+    count = rng.randint(0, 3)
+    return [base] + [rng.choice(TAGS) + v for v in rng.sample(variants, count)]
+
+def make_dataset(events: int, seed: int) -> List[Tuple[str, int]]:
+    """(标题, 事件编号) 列表，打乱顺序"""
+    rng = random.Random(seed)
+    rows, seen = [], set()
+    event = 0
+    while event < events:
+        titles = make_event(rng, seen)
+        if titles:
+            rows.extend((title, event) for title in titles)
+            event += 1
+    rng.shuffle(rows)
+    return rows
+
+def legacy_dedupe(titles: List[str]) -> List[int]:
+    """原来的 HotspotSelector._deduplicate / _is_similar"""
+    def is_similar(title1: str, title2: str, threshold: float = 0.7) -> bool:
+        if title1 in title2 or title2 in title1:
+            return True
+        set1 = set(title1)
+        set2 = set(title2)
+        if not set1 or not set2:
+            return False
+        intersection = len(set1 & set2)
+        union = len(set1 | set2)
+        similarity = intersection / union if union > 0 else 0
+        return similarity > threshold
+
+    kept, seen = [], []
+    for i, title in enumerate(titles):
+        title = title.lower()
+        if any(is_similar(title, other) for other in seen):
+            continue
+        kept.append(i)
+        seen.append(title)
+    return kept
+
+def exact_dedupe(titles: List[str], threshold: float) -> List[int]:
+    """同样的 shingle 和阈值，两两计算精确 Jaccard（衡量 LSH 近似带来的误差）"""
+    kept, seen = [], []
+    for i, title in enumerate(titles):
+        shingles = title_shingles(title)
+        if shingles and any(jaccard(shingles, other) >= threshold for other in seen):
+            continue
+        kept.append(i)
+        seen.append(shingles)
+    return kept
+
+def evaluate(label: str, dedupe: Callable[[List[str]], List[int]], rows: List[Tuple[str, int]]):
+    titles = [title for title, _ in rows]
+    started = time.perf_counter()
+    kept = dedupe(titles)
+    elapsed = time.perf_counter() - started
+
+    events = len({event for _, event in rows})
+    kept_events = [rows[i][1] for i in kept]
+    covered = len(set(kept_events))
+    # 误删：整个事件一条都没留下；漏删：同一事件保留了多条
+    lost = events - covered
+    extra = len(kept_events) - covered
+    print(f"{label:<22} 保留 {len(kept):6d}  误删事件 {lost:5d} ({lost / events:6.1%})  "
+          f"残留重复 {extra:5d} ({extra / events:6.1%})  耗时 {elapsed:7.3f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description='标题去重基准')
+    parser.add_argument('--events', type=int, default=2000, help='事件数量（标题数约为 2.5 倍）')
+    parser.add_argument('--threshold', type=float, default=0.6, help='MinHash Jaccard 阈值')
+    parser.add_argument('--seed', type=int, default=42, help='随机种子')
+    args = parser.parse_args()
+
+    rows = make_dataset(args.events, args.seed)
+    print(f"📦 {len(rows)} 条标题，{args.events} 个事件（中英文各约一半）\n")
+    evaluate('包含 + 字符集合', legacy_dedupe, rows)
+    evaluate(f'精确 Jaccard ({args.threshold})', lambda titles: exact_dedupe(titles, args.threshold), rows)
+    evaluate(f'MinHash LSH ({args.threshold})',
+             lambda titles: dedupe_titles(titles, threshold=args.threshold), rows)
+
+if __name__ == '__main__':
+    main()
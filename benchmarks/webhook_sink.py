@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+本地 Discord Webhook 模拟服务
+模拟 Discord 的响应码、X-RateLimit-* 响应头、429 突发和消息校验，
+记录收到的全部消息，用于在不发到真实频道的情况下压测发布模块
+
+    python3 benchmarks/webhook_sink.py --port 8765 --limit 5 --window 2 --burst-rate 0.05
+    # webhook 地址: http://127.0.0.1:8765/api/webhooks/1/token
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+class _Bucket:
+    """固定窗口速率桶（与 Discord 的 webhook 桶行为一致）"""
+
+    def __init__(self, limit: int, window: float):
+        self.limit = limit
+        self.window = window
+        self.remaining = limit
+        self.reset_at = time.monotonic() + window
+
+    def take(self) -> Optional[float]:
+        """占用一次额度，额度不足时返回需要等待的秒数"""
+        now = time.monotonic()
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.window
+        if self.remaining <= 0:
+            return self.reset_at - now
+        self.remaining -= 1
+        return None
+
+    def reset_after(self) -> float:
+        return max(0.0, self.reset_at - time.monotonic())
+
+def validate_payload(payload: Dict[str, Any]) -> Optional[str]:
+    """按 Discord 的限制校验消息，不合法时返回错误信息"""
+    content = payload.get('content') or ''
+    embeds = payload.get('embeds') or []
+    if not content and not embeds:
+        return 'Cannot send an empty message'
+    if len(content) > 2000:
+        return 'content: Must be 2000 or fewer in length.'
+    if len(payload.get('thread_name') or '') > 100:
+        return 'thread_name: Must be 100 or fewer in length.'
+    if len(embeds) > 10:
+        return 'embeds: Must be 10 or fewer in length.'
+    total = 0
+    for embed in embeds:
+        if len(embed.get('title') or '') > 256:
+            return 'embeds.title: Must be 256 or fewer in length.'
+        if len(embed.get('description') or '') > 4096:
+            return 'embeds.description: Must be 4096 or fewer in length.'
+        total += len(embed.get('title') or '') + len(embed.get('description') or '')
+        total += len((embed.get('footer') or {}).get('text') or '')
+    if total > 6000:
+        return 'Embed size exceeds maximum size of 6000'
+    return None
+
+class WebhookSink:
+    """本地 webhook 模拟服务（可在后台线程运行）"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, limit: int = 5, window: float = 2.0,
+                 burst_rate: float = 0.0, latency: float = 0.0, seed: Optional[int] = None):
+        """
+        Args:
+            host: 监听地址
+            port: 监听端口（0 表示随机端口）
+            limit: 每个 webhook 每个窗口允许的请求数
+            window: 速率窗口（秒）
+            burst_rate: 额度充足时仍随机返回 429 的概率
+            latency: 每个请求的模拟处理延迟（秒）
+            seed: 随机种子
+        """
+        self.limit = limit
+        self.window = window
+        self.burst_rate = burst_rate
+        self.latency = latency
+        self.random = random.Random(seed)
+        self.received: List[Dict[str, Any]] = []
+        self.counters = {'requests': 0, 'accepted': 0, 'rate_limited': 0, 'bursts': 0, 'rejected': 0}
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def webhook_url(self, webhook_id: str = '1', token: str = 'token') -> str:
+        """模拟 webhook 地址（不同 webhook_id 使用独立的速率桶）"""
+        return f"{self.base_url}/api/webhooks/{webhook_id}/{token}"
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.counters, received=len(self.received))
+
+    def _handle(self, path: str, body: bytes):
+        """处理一次请求，返回 (状态码, 响应头, 响应体)"""
+        if self.latency:
+            time.sleep(self.latency)
+
+        webhook_path = path.split('?', 1)[0]
+        with self._lock:
+            self.counters['requests'] += 1
+            bucket = self._buckets.setdefault(webhook_path, _Bucket(self.limit, self.window))
+            wait = bucket.take()
+            burst = wait is None and self.burst_rate > 0 and self.random.random() < self.burst_rate
+            if burst:
+                wait = self.random.uniform(0.05, 0.5)
+                self.counters['bursts'] += 1
+            headers = {
+                'X-RateLimit-Limit': str(self.limit),
+                'X-RateLimit-Remaining': str(max(bucket.remaining, 0)),
+                'X-RateLimit-Reset-After': f"{bucket.reset_after():.3f}",
+                'X-RateLimit-Bucket': f"sink-{abs(hash(webhook_path)) % 10 ** 8:08d}",
+            }
+
+            if wait is not None:
+                self.counters['rate_limited'] += 1
+                headers['Retry-After'] = str(max(1, int(wait + 0.999)))
+                headers['X-RateLimit-Scope'] = 'user'
+                return 429, headers, {'message': 'You are being rate limited.', 'retry_after': round(wait, 3), 'global': False}
+
+        try:
+            payload = json.loads(body.decode('utf-8') or '{}')
+        except ValueError:
+            payload = None
+        error = validate_payload(payload) if isinstance(payload, dict) else 'Invalid JSON'
+
+        with self._lock:
+            if error:
+                self.counters['rejected'] += 1
+                return 400, headers, {'message': error, 'code': 50035}
+            self.counters['accepted'] += 1
+            self.received.append({'path': webhook_path, 'received_at': time.time(), 'payload': payload})
+            message_id = str(len(self.received))
+
+        if 'wait=true' in path:
+            return 200, headers, {'id': message_id, 'content': payload.get('content', '')}
+        return 204, headers, None
+
+    def _make_handler(self):
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                status, headers, body = sink._handle(self.path, self.rfile.read(length))
+                data = json.dumps(body).encode('utf-8') if body is not None else b''
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                if data:
+                    self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                data = json.dumps(sink.stats()).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "WebhookSink":
+        """在后台线程启动"""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+def main():
+    parser = argparse.ArgumentParser(description='本地 Discord Webhook 模拟服务')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--limit', type=int, default=5, help='每个窗口允许的请求数')
+    parser.add_argument('--window', type=float, default=2.0, help='速率窗口（秒）')
+    parser.add_argument('--burst-rate', type=float, default=0.0, help='随机 429 的概率')
+    parser.add_argument('--latency', type=float, default=0.0, help='模拟处理延迟（秒）')
+    parser.add_argument('--record', help='退出时把收到的消息写入该 JSON 文件')
+    args = parser.parse_args()
+
+    sink = WebhookSink(args.host, args.port, args.limit, args.window, args.burst_rate, args.latency)
+    print(f"🪝 Webhook 模拟服务已启动: {sink.webhook_url()}  (GET {sink.base_url}/ 查看统计)")
+    try:
+        sink.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sink.server.server_close()
+        print(json.dumps(sink.stats(), ensure_ascii=False))
+        if args.record:
+            with open(args.record, 'w', encoding='utf-8') as f:
+                json.dump(sink.received, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -48,6 +48,8 @@ def create_publisher(publisher_type: str, config: Dict[str, Any]) -> Optional[Ba
         print(f"❌ 创建发布模块失败: {e}")
         return None
 
+from .dispatcher import PublishDispatcher
+
 def list_publishers() -> list:
     """列出所有可用的发布模块"""
     return list(PUBLISHER_MAP.keys())
@@ -56,6 +58,7 @@ __all__ = [
     'BasePublisher',
     'ForumPublisher',
     'TextPublisher',
+    'PublishDispatcher',
     'create_publisher',
     'list_publishers',
 ]
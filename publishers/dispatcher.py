@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+多渠道并行发布调度器
+为每个启用的渠道构建一次发布模块（复用连接池），
+每条内容并发分发到所有渠道，同一渠道内按提交顺序串行发布
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+import logging
+from publishers.base import BasePublisher
+
+logger = logging.getLogger(__name__)
+
+class PublishDispatcher:
+    """
+    多渠道发布调度器
+
+    功能：
+    - 每个渠道一个单线程队列，保证渠道内的发布顺序
+    - 不同渠道之间并发发布
+    - 统计每个渠道的耗时和成功率
+    """
+
+    def __init__(self, publishers: Dict[str, BasePublisher]):
+        """
+        Args:
+            publishers: 渠道名 -> 发布模块实例
+        """
+        self.publishers = dict(publishers)
+        self._lanes = {
+            name: ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"publish-{name}")
+            for name in self.publishers
+        }
+        self._stats = {name: self._empty_stats() for name in self.publishers}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {'sent': 0, 'failed': 0, 'total_latency': 0.0, 'max_latency': 0.0}
+
+    @classmethod
+    def from_config(cls, channels_config: Dict[str, Any]) -> "PublishDispatcher":
+        """
+        根据渠道配置构建调度器
+
+        渠道名即发布模块类型（如 discord_forum），也可用 publisher 字段指定；
+        没有对应发布模块的渠道会被跳过
+        """
+        from publishers import PUBLISHER_MAP, create_publisher
+
+        publishers = {}
+        for name, channel_config in channels_config.items():
+            if not isinstance(channel_config, dict) or not channel_config.get('enabled', False):
+                continue
+
+            publisher_type = channel_config.get('publisher', name)
+            if publisher_type.lower() not in PUBLISHER_MAP:
+                logger.warning(f"⚠️ 渠道 {name} 暂无发布模块，跳过")
+                continue
+
+            publisher = create_publisher(publisher_type, channel_config)
+            if publisher:
+                publishers[name] = publisher
+
+        return cls(publishers)
+
+    @property
+    def channels(self) -> List[str]:
+        """可用渠道列表"""
+        return list(self.publishers.keys())
+
+    def _publish(self, channel: str, content: Dict[str, Any]) -> Dict[str, Any]:
+        """在渠道队列中执行一次发布并记录耗时"""
+        started = time.monotonic()
+        error = ''
+        try:
+            success = bool(self.publishers[channel].publish(content))
+        except Exception as e:
+            success, error = False, str(e)
+        latency = time.monotonic() - started
+
+        with self._lock:
+            stats = self._stats[channel]
+            stats['sent' if success else 'failed'] += 1
+            stats['total_latency'] += latency
+            stats['max_latency'] = max(stats['max_latency'], latency)
+
+        return {'channel': channel, 'success': success, 'latency': latency, 'error': error}
+
+    def submit(self, channel: str, content: Dict[str, Any]) -> Future:
+        """
+        提交一条内容到指定渠道的队列
+
+        Returns:
+            Future，结果为 {channel, success, latency, error}
+        """
+        if channel not in self._lanes:
+            raise KeyError(f"未启用的渠道: {channel}")
+        return self._lanes[channel].submit(self._publish, channel, content)
+
+    def dispatch(self, content: Dict[str, Any], channels: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """并发发布一条内容到所有（或指定）渠道，等待全部完成"""
+        futures = {name: self.submit(name, content) for name in (channels or self.channels)}
+        return {name: future.result() for name, future in futures.items()}
+
+    def dispatch_many(self, contents: List[Dict[str, Any]]) -> List[Dict[str, Dict[str, Any]]]:
+        """按顺序分发多条内容：渠道之间并发，渠道内部保持顺序"""
+        futures = [
+            {name: self.submit(name, content) for name in self.channels}
+            for content in contents
+        ]
+        return [{name: future.result() for name, future in item.items()} for item in futures]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """每个渠道的发布统计"""
+        with self._lock:
+            report = {}
+            for name, stats in self._stats.items():
+                total = stats['sent'] + stats['failed']
+                report[name] = {
+                    'sent': stats['sent'],
+                    'failed': stats['failed'],
+                    'avg_latency': round(stats['total_latency'] / total, 3) if total else 0.0,
+                    'max_latency': round(stats['max_latency'], 3),
+                }
+            return report
+
+    def reset_stats(self):
+        """清空统计（常驻进程每轮运行前调用）"""
+        with self._lock:
+            self._stats = {name: self._empty_stats() for name in self.publishers}
+
+    def close(self):
+        """等待队列清空并释放线程"""
+        for lane in self._lanes.values():
+            lane.shutdown(wait=True)
@@ -10,6 +10,7 @@ import requests
 from typing import Dict, Any, List
 import logging
 from publishers.base import BasePublisher
+from src.core.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ class ForumPublisher(BasePublisher):
     功能：
     - 发布到论坛频道，创建新帖子
     - 支持自定义帖子标题模板
-    - 自动处理速率限制
+    - 按 Discord 速率限制响应头调度发送（见 src/core/rate_limiter.py）
     - 日志记录完整状态
     """
     
@@ -28,7 +29,8 @@ class ForumPublisher(BasePublisher):
         super().__init__(config)
         self.webhook_url = config.get('webhook_url') or os.getenv('DISCORD_WEBHOOK_URL')
         self.thread_name_template = config.get('thread_name', '{name} – {source}')
-        self.delay_between_posts = config.get('delay', 2)
+        self.delay_between_posts = config.get('delay', 0)  # 额外固定间隔，默认由速率限制调度器决定
+        self.max_retries = config.get('max_retries', 3)
         self.username = config.get('username', 'AiTrend')
         self.max_content_length = config.get('max_length', 1900)
         
@@ -36,7 +38,7 @@ class ForumPublisher(BasePublisher):
         
         logger.info(f"ForumPublisher 初始化完成")
         logger.info(f"  - 帖子标题模板: {self.thread_name_template}")
-        logger.info(f"  - 发布间隔: {self.delay_between_posts}秒")
+        logger.info(f"  - 额外发布间隔: {self.delay_between_posts}秒")
     
     def validate_config(self) -> bool:
         """验证配置"""
@@ -63,16 +65,18 @@ class ForumPublisher(BasePublisher):
         url = content.get('url', '')
         source = content.get('source', 'AiTrend')
         
-        # 构建帖子标题（安全格式化）
-        try:
-            thread_name = self.thread_name_template.format(
-                name=name,
-                source=source,
-                date=time.strftime('%m-%d')
-            )
-        except (KeyError, ValueError):
-            # 如果模板格式不匹配，使用默认格式
-            thread_name = f"{name} – {source}"
+        # 构建帖子标题（安全格式化），调用方也可直接指定 thread_name
+        thread_name = content.get('thread_name', '')
+        if not thread_name:
+            try:
+                thread_name = self.thread_name_template.format(
+                    name=name,
+                    source=source,
+                    date=time.strftime('%m-%d')
+                )
+            except (KeyError, ValueError):
+                # 如果模板格式不匹配，使用默认格式
+                thread_name = f"{name} – {source}"
         
         # 确保内容包含链接
         if url and url not in text:
@@ -111,25 +115,23 @@ class ForumPublisher(BasePublisher):
         }
         
         try:
-            response = self.session.post(
+            limiter = get_rate_limiter(self.webhook_url, max_retries=self.max_retries)
+            response = limiter.send(lambda: self.session.post(
                 self.webhook_url,
                 json=payload,
                 timeout=15
-            )
+            ))
             response.raise_for_status()
             
-            logger.success(f"论坛帖子创建成功: {thread_name[:50]}")
+            logger.info(f"✅ 论坛帖子创建成功: {thread_name[:50]}")
             return True
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 429:
-                retry_after = int(e.response.headers.get('Retry-After', 5))
-                logger.warning(f"⏳ 速率限制，等待 {retry_after} 秒后重试...")
-                time.sleep(retry_after)
-                return self.publish(content)  # 重试
+                logger.error(f"❌ 速率限制重试次数已用尽: {thread_name[:50]}")
             else:
                 logger.error(f"❌ HTTP 错误: {e.response.status_code} - {e.response.text}")
-                return False
+            return False
                 
         except Exception as e:
             logger.error(f"❌ 发布失败: {e}")
@@ -142,7 +144,7 @@ class ForumPublisher(BasePublisher):
             logger.error("❌ 配置验证失败，无法批量发布")
             return 0
         
-        logger.section(f"📤 批量发布 {len(contents)} 条内容到 Discord 论坛")
+        logger.info(f"📤 批量发布 {len(contents)} 条内容到 Discord 论坛")
         
         success_count = 0
         for i, content in enumerate(contents, 1):
@@ -152,9 +154,9 @@ class ForumPublisher(BasePublisher):
             if self.publish(content):
                 success_count += 1
             
-            # 间隔，避免速率限制
-            if i < len(contents):
+            # 速率限制由调度器处理，仅在显式配置时额外等待
+            if i < len(contents) and self.delay_between_posts > 0:
                 time.sleep(self.delay_between_posts)
         
-        logger.section(f"✅ 批量发布完成: {success_count}/{len(contents)} 条成功")
+        logger.info(f"✅ 批量发布完成: {success_count}/{len(contents)} 条成功")
         return success_count
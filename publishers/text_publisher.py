@@ -7,9 +7,10 @@ Discord 文字频道发布模块
 import os
 import time
 import requests
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
 from publishers.base import BasePublisher
+from src.core.rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -20,23 +21,33 @@ class TextPublisher(BasePublisher):
     功能：
     - 发布到文字频道
     - 支持纯文本或 Embed 格式
+    - 批量发布时可将多条内容打包为 Embed 合并发送（batch_embeds）
     - 与论坛发布模块保持格式一致
     """
     
+    # Discord 单条消息的 Embed 限制
+    MAX_EMBEDS_PER_MESSAGE = 10
+    MAX_EMBED_CHARS_PER_MESSAGE = 6000
+    MAX_EMBED_TITLE = 256
+    MAX_EMBED_DESCRIPTION = 4096
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.webhook_url = config.get('webhook_url') or os.getenv('DISCORD_WEBHOOK_URL')
         self.use_embed = config.get('use_embed', False)
-        self.delay_between_posts = config.get('delay', 1)
+        self.delay_between_posts = config.get('delay', 0)  # 额外固定间隔，默认由速率限制调度器决定
+        self.max_retries = config.get('max_retries', 3)
         self.username = config.get('username', 'AiTrend')
         self.avatar_url = config.get('avatar_url', '')
         self.max_content_length = 2000  # Discord 文字限制
+        self.batch_embeds = config.get('batch_embeds', False)
         
         self.session = requests.Session()
         
         logger.info(f"TextPublisher 初始化完成")
         logger.info(f"  - 使用Embed格式: {self.use_embed}")
-        logger.info(f"  - 发布间隔: {self.delay_between_posts}秒")
+        logger.info(f"  - 批量合并Embed: {self.batch_embeds}")
+        logger.info(f"  - 额外发布间隔: {self.delay_between_posts}秒")
     
     def validate_config(self) -> bool:
         """验证配置"""
@@ -110,8 +121,8 @@ class TextPublisher(BasePublisher):
         
         return self._send_request(payload, name)
     
-    def _publish_with_embed(self, formatted: Dict[str, Any]) -> bool:
-        """Embed 格式发布"""
+    def _build_embed(self, formatted: Dict[str, Any]) -> Dict[str, Any]:
+        """构建单条内容的 Embed"""
         
         name = formatted['name']
         text = formatted['text']
@@ -121,62 +132,139 @@ class TextPublisher(BasePublisher):
         # 截断描述
         description = text[:2000] if len(text) > 2000 else text
         
-        embed = {
-            'title': name,
-            'description': description,
+        return {
+            'title': name[:self.MAX_EMBED_TITLE],
+            'description': description[:self.MAX_EMBED_DESCRIPTION],
             'url': url,
             'footer': {
                 'text': f"来源: {source} • AiTrend"
             },
             'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
         }
-        
+    
+    @staticmethod
+    def _embed_chars(embed: Dict[str, Any]) -> int:
+        """Embed 计入 Discord 总字符限制的字符数"""
+        return (
+            len(embed.get('title', ''))
+            + len(embed.get('description', ''))
+            + len(embed.get('footer', {}).get('text', ''))
+            + len(embed.get('author', {}).get('name', ''))
+            + sum(len(f.get('name', '')) + len(f.get('value', '')) for f in embed.get('fields', []))
+        )
+    
+    def _build_payload(self, embeds: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """构建携带 Embed 的消息"""
         payload = {
             'username': self.username,
-            'embeds': [embed]
+            'embeds': embeds
         }
         
         if self.avatar_url:
             payload['avatar_url'] = self.avatar_url
         
-        return self._send_request(payload, name)
+        return payload
+    
+    def _publish_with_embed(self, formatted: Dict[str, Any]) -> bool:
+        """Embed 格式发布"""
+        payload = self._build_payload([self._build_embed(formatted)])
+        return self._send_request(payload, formatted['name'])
     
     def _send_request(self, payload: Dict, name: str) -> bool:
         """发送请求"""
+        status = self._post(payload, name)
+        return status is not None and 200 <= status < 300
+    
+    def _post(self, payload: Dict, name: str) -> Optional[int]:
+        """发送请求，返回 HTTP 状态码（网络异常返回 None）"""
         try:
-            response = self.session.post(
+            limiter = get_rate_limiter(self.webhook_url, max_retries=self.max_retries)
+            response = limiter.send(lambda: self.session.post(
                 self.webhook_url,
                 json=payload,
                 timeout=15
-            )
+            ))
             response.raise_for_status()
             
-            logger.success(f"文字频道消息发送成功: {name[:50]}")
-            return True
+            logger.info(f"✅ 文字频道消息发送成功: {name[:50]}")
+            return response.status_code
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 429:
-                retry_after = int(e.response.headers.get('Retry-After', 5))
-                logger.warning(f"⏳ 速率限制，等待 {retry_after} 秒后重试...")
-                time.sleep(retry_after)
-                return self._send_request(payload, name)
+                logger.error(f"❌ 速率限制重试次数已用尽: {name[:50]}")
             else:
                 logger.error(f"❌ HTTP 错误: {e.response.status_code}")
-                return False
+            return e.response.status_code
                 
         except Exception as e:
             logger.error(f"❌ 发送失败: {e}")
-            return False
+            return None
+    
+    def _pack_embeds(self, embeds: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """按 Discord 的 Embed 数量和总字符限制，把 Embed 依次装入尽量少的消息"""
+        groups = []
+        current, current_chars = [], 0
+        
+        for embed in embeds:
+            chars = self._embed_chars(embed)
+            if current and (len(current) >= self.MAX_EMBEDS_PER_MESSAGE
+                            or current_chars + chars > self.MAX_EMBED_CHARS_PER_MESSAGE):
+                groups.append(current)
+                current, current_chars = [], 0
+            current.append(embed)
+            current_chars += chars
+        
+        if current:
+            groups.append(current)
+        return groups
     
-    def publish_batch(self, contents: List[Dict[str, Any]]) -> int:
-        """批量发布到文字频道"""
+    def _send_embed_group(self, embeds: List[Dict[str, Any]]) -> int:
+        """
+        发送一组 Embed，返回成功发布的条数
+        
+        合并消息被 Discord 拒绝（4xx，非429）时对半拆分后重发
+        """
+        label = f"{len(embeds)} 条合并消息: {embeds[0].get('title', '')}"
+        status = self._post(self._build_payload(embeds), label)
+        
+        if status is not None and 200 <= status < 300:
+            return len(embeds)
+        
+        if len(embeds) > 1 and status is not None and 400 <= status < 500 and status != 429:
+            logger.warning(f"⚠️ 合并消息被拒绝(HTTP {status})，拆分为两条重发")
+            middle = len(embeds) // 2
+            return self._send_embed_group(embeds[:middle]) + self._send_embed_group(embeds[middle:])
+        
+        return 0
+    
+    def publish_batch(self, contents: List[Dict[str, Any]], batched: Optional[bool] = None) -> int:
+        """
+        批量发布到文字频道
+        
+        Args:
+            contents: 内容列表
+            batched: 是否把多条内容打包为 Embed 合并发送，默认读取 batch_embeds 配置
+        """
         
         if not self.validate_config():
             logger.error("❌ 配置验证失败，无法批量发布")
             return 0
         
+        if batched is None:
+            batched = self.batch_embeds
+        
+        if batched:
+            embeds = [self._build_embed(self.format_content(content)) for content in contents]
+            groups = self._pack_embeds(embeds)
+            logger.info(f"📤 批量发布 {len(contents)} 条内容到 Discord 文字频道 (合并为 {len(groups)} 条 Embed 消息)")
+            
+            success_count = sum(self._send_embed_group(group) for group in groups)
+            
+            logger.info(f"✅ 批量发布完成: {success_count}/{len(contents)} 条成功")
+            return success_count
+        
         format_type = "Embed" if self.use_embed else "纯文本"
-        logger.section(f"📤 批量发布 {len(contents)} 条内容到 Discord 文字频道 ({format_type})")
+        logger.info(f"📤 批量发布 {len(contents)} 条内容到 Discord 文字频道 ({format_type})")
         
         success_count = 0
         for i, content in enumerate(contents, 1):
@@ -186,8 +274,9 @@ class TextPublisher(BasePublisher):
             if self.publish(content):
                 success_count += 1
             
-            if i < len(contents):
+            # 速率限制由调度器处理，仅在显式配置时额外等待
+            if i < len(contents) and self.delay_between_posts > 0:
                 time.sleep(self.delay_between_posts)
         
-        logger.section(f"✅ 批量发布完成: {success_count}/{len(contents)} 条成功")
+        logger.info(f"✅ 批量发布完成: {success_count}/{len(contents)} 条成功")
         return success_count
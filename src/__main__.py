@@ -14,6 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.sources import create_sources
 from src.sources.base import Article
 from src.core.deduplicator import ArticleDeduplicator
+from src.core.fetch_cache import cached_fetch
 from src.core.config_loader import load_config, get_enabled_channels
 from typing import List, Dict, Any
 
@@ -26,7 +27,7 @@ def collect_data(config: Dict[str, Any]) -> List[Article]:
     for source in sources:
         if source.is_enabled():
             try:
-                articles = source.fetch()
+                articles = cached_fetch(source)
                 all_articles.extend(articles)
             except Exception as e:
                 print(f"数据源 {source.name} 错误: {e}", file=sys.stderr)
@@ -42,7 +43,7 @@ def format_output(articles: List[Article]) -> Dict[str, Any]:
             "url": article.url,
             "summary": article.summary,
             "source": article.source,
-            "metadata": article.metadata
+            "metadata": dict(article.metadata)
         })
     
     return {
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+AiTrend 后台采集器
+按各数据源自己的间隔轮询，把文章写入候选池（memory/candidate_pool.sqlite3），同时写入趋势索引和采集归档；
+src.hourly 在 collector.enabled 时直接从候选池取候选，发布不再等待最慢的数据源
+
+    python3 -m src.collector          # 常驻轮询
+    python3 -m src.collector --once   # 采集一次所有到期的数据源后退出
+
+配置:
+    sources.<name>.poll_interval_minutes: 该数据源的采集间隔（默认见 DEFAULT_POLL_MINUTES）
+    collector.enabled: 发布时是否使用候选池
+    collector.candidate_ttl_hours: 候选最后一次被采集到后的保留时间，默认 24
+    collector.workers: 并发采集的数据源数量，默认 4
+"""
+
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sources import create_sources
+from src.sources.base import DataSource
+from src.core.config_loader import load_config
+from src.core.candidate_pool import CandidatePool
+from src.core.circuit_breaker import get_breaker_registry
+from src.core.fetch_cache import cached_fetch
+from src.core.enricher import PageEnricher
+from src.core.scoring import get_hot_score_engine
+from src.core.trend_index import observe_articles
+from src.core.archive import archive_articles, new_run_id
+
+# 默认采集间隔（分钟）：热度变化快的来源更频繁
+DEFAULT_POLL_MINUTES = {
+    'hackernews': 5,
+    'reddit': 10,
+    'twitter': 15,
+    'producthunt': 30,
+    'moltbook': 30,
+    'tavily': 60,
+    'github_trending': 60,
+}
+
+def get_pool(config: Dict[str, Any]) -> CandidatePool:
+    """按 collector 配置创建候选池"""
+    return CandidatePool(ttl_hours=config.get('collector', {}).get('candidate_ttl_hours', 24))
+
+class SourceCollector:
+    """按数据源间隔轮询并写入候选池"""
+
+    def __init__(self, config: Dict[str, Any], pool: Optional[CandidatePool] = None):
+        self.config = config
+        self.pool = pool or get_pool(config)
+        collector_config = config.get('collector', {})
+        self.sources: List[DataSource] = [s for s in create_sources(config.get('sources', {})) if s.is_enabled()]
+        self.intervals = {
+            source.name: 60 * float(
+                config.get('sources', {}).get(source.name, {}).get('poll_interval_minutes')
+                or DEFAULT_POLL_MINUTES.get(source.name, 60)
+            )
+            for source in self.sources
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, min(collector_config.get('workers', 4), len(self.sources) or 1)),
+            thread_name_prefix='collector'
+        )
+        # 后台补充页面信息，发布时不再等待
+        self.enricher = PageEnricher.from_config(config)
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        # 进程重启后按候选池里记录的上次采集时间续上间隔
+        self._last_polled = self.pool.last_polled()
+
+    def due_sources(self, now: float = None) -> List[DataSource]:
+        """到期且未在采集中的数据源"""
+        now = now or time.time()
+        with self._lock:
+            return [
+                source for source in self.sources
+                if source.name not in self._in_flight
+                and now - self._last_polled.get(source.name, 0) >= self.intervals[source.name]
+            ]
+
+    def _poll(self, source: DataSource) -> int:
+        """采集一个数据源并写入候选池"""
+        started = time.monotonic()
+        count, error = 0, None
+        breakers = get_breaker_registry()
+        breaker = breakers.get(f"source:{source.name}")
+        try:
+            if not breaker.allow():
+                raise RuntimeError(f"熔断中（{breaker.last_error}）")
+            # 采集器总是抓取最新结果，同时刷新共享缓存供其他入口复用
+            articles = cached_fetch(source, partial(breaker.execute, source.fetch), refresh=True) or []
+            for article in articles:
+                if article.source != source.name:
+                    article.metadata['collector_source'] = source.name
+            observe_articles(articles)
+            archive_articles(articles, new_run_id(f'collector-{source.name}'))
+            engine = get_hot_score_engine()
+            if self.enricher:
+                self.enricher.enrich(engine.rank(articles))
+            # 候选池不存分数，发布时对整个候选集统一打分
+            count = self.pool.upsert(articles)
+            print(f"✓ {source.name}: {count} 条 → 候选池", file=sys.stderr)
+        except Exception as e:
+            error = str(e)
+            print(f"✗ {source.name}: {e}", file=sys.stderr)
+        finally:
+            # 失败也按间隔等待，避免持续重试故障数据源
+            breakers.save()
+            self.pool.record_poll(source.name, count, time.monotonic() - started, error)
+            with self._lock:
+                self._last_polled[source.name] = time.time()
+                self._in_flight.discard(source.name)
+        return count
+
+    def poll_due(self, wait: bool = False) -> List[str]:
+        """
+        提交所有到期数据源的采集（各数据源并发，互不阻塞）
+
+        Args:
+            wait: 是否等待本次提交的采集完成
+        Returns:
+            本次提交的数据源名称
+        """
+        due = self.due_sources()
+        with self._lock:
+            self._in_flight.update(source.name for source in due)
+        futures = [self._executor.submit(self._poll, source) for source in due]
+        if wait:
+            for future in futures:
+                future.result()
+        return [source.name for source in due]
+
+    def next_due_in(self) -> float:
+        """距离下一个数据源到期的秒数"""
+        now = time.time()
+        with self._lock:
+            waits = [
+                self._last_polled.get(source.name, 0) + self.intervals[source.name] - now
+                for source in self.sources if source.name not in self._in_flight
+            ]
+        return max(0.0, min(waits)) if waits else 60.0
+
+    def run(self, stop_event: threading.Event, max_sleep: float = 30):
+        """轮询直到 stop_event 被设置"""
+        while not stop_event.is_set():
+            self.poll_due()
+            expired = self.pool.expire()
+            if expired:
+                print(f"🧹 候选池清理过期候选 {expired} 条", file=sys.stderr)
+            stop_event.wait(min(max_sleep, max(1.0, self.next_due_in())))
+
+    def start(self, stop_event: threading.Event) -> threading.Thread:
+        """在后台线程中轮询（供常驻模式使用）"""
+        thread = threading.Thread(target=self.run, args=(stop_event,), name='collector', daemon=True)
+        thread.start()
+        return thread
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+def main():
+    try:
+        config = load_config()
+    except FileNotFoundError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    collector = SourceCollector(config)
+    intervals = ', '.join(f"{name} {seconds / 60:g}分钟" for name, seconds in collector.intervals.items())
+    print(f"📡 AiTrend 采集器: {intervals}", file=sys.stderr)
+
+    if '--once' in sys.argv:
+        collector.poll_due(wait=True)
+        collector.pool.expire()
+    else:
+        stop_event = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+        signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+        collector.run(stop_event)
+    collector.close()
+
+    print(json.dumps(collector.pool.stats(), ensure_ascii=False))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+"""
+采集归档
+原来只有发布出去的文章会留下记录（memory/sent_articles.json），其余采集结果都被丢弃。
+这里把每次采集到的全部文章连同 运行 ID、归档时间 追加写入按日期分区的压缩 NDJSON 分段，供视频流程和数据分析回读
+
+目录结构（日期按本地时间）:
+    memory/archive/2026-02-06/part-0000.ndjson.gz
+    memory/archive/2026-02-06/part-0001.ndjson.gz    # 上一段超过 segment_mb 后新开一段
+
+每行一条记录: {"run_id": "...", "ts": 归档时间戳, "article": Article.to_dict()}
+每次追加是一个独立的 gzip 成员（多个成员首尾相接仍是合法的 gzip 文件），写入时持有分区目录的文件锁，
+采集器和 hourly 同时写入不会交错；写入失败时截回写入前的长度，读取时遇到损坏的成员跳过该分段的剩余部分
+
+    run_id = new_run_id('hourly')
+    archive_articles(articles, run_id)                       # 采集后追加
+    for record in get_article_archive().read('2026-02-05', '2026-02-06', sources=['hackernews']):
+        ...
+
+配置 advanced.archive:
+    enabled: 是否启用，默认 true
+    segment_mb: 单个分段的大小上限（MB），默认 16
+    retention_days: 分区保留天数，0 表示永久保留，默认 90
+"""
+import fcntl
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+import zlib
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from src.sources.base import Article
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'memory', 'archive')
+
+DateLike = Union[str, date, datetime]
+
+def new_run_id(prefix: str = 'run') -> str:
+    """运行 ID：前缀-时间-随机后缀（同一秒内多次运行也不会重复）"""
+    return f"{prefix}-{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+def _to_date(value: DateLike) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+class ArticleArchive:
+    """按日期分区的追加式文章归档"""
+
+    def __init__(self, root: str = None, segment_mb: float = 16, retention_days: int = 90):
+        """
+        Args:
+            root: 归档根目录，默认 memory/archive
+            segment_mb: 单个分段的大小上限（MB），超过后新开一段
+            retention_days: 分区保留天数，0 表示永久保留
+        """
+        self.root = root or DEFAULT_ARCHIVE_DIR
+        self.segment_bytes = int(segment_mb * 1024 * 1024)
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._pruned_on: Optional[date] = None
+
+    def _partition(self, day: date) -> str:
+        return os.path.join(self.root, day.isoformat())
+
+    @staticmethod
+    def _segments(partition: str) -> List[str]:
+        try:
+            names = os.listdir(partition)
+        except FileNotFoundError:
+            return []
+        return sorted(os.path.join(partition, name) for name in names if name.endswith('.ndjson.gz'))
+
+    def append(self, articles: Iterable[Article], run_id: str, now: Optional[float] = None) -> int:
+        """追加一批文章（同一批写在同一个分区），返回写入条数"""
+        now = time.time() if now is None else now
+        lines = [
+            json.dumps({'run_id': run_id, 'ts': now, 'article': article.to_dict()}, ensure_ascii=False)
+            for article in articles
+        ]
+        if not lines:
+            return 0
+        payload = gzip.compress(('\n'.join(lines) + '\n').encode('utf-8'), compresslevel=6, mtime=0)
+
+        day = datetime.fromtimestamp(now).date()
+        partition = self._partition(day)
+        with self._lock:
+            os.makedirs(partition, exist_ok=True)
+            with open(os.path.join(partition, '.lock'), 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                segments = self._segments(partition)
+                segment = segments[-1] if segments else None
+                if segment is None or os.path.getsize(segment) >= self.segment_bytes:
+                    segment = os.path.join(partition, f"part-{len(segments):04d}.ndjson.gz")
+                with open(segment, 'ab') as f:
+                    size = f.tell()
+                    try:
+                        f.write(payload)
+                        f.flush()
+                    except OSError:
+                        # 写入失败（如磁盘已满）时截回原长度，不在分段中留下半个成员
+                        f.truncate(size)
+                        raise
+            if self._pruned_on != day:
+                self._pruned_on = day
+                self.prune(day)
+        return len(lines)
+
+    def partitions(self, start: DateLike, end: Optional[DateLike] = None) -> List[date]:
+        """日期范围内（含两端）存在的分区"""
+        start_day = _to_date(start)
+        end_day = _to_date(end) if end is not None else start_day
+        days = []
+        try:
+            names = os.listdir(self.root)
+        except FileNotFoundError:
+            return days
+        for name in names:
+            try:
+                day = date.fromisoformat(name)
+            except ValueError:
+                continue
+            if start_day <= day <= end_day:
+                days.append(day)
+        return sorted(days)
+
+    def read(self, start: DateLike, end: Optional[DateLike] = None,
+             sources: Optional[Sequence[str]] = None, run_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        按归档顺序流式读取日期范围内的记录
+
+        Args:
+            start / end: 日期（含两端，end 默认等于 start）；传入 datetime 时按归档时间精确过滤
+            sources: 只返回这些数据源的文章
+            run_id: 只返回某次运行的记录
+        """
+        since = start.timestamp() if isinstance(start, datetime) else None
+        until = end.timestamp() if isinstance(end, datetime) else None
+        wanted = set(sources) if sources else None
+        # 按子串预筛，大部分不需要的行不必解析 JSON
+        markers = [json.dumps(name, ensure_ascii=False) for name in wanted] if wanted else None
+        run_marker = json.dumps(run_id, ensure_ascii=False) if run_id else None
+
+        for day in self.partitions(start, end):
+            for segment in self._segments(self._partition(day)):
+                for line in self._lines(segment):
+                    if markers and not any(marker in line for marker in markers):
+                        continue
+                    if run_marker and run_marker not in line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if since is not None and record['ts'] < since:
+                        continue
+                    if until is not None and record['ts'] > until:
+                        continue
+                    if wanted and record['article'].get('source') not in wanted:
+                        continue
+                    if run_id and record['run_id'] != run_id:
+                        continue
+                    yield record
+
+    @staticmethod
+    def _lines(segment: str) -> Iterator[str]:
+        """逐行读取一个分段，遇到不完整的尾部成员时停止"""
+        try:
+            with gzip.open(segment, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if line.endswith('\n'):
+                        yield line
+        except (EOFError, OSError, zlib.error) as e:
+            logger.warning(f"归档分段读取中断 {segment}: {e}")
+
+    def articles(self, start: DateLike, end: Optional[DateLike] = None,
+                 sources: Optional[Sequence[str]] = None) -> Iterator[Article]:
+        """按归档顺序读取日期范围内的文章"""
+        for record in self.read(start, end, sources):
+            yield Article.from_dict(record['article'])
+
+    def prune(self, today: Optional[date] = None) -> int:
+        """删除超过保留天数的分区，返回删除的分区数"""
+        if not self.retention_days:
+            return 0
+        cutoff = (today or date.today()) - timedelta(days=self.retention_days)
+        removed = 0
+        for day in self.partitions(date.min, cutoff - timedelta(days=1)):
+            shutil.rmtree(self._partition(day), ignore_errors=True)
+            removed += 1
+        return removed
+
+# 单例
+_archive = None
+_archive_lock = threading.Lock()
+
+def get_article_archive() -> Optional[ArticleArchive]:
+    """获取归档单例（配置读取 config.json -> advanced.archive，禁用时返回 None）"""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            settings = {}
+            try:
+                from .config_loader import load_config
+                settings = load_config().get('advanced', {}).get('archive', {})
+            except Exception:
+                pass
+            if not settings.get('enabled', True):
+                return None
+            _archive = ArticleArchive(
+                segment_mb=settings.get('segment_mb', 16),
+                retention_days=settings.get('retention_days', 90),
+            )
+        return _archive
+
+def archive_articles(articles: Iterable[Article], run_id: str) -> int:
+    """把一次采集的文章追加到归档（禁用或写入失败时返回 0，不影响采集流程）"""
+    try:
+        archive = get_article_archive()
+        return archive.append(articles, run_id) if archive else 0
+    except OSError as e:
+        logger.warning(f"写入归档失败: {e}")
+        return 0
@@ -0,0 +1,158 @@
+"""
+候选池（Candidate Pool）
+后台采集器按各数据源自己的间隔把文章写入 SQLite 候选池（按规范化 URL 去重、带过期时间），
+发布时直接从池中按分数取候选，不再同步等待所有数据源
+
+池中只保存文章本身（互动信号在 metadata 中），不保存分数：打分引擎的互动项是批内百分位，
+各次采集分别算出的分数无法互相比较，且时间衰减会随读取时间变化，所以在 top() 时对整个候选集重新打分
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.sources.base import Article
+from src.core.deduplicator import ArticleDeduplicator
+from src.core.scoring import HotScoreEngine, get_hot_score_engine
+
+DEFAULT_POOL_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'memory', 'candidate_pool.sqlite3')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    normalized_url TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    article TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_expires ON candidates (expires_at);
+CREATE TABLE IF NOT EXISTS source_polls (
+    source TEXT PRIMARY KEY,
+    last_polled REAL NOT NULL,
+    last_count INTEGER NOT NULL DEFAULT 0,
+    last_duration REAL NOT NULL DEFAULT 0,
+    last_error TEXT
+);
+"""
+
+class CandidatePool:
+    """基于 SQLite 的持久化候选池（采集进程和发布进程可同时访问）"""
+
+    def __init__(self, path: str = None, ttl_hours: float = 24):
+        """
+        Args:
+            path: SQLite 文件路径，默认 memory/candidate_pool.sqlite3
+            ttl_hours: 候选最后一次被采集到之后的保留时间
+        """
+        self.path = path or DEFAULT_POOL_PATH
+        self.ttl_seconds = ttl_hours * 3600
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            columns = {row['name'] for row in conn.execute("PRAGMA table_info(candidates)")}
+            if 'score' in columns:
+                # 旧版本存了按采集批次计算的分数；候选最多保留 ttl_hours，直接重建，下一轮采集会重新写入
+                conn.execute("DROP TABLE IF EXISTS candidates")
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """打开连接，正常退出时提交，异常时回滚，最后关闭"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def upsert(self, articles: Iterable[Article]) -> int:
+        """
+        写入/刷新候选（已存在的 URL 更新内容和过期时间，保留首次发现时间）
+
+        Returns:
+            写入的条数
+        """
+        now = time.time()
+        rows = []
+        for article in articles:
+            if not article.url:
+                continue
+            rows.append((
+                ArticleDeduplicator.normalize_url(article.url),
+                article.source,
+                json.dumps(article.to_dict(), ensure_ascii=False),
+                now, now, now + self.ttl_seconds,
+            ))
+
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                """INSERT INTO candidates (normalized_url, source, article, first_seen, last_seen, expires_at)
+                   VALUES (?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(normalized_url) DO UPDATE SET
+                       source = excluded.source, article = excluded.article,
+                       last_seen = excluded.last_seen, expires_at = excluded.expires_at""",
+                rows
+            )
+        return len(rows)
+
+    def top(self, limit: int = 200, engine: Optional[HotScoreEngine] = None) -> List[Article]:
+        """
+        按分数取未过期的候选（读取时对全部候选一起打分，各来源的百分位和时间衰减都按当前的候选集计算）
+
+        Args:
+            limit: 最多返回的条数
+            engine: 打分引擎，默认使用全局单例
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT article FROM candidates WHERE expires_at > ? ORDER BY first_seen",
+                (time.time(),)
+            ).fetchall()
+        articles = [Article.from_dict(json.loads(row['article'])) for row in rows]
+        return (engine or get_hot_score_engine()).rank(articles)[:limit]
+
+    def remove(self, urls: Iterable[str]) -> int:
+        """移除已进入发布流程的候选"""
+        keys = [(ArticleDeduplicator.normalize_url(url),) for url in urls if url]
+        with self._lock, self._connect() as conn:
+            cursor = conn.executemany("DELETE FROM candidates WHERE normalized_url = ?", keys)
+            return cursor.rowcount
+
+    def expire(self) -> int:
+        """清理过期候选"""
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute("DELETE FROM candidates WHERE expires_at <= ?", (time.time(),))
+            return cursor.rowcount
+
+    def record_poll(self, source: str, count: int, duration: float, error: Optional[str] = None):
+        """记录一次数据源采集"""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO source_polls (source, last_polled, last_count, last_duration, last_error)
+                   VALUES (?, ?, ?, ?, ?)""",
+                (source, time.time(), count, round(duration, 3), error[:500] if error else None)
+            )
+
+    def last_polled(self) -> Dict[str, float]:
+        """各数据源最近一次采集时间（进程重启后据此续上采集间隔）"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT source, last_polled FROM source_polls").fetchall()
+        return {row['source']: row['last_polled'] for row in rows}
+
+    def stats(self) -> Dict[str, Any]:
+        """候选数量（按来源）和各数据源采集状态"""
+        with self._connect() as conn:
+            counts = conn.execute(
+                "SELECT source, COUNT(*) AS n FROM candidates WHERE expires_at > ? GROUP BY source",
+                (time.time(),)
+            ).fetchall()
+            polls = conn.execute("SELECT * FROM source_polls").fetchall()
+        return {
+            'candidates': {row['source']: row['n'] for row in counts},
+            'polls': {row['source']: dict(row) for row in polls},
+        }
@@ -0,0 +1,228 @@
+"""
+熔断器
+按数据源和上游主机统计最近的失败率，失败率过高时熔断（open），冷却期内直接跳过；
+冷却结束后进入半开（half_open），放行一次探测请求，成功则恢复，失败则以更长的冷却期重新熔断。
+状态持久化到 memory/circuit_state.json，跨运行保持
+
+    breaker = get_host_breaker('https://api.pullpush.io/reddit/search')   # 按主机名共用，名为 host:api.pullpush.io
+    data = breaker.call(fetch_fn)      # 熔断时抛出 CircuitOpenError
+
+主机熔断器除失败率外，连续失败 host_consecutive_failures 次（默认 2）也会熔断：同一次采集里对同一主机的
+多个请求（如逐个 subreddit）在连续两次失败后即跳过剩余请求；中间有一次成功就重新计数
+"""
+import json
+import logging
+import os
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'memory', 'circuit_state.json')
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+class CircuitOpenError(RuntimeError):
+    """熔断中，请求被跳过"""
+
+class CircuitBreaker:
+    """单个数据源/主机的熔断器"""
+
+    def __init__(self, name: str, registry: "CircuitBreakerRegistry", state: Dict[str, Any] = None):
+        self.name = name
+        self.registry = registry
+        state = state or {}
+        self.state: str = state.get('state', STATE_CLOSED)
+        self.recent: List[int] = list(state.get('recent', []))     # 最近的结果，1 表示失败
+        self.opened_at: float = state.get('opened_at', 0.0)
+        self.open_for: float = state.get('open_for', 0.0)
+        self.trips: int = state.get('trips', 0)
+        self.last_error: Optional[str] = state.get('last_error')
+        self._probing = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'recent': self.recent,
+            'opened_at': self.opened_at,
+            'open_for': self.open_for,
+            'trips': self.trips,
+            'last_error': self.last_error,
+        }
+
+    def failure_rate(self) -> float:
+        return sum(self.recent) / len(self.recent) if self.recent else 0.0
+
+    def _transition(self, state: str, reason: str):
+        if state == self.state:
+            return
+        logger.warning(f"🔌 熔断器 {self.name}: {self.state} -> {state}（{reason}）")
+        self.state = state
+        self.registry.mark_dirty()
+
+    def _open(self, reason: str):
+        settings = self.registry.settings
+        self.open_for = min(settings['open_seconds'] * (2 ** self.trips), settings['max_open_seconds'])
+        self.opened_at = time.time()
+        self.trips += 1
+        self._probing = False
+        self._transition(STATE_OPEN, f"{reason}，冷却 {self.open_for:.0f}s")
+
+    def allow(self) -> bool:
+        """是否放行请求（open 冷却结束后放行一次半开探测）"""
+        with self.registry.lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_OPEN:
+                if time.time() < self.opened_at + self.open_for:
+                    return False
+                self._transition(STATE_HALF_OPEN, "冷却结束，放行探测请求")
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self.registry.lock:
+            self._probing = False
+            if self.state != STATE_CLOSED:
+                self.recent = []
+                self.trips = 0
+                self._transition(STATE_CLOSED, "探测成功，恢复")
+            self._record(0)
+
+    def record_failure(self, error: Any = None):
+        with self.registry.lock:
+            self.last_error = str(error)[:200] if error is not None else None
+            if self.state == STATE_HALF_OPEN:
+                self._open(f"探测失败: {self.last_error}")
+                return
+            self._record(1)
+            if self.state != STATE_CLOSED:
+                return
+            settings = self.registry.settings
+            consecutive = self.consecutive_failures()
+            if self.name.startswith('host:') and consecutive >= settings['host_consecutive_failures']:
+                self._open(f"连续 {consecutive} 次失败")
+            elif len(self.recent) >= settings['min_calls'] and self.failure_rate() >= settings['failure_rate']:
+                self._open(f"最近 {len(self.recent)} 次失败率 {self.failure_rate():.0%}")
+
+    def consecutive_failures(self) -> int:
+        """最近连续失败的次数"""
+        count = 0
+        for failed in reversed(self.recent):
+            if not failed:
+                break
+            count += 1
+        return count
+
+    def _record(self, failed: int):
+        self.recent.append(failed)
+        del self.recent[:-self.registry.settings['window']]
+        self.registry.mark_dirty()
+
+    def call(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """通过熔断器调用，熔断中抛出 CircuitOpenError，异常计为失败"""
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} 熔断中（{self.last_error or '失败率过高'}）")
+        return self.execute(fn, *args, **kwargs)
+
+    def execute(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """执行已经 allow() 放行的调用并记录结果"""
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            self.record_failure(e)
+            raise
+        self.record_success()
+        return result
+
+class CircuitBreakerRegistry:
+    """熔断器集合，负责状态持久化（线程安全）"""
+
+    DEFAULT_SETTINGS = {
+        'window': 10,             # 统计最近多少次调用
+        'min_calls': 4,           # 至少多少次调用才判断失败率
+        'host_consecutive_failures': 2,  # 主机熔断器连续失败多少次即熔断
+        'failure_rate': 0.5,      # 失败率阈值
+        'open_seconds': 300,      # 首次熔断冷却时间
+        'max_open_seconds': 3600, # 连续熔断时冷却时间翻倍的上限
+    }
+
+    def __init__(self, path: str = None, settings: Dict[str, Any] = None):
+        self.path = path or DEFAULT_STATE_PATH
+        self.settings = dict(self.DEFAULT_SETTINGS, **(settings or {}))
+        self.lock = threading.RLock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._dirty = False
+        self._stored = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('breakers', {})
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        with self.lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name, self, self._stored.get(name))
+            return self._breakers[name]
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """所有熔断器的当前状态"""
+        with self.lock:
+            breakers = dict(self._stored)
+            breakers.update({name: breaker.to_dict() for name, breaker in self._breakers.items()})
+            return breakers
+
+    def save(self):
+        """有变化时原子写入状态文件"""
+        with self.lock:
+            if not self._dirty:
+                return
+            breakers = self.snapshot()
+            self._dirty = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'updated_at': time.time(), 'breakers': breakers}, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"保存熔断器状态失败: {e}")
+
+# 单例
+_registry = None
+_registry_lock = threading.Lock()
+
+def get_breaker_registry() -> CircuitBreakerRegistry:
+    """获取熔断器注册表单例（参数读取 config.json -> advanced.circuit_breaker）"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            settings = {}
+            try:
+                from .config_loader import load_config
+                settings = load_config().get('advanced', {}).get('circuit_breaker', {})
+            except Exception:
+                pass
+            _registry = CircuitBreakerRegistry(settings=settings)
+        return _registry
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """按名称获取熔断器（约定 source:<数据源> / host:<主机名>）"""
+    return get_breaker_registry().get(name)
+
+def get_host_breaker(url: str) -> CircuitBreaker:
+    """按 URL（或不带协议的主机名）的主机名获取熔断器 host:<主机名>"""
+    netloc = urllib.parse.urlparse(url).netloc or urllib.parse.urlparse(f"//{url}").netloc
+    return get_breaker(f"host:{netloc}")
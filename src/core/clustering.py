@@ -0,0 +1,202 @@
+"""
+跨来源同一事件聚类
+同一条新闻常常同时从 Tavily、HN、Reddit 进入候选（URL 和标题都不同），去重按 URL 拦不住，会被重复发布。
+这里把 标题 + 摘要 转成稀疏 TF-IDF 向量（英文单词 + 中文字符二元组，标题词加权），
+余弦相似度不低于阈值的候选连成一簇，每簇只把一条代表交给选稿，代表带上整簇合并后的互动信号
+
+  - 由模板拼出的摘要（metadata['summary_synthetic']，如 HN 链接帖）不参与向量化，只用标题：
+    模板里的固定短语在同一来源的文章间大量重复，会把不相关的帖子拉到阈值以上
+  - 一簇内每个来源最多一条：聚类用于合并不同来源的同一事件，同一来源的两条不会被合并
+    （被合并的成员 URL 会计入去重记录，误合并会让不同的帖子永久被跳过）
+
+近邻搜索按词分块：只有共享至少一个“稀有词”（文档频率不超过 block_df）的两篇才成为候选对，
+候选对的相似度 = 稀有词部分（倒排表展开后累加）+ 常见词部分（常见词很少，按稠密小矩阵计算），结果是精确余弦；
+只共享常见词的两篇不会被比较（这类文章的相似度本来就低）
+
+配置 advanced.clustering:
+    enabled: 是否启用，默认 true
+    threshold: 余弦相似度阈值，默认 0.35
+    title_weight: 标题词的权重（摘要词为 1），默认 2
+    max_df: 参与分块的词最多出现在多大比例的文章中，默认 0.05
+    min_block_df: 文章较少时分块的文档频率下限，默认 8
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.sources.base import Article, NUMERIC_FIELDS
+from .minhash import title_shingles
+
+class StoryClusterer:
+    """TF-IDF 余弦聚类"""
+
+    def __init__(self, threshold: float = 0.35, title_weight: float = 2.0, max_df: float = 0.05,
+                 min_block_df: int = 8):
+        self.threshold = threshold
+        self.title_weight = title_weight
+        self.max_df = max_df
+        self.min_block_df = min_block_df
+        self._triu_cache: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["StoryClusterer"]:
+        """读取 advanced.clustering，禁用时返回 None"""
+        settings = config.get('advanced', {}).get('clustering', {})
+        if not settings.get('enabled', True):
+            return None
+        return cls(
+            threshold=settings.get('threshold', 0.35),
+            title_weight=settings.get('title_weight', 2.0),
+            max_df=settings.get('max_df', 0.05),
+            min_block_df=settings.get('min_block_df', 8),
+        )
+
+    def vectorize(self, articles: Sequence[Article]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        稀疏 TF-IDF（COO 格式，按行排序，每行 L2 归一化）
+
+        Returns:
+            (rows, cols, data)
+        """
+        vocabulary: Dict[str, int] = {}
+        rows, cols, tf = [], [], []
+        for i, article in enumerate(articles):
+            title_terms = title_shingles(article.title)
+            summary_terms = set() if article.get_meta('summary_synthetic') else title_shingles(article.summary)
+            for term in title_terms | summary_terms:
+                rows.append(i)
+                cols.append(vocabulary.setdefault(term, len(vocabulary)))
+                tf.append(self.title_weight * (term in title_terms) + (term in summary_terms))
+
+        rows = np.array(rows, dtype=np.int64)
+        cols = np.array(cols, dtype=np.int64)
+        if rows.size == 0:
+            return rows, cols, np.zeros(0, dtype=np.float64)
+
+        n = len(articles)
+        df = np.bincount(cols, minlength=len(vocabulary))
+        idf = np.log((1 + n) / (1 + df)) + 1
+        data = np.log1p(np.array(tf, dtype=np.float64)) * idf[cols]
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=n))
+        data /= norms[rows]
+        return rows, cols, data
+
+    def _triu(self, m: int) -> Tuple[np.ndarray, np.ndarray]:
+        pairs = self._triu_cache.get(m)
+        if pairs is None:
+            pairs = self._triu_cache[m] = np.triu_indices(m, 1)
+        return pairs
+
+    def similar_pairs(self, articles: Sequence[Article]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        余弦相似度不低于阈值的文章对
+
+        Returns:
+            (i, j, cosine)，i < j
+        """
+        n = len(articles)
+        empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float64))
+        rows, cols, data = self.vectorize(articles)
+        if rows.size == 0:
+            return empty
+
+        # 按 (词, 行) 排序得到倒排表
+        order = np.lexsort((rows, cols))
+        rows, cols, data = rows[order], cols[order], data[order]
+        starts = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1]])
+        counts = np.diff(np.r_[starts, cols.size])
+        block_df = max(self.min_block_df, int(self.max_df * n))
+
+        # 稀有词：倒排表内两两展开
+        left, right, products = [], [], []
+        for start, count in zip(starts.tolist(), counts.tolist()):
+            if count < 2 or count > block_df:
+                continue
+            iu, ju = self._triu(count)
+            members = rows[start:start + count]
+            weights = data[start:start + count]
+            left.append(members[iu])
+            right.append(members[ju])
+            products.append(weights[iu] * weights[ju])
+        if not left:
+            return empty
+
+        keys, inverse = np.unique(np.concatenate(left) * n + np.concatenate(right), return_inverse=True)
+        cosine = np.bincount(inverse.ravel(), weights=np.concatenate(products))
+        pair_i, pair_j = keys // n, keys % n
+
+        # 常见词：稠密的 n × 常见词数 小矩阵，只对候选对计算
+        common = np.flatnonzero(counts > block_df)
+        if common.size:
+            dense = np.zeros((n, common.size), dtype=np.float64)
+            for k, term in enumerate(common.tolist()):
+                start, count = starts[term], counts[term]
+                dense[rows[start:start + count], k] = data[start:start + count]
+            cosine += np.einsum('ij,ij->i', dense[pair_i], dense[pair_j])
+
+        keep = cosine >= self.threshold
+        return pair_i[keep], pair_j[keep], cosine[keep]
+
+    def clusters(self, articles: Sequence[Article], order: Optional[Sequence[int]] = None) -> List[List[int]]:
+        """
+        按 order 的顺序（默认输入顺序）依次归簇：与已有簇首的相似度不低于阈值、且该簇还没有同一来源的文章时
+        并入最相似的簇，否则自成一簇。
+        每个成员都直接与簇首相似，不会像连通分量那样 A~B~C 链式串起不相关的文章
+
+        Returns:
+            下标列表（簇按首个成员在输入中的位置排列，簇内保持输入顺序，簇首不一定在最前）
+        """
+        neighbours: Dict[int, List[Tuple[int, float]]] = {}
+        pair_i, pair_j, cosine = self.similar_pairs(articles)
+        for i, j, value in zip(pair_i.tolist(), pair_j.tolist(), cosine.tolist()):
+            neighbours.setdefault(i, []).append((j, value))
+            neighbours.setdefault(j, []).append((i, value))
+
+        members: Dict[int, List[int]] = {}
+        sources: Dict[int, set] = {}
+        for i in (range(len(articles)) if order is None else order):
+            source = articles[i].source
+            leaders = [(value, j) for j, value in neighbours.get(i, ())
+                       if j in members and source not in sources[j]]
+            if leaders:
+                leader = max(leaders)[1]
+                members[leader].append(i)
+                sources[leader].add(source)
+            else:
+                members[i] = [i]
+                sources[i] = {source}
+        return sorted((sorted(group) for group in members.values()), key=lambda group: group[0])
+
+    def merge(self, articles: Sequence[Article], score_fn: Callable[[Article], float]) -> List[Article]:
+        """
+        按分数从高到低归簇（簇首即分数最高的一条，同分取靠前的），每簇返回簇首作为代表，
+        按簇在输入中首次出现的顺序返回
+
+        代表是副本：互动信号改为整簇各信号之和，metadata 记录 cluster_size / cluster_sources / cluster_urls，
+        发布后其他成员的 URL 也会计入去重记录
+        """
+        scores = [score_fn(article) for article in articles]
+        order = sorted(range(len(articles)), key=lambda i: -scores[i])
+        rank = {index: position for position, index in enumerate(order)}
+        merged = []
+        for group in self.clusters(articles, order):
+            if len(group) == 1:
+                merged.append(articles[group[0]])
+                continue
+            leader = min(group, key=rank.__getitem__)
+            merged.append(merge_cluster(articles[leader], [articles[i] for i in group]))
+        return merged
+
+def merge_cluster(representative: Article, members: Sequence[Article]) -> Article:
+    """代表文章的副本，互动信号为整簇之和"""
+    merged = Article.from_dict(representative.to_dict())
+    for field in NUMERIC_FIELDS:
+        values = [getattr(member, field) for member in members if getattr(member, field) is not None]
+        if values:
+            setattr(merged, field, sum(values))
+    others = [member for member in members if member is not representative]
+    metadata = merged.metadata
+    metadata['cluster_size'] = len(members)
+    metadata['cluster_sources'] = sorted({member.source for member in members})
+    metadata['cluster_urls'] = [member.url for member in others if member.url]
+    return merged
@@ -4,22 +4,38 @@
 """
 import json
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Tuple
 
 DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'config.json')
 
+# 解析结果缓存：绝对路径 -> ((mtime, 大小), 解析后的 JSON)
+_parsed_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_cache_lock = threading.Lock()
+
 def load_config(config_path: str = None) -> Dict[str, Any]:
-    """加载配置文件"""
-    config_path = config_path or DEFAULT_CONFIG_PATH
+    """加载配置文件
+    
+    同一文件未变化（mtime/大小）时复用上次解析的结果；
+    环境变量占位符每次重新解析，返回的字典可以放心修改
+    """
+    config_path = os.path.abspath(config_path or DEFAULT_CONFIG_PATH)
     
-    if not os.path.exists(config_path):
+    try:
+        stat = os.stat(config_path)
+    except OSError:
         raise FileNotFoundError(f"配置文件不存在: {config_path}")
+    signature = (stat.st_mtime_ns, stat.st_size)
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    with _cache_lock:
+        cached = _parsed_cache.get(config_path)
+        if cached is None or cached[0] != signature:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                cached = (signature, json.load(f))
+            _parsed_cache[config_path] = cached
     
-    # 解析环境变量占位符
-    config = _resolve_env_vars(config)
+    # 解析环境变量占位符（生成新的字典，不会修改缓存）
+    config = _resolve_env_vars(cached[1])
     
     return config
 
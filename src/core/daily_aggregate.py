@@ -0,0 +1,198 @@
+"""
+当天数据的增量聚合
+视频流程的 HotspotSelector 读取 daily_raw_{date}.json（sources[].items[]，每条带 heat_score），
+原来没有任何环节生成它。这里在每轮 src.hourly 采集后把本轮文章并入当天的聚合文件：
+  - 按规范化 URL 去重，已有的条目更新为最新采集到的内容和互动信号
+  - heat_score 保留当天的最高热度（0~100，见 HotScoreEngine.heat），热度回落的条目不会被后来的低分覆盖
+  - 记录 first_seen / last_seen / seen_count
+
+视频任务直接读取现成的文件，不需要在生成视频时重新扫描当天的全部采集结果；
+聚合文件缺失时（如新部署）可以用 rebuild() 从采集归档补建
+
+    update_daily_aggregate(articles)                     # 每轮采集后（热度由打分引擎计算）
+    aggregate = get_daily_aggregate()
+    aggregate.path('2026-02-06')                         # -> .../daily_raw_2026-02-06.json
+
+配置 advanced.daily_aggregate:
+    enabled: 是否启用，默认 true
+    output_dir: 输出目录（相对路径相对项目根目录），默认 video/data/input
+"""
+import fcntl
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.sources.base import Article
+from .archive import ArticleArchive
+from .deduplicator import ArticleDeduplicator
+from .scoring import HotScoreEngine, get_hot_score_engine
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+DEFAULT_OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'video', 'data', 'input')
+
+class DailyAggregate:
+    """daily_raw_{date}.json 的增量维护"""
+
+    def __init__(self, output_dir: str = None):
+        """
+        Args:
+            output_dir: 输出目录，默认 video/data/input
+        """
+        self.output_dir = output_dir or DEFAULT_OUTPUT_DIR
+        self._lock = threading.Lock()
+
+    def path(self, date: str) -> str:
+        """某天（YYYY-MM-DD）的聚合文件路径"""
+        return os.path.join(self.output_dir, f'daily_raw_{date}.json')
+
+    def load(self, date: str) -> Dict[str, Any]:
+        """读取某天的聚合数据，不存在或无法解析时返回空结构"""
+        try:
+            with open(self.path(date), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data.get('sources'), list):
+                return data
+        except (OSError, ValueError):
+            pass
+        return {'date': date, 'sources': []}
+
+    def update(self, articles: Sequence[Article], heat: Sequence[float],
+               now: Optional[float] = None) -> Tuple[int, int]:
+        """
+        把一批文章并入当天的聚合文件
+
+        Args:
+            articles: 本轮采集到的文章
+            heat: 与 articles 一一对应的 0~100 热度
+        Returns:
+            (新增条数, 更新条数)
+        """
+        now = time.time() if now is None else now
+        date = datetime.fromtimestamp(now).strftime('%Y-%m-%d')
+        with self._locked():
+            data = self.load(date)
+            added, updated = self._merge(data, articles, heat, datetime.fromtimestamp(now).isoformat())
+            if added or updated:
+                self._save(date, data)
+        return added, updated
+
+    def rebuild(self, date: str, archive: ArticleArchive, engine: HotScoreEngine) -> int:
+        """
+        从采集归档重建某天的聚合文件（每轮归档按一次采集并入，热度在当轮内计算）
+
+        Returns:
+            聚合后的条数
+        """
+        runs: Dict[str, Tuple[float, List[Article]]] = {}
+        for record in archive.read(date):
+            run = runs.setdefault(record['run_id'], (record['ts'], []))
+            run[1].append(Article.from_dict(record['article']))
+
+        # 时间衰减按当天结束时计算，当天的采集不会因为重建得晚而被压低
+        day_end = (datetime.strptime(date, '%Y-%m-%d') + timedelta(days=1)).timestamp()
+        now = min(time.time(), day_end)
+        data = {'date': date, 'sources': []}
+        for ts, articles in sorted(runs.values(), key=lambda run: run[0]):
+            self._merge(data, articles, engine.heat(articles, now=now).tolist(),
+                        datetime.fromtimestamp(ts).isoformat())
+        with self._locked():
+            self._save(date, data)
+        return sum(len(source['items']) for source in data['sources'])
+
+    @staticmethod
+    def _merge(data: Dict[str, Any], articles: Sequence[Article], heat: Sequence[float],
+               seen_at: str) -> Tuple[int, int]:
+        groups = {source['source']: source['items'] for source in data['sources']}
+        index = {}
+        for items in groups.values():
+            for item in items:
+                index[ArticleDeduplicator.normalize_url(item.get('url', ''))] = item
+
+        added = updated = 0
+        for article, heat_score in zip(articles, heat):
+            if not article.url:
+                continue
+            key = ArticleDeduplicator.normalize_url(article.url)
+            item = index.get(key)
+            fresh = article.to_dict()
+            if item is None:
+                fresh.update(heat_score=float(heat_score), first_seen=seen_at, last_seen=seen_at, seen_count=1)
+                groups.setdefault(article.source or 'unknown', []).append(fresh)
+                index[key] = fresh
+                added += 1
+            else:
+                # 条目保留在首次出现的来源分组下，内容和互动信号取最新一次
+                fresh.pop('source', None)
+                item.update(fresh)
+                item['heat_score'] = max(item.get('heat_score', 0), float(heat_score))
+                item['last_seen'] = seen_at
+                item['seen_count'] = item.get('seen_count', 0) + 1
+                updated += 1
+
+        # 各来源内按热度从高到低排列
+        data['sources'] = [
+            {'source': name, 'items': sorted(items, key=lambda item: -item.get('heat_score', 0))}
+            for name, items in groups.items()
+        ]
+        return added, updated
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """线程锁 + 文件锁（手动运行的 src.hourly 与常驻进程可能同时更新）"""
+        with self._lock:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(os.path.join(self.output_dir, '.daily_raw.lock'), 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                yield
+
+    def _save(self, date: str, data: Dict[str, Any]):
+        """先写临时文件再替换，视频任务不会读到写了一半的文件"""
+        data['date'] = date
+        data['updated_at'] = datetime.now().isoformat()
+        data['total_items'] = sum(len(source['items']) for source in data['sources'])
+        path = self.path(date)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+# 单例
+_aggregate = None
+_aggregate_lock = threading.Lock()
+
+def get_daily_aggregate() -> Optional[DailyAggregate]:
+    """获取聚合器单例（配置读取 config.json -> advanced.daily_aggregate，禁用时返回 None）"""
+    global _aggregate
+    with _aggregate_lock:
+        if _aggregate is None:
+            settings = {}
+            try:
+                from .config_loader import load_config
+                settings = load_config().get('advanced', {}).get('daily_aggregate', {})
+            except Exception:
+                pass
+            if not settings.get('enabled', True):
+                return None
+            output_dir = settings.get('output_dir')
+            if output_dir and not os.path.isabs(output_dir):
+                output_dir = os.path.join(PROJECT_ROOT, output_dir)
+            _aggregate = DailyAggregate(output_dir=output_dir)
+        return _aggregate
+
+def update_daily_aggregate(articles: Sequence[Article]) -> Tuple[int, int]:
+    """把一轮采集并入当天的聚合文件（禁用或写入失败时返回 (0, 0)，不影响发布流程）"""
+    try:
+        aggregate = get_daily_aggregate()
+        if aggregate is None or not articles:
+            return 0, 0
+        return aggregate.update(articles, get_hot_score_engine().heat(articles).tolist())
+    except OSError as e:
+        logger.warning(f"更新当天聚合失败: {e}")
+        return 0, 0
@@ -0,0 +1,194 @@
+"""
+运行截止时间
+为一次 hourly 运行设置总时间预算，按比例分配给 收集 / 生成 / 投递 各阶段：
+每个阶段开始时按剩余时间和后续阶段的占比计算本阶段预算，前面阶段省下的时间自动留给后面；
+预算用尽的阶段会被记录下来，运行继续用已就绪的结果降级完成
+"""
+import threading
+import time
+from concurrent.futures import Future
+from queue import Empty, Queue
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# 默认阶段占比
+DEFAULT_PHASE_SHARES = {
+    'collect': 0.4,
+    'generate': 0.4,
+    'publish': 0.2,
+}
+
+class RunDeadline:
+    """一次运行的截止时间与阶段预算"""
+
+    def __init__(self, total_seconds: Optional[float] = None, phase_shares: Dict[str, float] = None):
+        """
+        Args:
+            total_seconds: 总时间预算（None 或 0 表示不限）
+            phase_shares: 阶段名 -> 占比，按运行顺序排列
+        """
+        self.total_seconds = total_seconds or None
+        self.phase_shares = dict(phase_shares or DEFAULT_PHASE_SHARES)
+        self.started = time.monotonic()
+        self.timed_out_phase: Optional[str] = None
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RunDeadline":
+        """读取 advanced.run_deadline_seconds / advanced.deadline_shares"""
+        advanced = config.get('advanced', {})
+        return cls(advanced.get('run_deadline_seconds'), advanced.get('deadline_shares'))
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def remaining(self) -> Optional[float]:
+        """剩余秒数（不限时返回 None）"""
+        if self.total_seconds is None:
+            return None
+        return max(0.0, self.total_seconds - self.elapsed())
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def start_phase(self, phase: str) -> Optional[float]:
+        """
+        开始一个阶段
+
+        Returns:
+            本阶段预算秒数（不限时返回 None）
+        """
+        remaining = self.remaining()
+        budget = None
+        if remaining is not None:
+            names = list(self.phase_shares)
+            later = names[names.index(phase):] if phase in names else [phase]
+            total_share = sum(self.phase_shares.get(name, 0) for name in later)
+            share = self.phase_shares.get(phase, 0)
+            budget = remaining * share / total_share if total_share else remaining
+
+        with self._lock:
+            self.phases[phase] = {
+                'budget': round(budget, 3) if budget is not None else None,
+                'started_at': round(self.elapsed(), 3),
+                'ends_at': time.monotonic() + budget if budget is not None else None,
+            }
+        return budget
+
+    def phase_remaining(self, phase: str) -> Optional[float]:
+        """本阶段剩余秒数（不超过整体剩余时间）"""
+        info = self.phases.get(phase)
+        remaining = self.remaining()
+        if not info or info['ends_at'] is None:
+            return remaining
+        return max(0.0, min(info['ends_at'] - time.monotonic(), remaining))
+
+    def end_phase(self, phase: str, timed_out: bool = False):
+        """结束一个阶段，timed_out 时记录为超时阶段（只记录第一个）"""
+        with self._lock:
+            info = self.phases.setdefault(phase, {'budget': None, 'started_at': round(self.elapsed(), 3), 'ends_at': None})
+            info['used'] = round(self.elapsed() - info['started_at'], 3)
+            info['timed_out'] = info.get('timed_out', False) or timed_out
+            if timed_out and self.timed_out_phase is None:
+                self.timed_out_phase = phase
+
+    def summary(self) -> Dict[str, Any]:
+        """用于输出和健康状态的汇总"""
+        with self._lock:
+            return {
+                'budget': self.total_seconds,
+                'elapsed': round(self.elapsed(), 3),
+                'timed_out_phase': self.timed_out_phase,
+                'phases': {
+                    name: {k: v for k, v in info.items() if k != 'ends_at'}
+                    for name, info in self.phases.items()
+                },
+            }
+
+def run_with_timeout(tasks: Sequence[Tuple[str, Callable[[], Any]]],
+                     timeout: Optional[float]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    在守护线程中并发执行任务，最多等待 timeout 秒
+
+    超时未完成的任务被放弃（守护线程不会阻止进程退出），
+    任务抛出的异常作为结果返回
+
+    Returns:
+        (任务名 -> 结果或异常, 超时未完成的任务名)
+    """
+    results: "Queue[Tuple[str, Any]]" = Queue()
+
+    def worker(name: str, fn: Callable[[], Any]):
+        try:
+            results.put((name, fn()))
+        except Exception as e:
+            results.put((name, e))
+
+    for name, fn in tasks:
+        threading.Thread(target=worker, args=(name, fn), name=f"task-{name}", daemon=True).start()
+
+    done: Dict[str, Any] = {}
+    ends_at = time.monotonic() + timeout if timeout is not None else None
+    while len(done) < len(tasks):
+        wait = None if ends_at is None else ends_at - time.monotonic()
+        if wait is not None and wait <= 0:
+            break
+        try:
+            name, result = results.get(timeout=wait)
+        except Empty:
+            break
+        done[name] = result
+
+    pending = [name for name, _ in tasks if name not in done]
+    return done, pending
+
+class DaemonThreadPool:
+    """
+    守护线程池（submit / shutdown 与 ThreadPoolExecutor 相同，返回标准 Future）
+
+    ThreadPoolExecutor 的工作线程在解释器退出时会被等待，超出预算后放弃的请求仍会拖住单次运行的进程；
+    这里的工作线程是守护线程，放弃的任务不会阻止进程退出
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = 'task'):
+        self._queue: "Queue[Optional[Tuple[Future, Callable[..., Any], tuple, dict]]]" = Queue()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"{thread_name_prefix}-{i}", daemon=True)
+            for i in range(max(1, max_workers))
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        future: Future = Future()
+        self._queue.put((future, fn, args, kwargs))
+        return future
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, cancel_futures: bool = False):
+        """不再接受任务，工作线程处理完手上的任务后退出（不等待）；cancel_futures 时取消尚未开始的任务"""
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in self._threads:
+            self._queue.put(None)
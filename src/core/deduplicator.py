@@ -38,10 +38,15 @@ class ArticleDeduplicator:
         self.memory_path = memory_path
         self.window_hours = 24  # 24小时窗口
         
+        # 内存索引：规范化URL -> 最近发送时间，文件变化（mtime/大小）时重建
+        self._index: Dict[str, float] = {}
+        self._index_signature = None
+        
         # 确保目录存在
         os.makedirs(os.path.dirname(memory_path), exist_ok=True)
     
-    def normalize_url(self, url: str) -> str:
+    @classmethod
+    def normalize_url(cls, url: str) -> str:
         """规范化URL，移除跟踪参数"""
         if not url:
             return url
@@ -55,7 +60,7 @@ class ArticleDeduplicator:
             # 过滤掉跟踪参数（不区分大小写）
             filtered_params = [
                 (k, v) for k, v in query_params 
-                if k.lower() not in self.TRACKING_PARAMS
+                if k.lower() not in cls.TRACKING_PARAMS
             ]
             
             # 重新构建查询字符串
@@ -85,6 +90,28 @@ class ArticleDeduplicator:
         except:
             return []
     
+    def _file_signature(self):
+        """记录文件的 (mtime, 大小)，文件不存在时为 None"""
+        try:
+            stat = os.stat(self.memory_path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def _get_index(self) -> Dict[str, float]:
+        """获取去重索引（常驻进程中跨轮次复用，记录文件未变化时不重新解析）"""
+        signature = self._file_signature()
+        if signature is None:
+            self._index, self._index_signature = {}, None
+        elif signature != self._index_signature:
+            index = {}
+            for article in self.load_sent_articles():
+                article_url = article.get('normalized_url') or article.get('url', '')
+                normalized = self.normalize_url(article_url)
+                index[normalized] = max(index.get(normalized, 0), article.get('sent_at', 0))
+            self._index, self._index_signature = index, signature
+        return self._index
+    
     def save_sent_articles(self, articles: List[Dict]):
         """保存已发送的文章记录"""
         data = {
@@ -100,26 +127,13 @@ class ArticleDeduplicator:
         if not url:
             return False
         
-        # 规范化 URL
-        normalized_url = self.normalize_url(url)
-        
-        sent_articles = self.load_sent_articles()
-        current_time = time.time()
-        window_seconds = self.window_hours * 3600
+        # 规范化 URL，比较规范化后的 URL
+        sent_at = self._get_index().get(self.normalize_url(url))
+        if sent_at is None:
+            return False
         
-        for article in sent_articles:
-            # 获取已发送文章的 URL（优先使用规范化 URL）
-            article_url = article.get('normalized_url') or article.get('url', '')
-            article_normalized = self.normalize_url(article_url)
-            
-            # URL匹配（比较规范化后的 URL）
-            if article_normalized == normalized_url:
-                sent_at = article.get('sent_at', 0)
-                # 检查是否在24小时内
-                if current_time - sent_at < window_seconds:
-                    return True
-        
-        return False
+        # 检查是否在24小时内
+        return time.time() - sent_at < self.window_hours * 3600
     
     def filter_new_articles(self, articles: List[Article]) -> List[Article]:
         """过滤掉24小时内已发送的文章"""
@@ -150,24 +164,26 @@ class ArticleDeduplicator:
         }
         
         for article in articles:
-            if not article.url:
-                continue
-            
-            normalized_url = self.normalize_url(article.url)
-            
-            # 检查是否已存在（比较规范化后的 URL）
-            if normalized_url not in existing_normalized_urls:
-                sent_articles.append({
-                    'url': article.url,                    # 原始 URL
-                    'normalized_url': normalized_url,      # 规范化后的 URL
-                    'title': article.title,
-                    'summary': article.summary,            # 内容摘要/介绍
-                    'source': article.source,              # 数据来源
-                    'metadata': article.metadata,          # 额外元数据(votes/topics等)
-                    'sent_at': current_time,
-                    'sent_count': 1
-                })
-                existing_normalized_urls.add(normalized_url)
+            # 聚类代表发布后，同簇其他来源的 URL 一并记录
+            for url in [article.url] + list(article.get_meta('cluster_urls') or []):
+                if not url:
+                    continue
+                
+                normalized_url = self.normalize_url(url)
+                
+                # 检查是否已存在（比较规范化后的 URL）
+                if normalized_url not in existing_normalized_urls:
+                    sent_articles.append({
+                        'url': url,                            # 原始 URL
+                        'normalized_url': normalized_url,      # 规范化后的 URL
+                        'title': article.title,
+                        'summary': article.summary,            # 内容摘要/介绍
+                        'source': article.source,              # 数据来源
+                        'metadata': dict(article.metadata),    # 额外元数据(votes/topics等)
+                        'sent_at': current_time,
+                        'sent_count': 1
+                    })
+                    existing_normalized_urls.add(normalized_url)
         
         self.save_sent_articles(sent_articles)
     
@@ -0,0 +1,234 @@
+"""
+文章页面补充
+对摘要过短或由模板拼出来的候选（如没有正文的 HN 链接帖、只有一句 tagline 的 Product Hunt 产品），
+并发抓取目标页面的开头部分（<head> 加正文前若干 KB，超过字节上限即停止读取），
+用流式 HTML 解析提取 title / meta description / og 标签 / 首段正文，补充到摘要和 metadata['page']；
+解析结果按 URL 缓存到 memory/page_meta_cache.json
+
+配置 advanced.enrichment:
+    enabled: 是否启用，默认 true
+    max_bytes: 每个页面最多读取的字节数，默认 65536
+    timeout: 单个页面的超时秒数，默认 8
+    workers: 并发抓取数，默认 6
+    min_summary_chars: 摘要短于该长度时补充，默认 80
+    max_articles: 每次最多补充的文章数，默认 20
+"""
+import codecs
+import logging
+import re
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, wait
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional
+
+from src.sources.base import Article
+from src.core.deduplicator import ArticleDeduplicator
+from src.core.json_cache import JsonFileCache
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# 首段正文的最短长度（过滤导航、按钮等短文本）
+MIN_LEAD_CHARS = 60
+MAX_FIELD_CHARS = 500
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w-]+)', re.I)
+_SPACE_RE = re.compile(r'\s+')
+
+class PageMetaParser(HTMLParser):
+    """流式提取页面元信息，拿到首段正文后 done 置为 True"""
+
+    _META_KEYS = {
+        'description': 'description',
+        'og:title': 'og_title',
+        'og:description': 'og_description',
+        'og:image': 'og_image',
+        'og:site_name': 'site_name',
+        'twitter:description': 'twitter_description',
+    }
+    _SKIP_TAGS = {'script', 'style', 'noscript', 'template', 'svg'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta: Dict[str, str] = {}
+        self.done = False
+        self._in_title = False
+        self._title_parts: List[str] = []
+        self._skip_depth = 0
+        self._paragraph: Optional[List[str]] = None
+
+    def handle_starttag(self, tag: str, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == 'title' and 'title' not in self.meta:
+            self._in_title = True
+        elif tag == 'meta':
+            attrs = dict(attrs)
+            key = self._META_KEYS.get((attrs.get('property') or attrs.get('name') or '').lower())
+            content = _clean(attrs.get('content'))
+            if key and content and key not in self.meta:
+                self.meta[key] = content
+        elif tag == 'p' and 'lead' not in self.meta:
+            self._paragraph = []
+
+    def handle_endtag(self, tag: str):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == 'title' and self._in_title:
+            self._in_title = False
+            title = _clean(''.join(self._title_parts))
+            if title:
+                self.meta['title'] = title
+        elif tag == 'p' and self._paragraph is not None:
+            text = _clean(''.join(self._paragraph))
+            self._paragraph = None
+            if len(text) >= MIN_LEAD_CHARS:
+                self.meta['lead'] = text
+                self.done = True
+
+    def handle_data(self, data: str):
+        if self._skip_depth:
+            return
+        if self._in_title:
+            self._title_parts.append(data)
+        elif self._paragraph is not None:
+            self._paragraph.append(data)
+
+def _clean(text: Optional[str]) -> str:
+    return _SPACE_RE.sub(' ', text or '').strip()[:MAX_FIELD_CHARS]
+
+def fetch_page_meta(url: str, max_bytes: int = 65536, timeout: float = 8,
+                    chunk_size: int = 8192) -> Dict[str, str]:
+    """
+    读取页面开头部分并提取元信息（拿到首段正文或超过 max_bytes 即停止读取）
+
+    Returns:
+        {'title', 'description', 'og_title', 'og_description', 'og_image', 'site_name', 'lead'} 中已找到的字段
+    """
+    req = urllib.request.Request(url, headers={'User-Agent': USER_AGENT, 'Accept': 'text/html'})
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        content_type = response.headers.get('Content-Type', '')
+        if 'html' not in content_type.lower():
+            return {}
+        match = _CHARSET_RE.search(content_type)
+        try:
+            decoder = codecs.getincrementaldecoder(match.group(1) if match else 'utf-8')(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+        parser = PageMetaParser()
+        received = 0
+        while received < max_bytes and not parser.done:
+            chunk = response.read(min(chunk_size, max_bytes - received))
+            if not chunk:
+                break
+            received += len(chunk)
+            parser.feed(decoder.decode(chunk))
+    parser.close()
+    return parser.meta
+
+def build_summary(summary: str, meta: Dict[str, str], synthetic: bool = False) -> str:
+    """用页面元信息补充摘要（模板摘要直接替换，真实的短摘要保留在前）"""
+    description = meta.get('og_description') or meta.get('description') or meta.get('twitter_description') or ''
+    lead = meta.get('lead', '')
+    parts = [] if synthetic or not summary else [summary.strip()]
+    for text in (description, lead):
+        if text and not any(text in part or part in text for part in parts):
+            parts.append(text)
+        if sum(len(part) for part in parts) >= 200:
+            break
+    return ' '.join(parts)[:MAX_FIELD_CHARS] if parts else summary
+
+class PageEnricher:
+    """并发补充候选文章的页面信息"""
+
+    def __init__(self, max_bytes: int = 65536, timeout: float = 8, workers: int = 6,
+                 min_summary_chars: int = 80, max_articles: int = 20, cache: JsonFileCache = None):
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.workers = workers
+        self.min_summary_chars = min_summary_chars
+        self.max_articles = max_articles
+        # 确定性的结果（解析到的页面、非 HTML、4xx）才缓存，空结果同样缓存，避免每轮重复请求打不开的页面；
+        # 超时、DNS、5xx 等临时错误不缓存，下一轮重试
+        self.cache = cache or JsonFileCache('page_meta_cache.json', ttl_seconds=7 * 86400, max_entries=2000)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["PageEnricher"]:
+        """读取 advanced.enrichment，禁用时返回 None"""
+        settings = config.get('advanced', {}).get('enrichment', {})
+        if not settings.get('enabled', True):
+            return None
+        return cls(
+            max_bytes=settings.get('max_bytes', 65536),
+            timeout=settings.get('timeout', 8),
+            workers=settings.get('workers', 6),
+            min_summary_chars=settings.get('min_summary_chars', 80),
+            max_articles=settings.get('max_articles', 20),
+        )
+
+    def needs_enrichment(self, article: Article) -> bool:
+        """摘要由模板拼出或过短，且尚未补充过"""
+        if not article.url.startswith(('http://', 'https://')) or article.get_meta('page') is not None:
+            return False
+        return bool(article.get_meta('summary_synthetic')) or len((article.summary or '').strip()) < self.min_summary_chars
+
+    def _lookup(self, url: str) -> Dict[str, str]:
+        key = ArticleDeduplicator.normalize_url(url)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        try:
+            meta = fetch_page_meta(url, self.max_bytes, self.timeout)
+        except urllib.error.HTTPError as e:
+            logger.debug(f"抓取页面失败 {url}: {e}")
+            if 400 <= e.code < 500 and e.code not in (408, 429):
+                self.cache.set(key, {})
+            return {}
+        except Exception as e:
+            logger.debug(f"抓取页面失败 {url}: {e}")
+            return {}
+        self.cache.set(key, meta)
+        return meta
+
+    def enrich(self, articles: List[Article], timeout: Optional[float] = None) -> int:
+        """
+        补充需要的文章（按传入顺序取前 max_articles 条），原地修改 summary / metadata
+
+        Args:
+            articles: 候选文章（建议按热度排序后传入）
+            timeout: 整体等待秒数，超时未完成的页面本轮跳过（结果仍会写入缓存供下次使用）
+        Returns:
+            补充成功的文章数
+        """
+        targets = [article for article in articles if self.needs_enrichment(article)][:self.max_articles]
+        if not targets:
+            return 0
+
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(targets))), thread_name_prefix='enrich')
+        futures = {executor.submit(self._lookup, article.url): article for article in targets}
+        done, pending = wait(futures, timeout=timeout)
+        executor.shutdown(wait=False)
+        # 超时未完成的页面在后台线程结束后再落盘一次，结果留给下一轮
+        for future in pending:
+            future.add_done_callback(lambda _: self.cache.save())
+
+        enriched = 0
+        for future in done:
+            article = futures[future]
+            meta = future.result()
+            if not meta:
+                continue
+            synthetic = bool(article.get_meta('summary_synthetic'))
+            summary = build_summary(article.summary, meta, synthetic)
+            if summary != article.summary:
+                article.summary = summary
+                article.metadata.pop('summary_synthetic', None)
+                enriched += 1
+            article.metadata['page'] = meta
+
+        self.cache.save()
+        logger.info(f"页面补充: {enriched}/{len(targets)} 条")
+        return enriched
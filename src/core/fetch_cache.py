@@ -0,0 +1,167 @@
+"""
+数据源抓取结果缓存
+按 (数据源, 配置哈希) 缓存 DataSource.fetch() 的文章列表，存放在 SQLite（memory/fetch_cache.sqlite3），
+多个入口（src、src.hourly、src.collector）在有效期内共用同一次采集结果，不再各自请求上游；
+空结果不写入缓存（不少数据源在上游故障时返回空列表，缓存下来会让该来源在整个有效期内都没有数据）
+
+    articles = cached_fetch(source)                 # 有效期内直接返回缓存
+    articles = cached_fetch(source, refresh=True)   # 强制抓取并刷新缓存（后台采集器）
+
+配置:
+    advanced.fetch_cache.enabled: 是否启用，默认 true
+    advanced.fetch_cache.ttl_minutes: 默认有效期，默认 10
+    sources.<name>.cache_ttl_minutes: 单个数据源的有效期（0 表示不缓存）
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.sources.base import Article, DataSource
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'memory', 'fetch_cache.sqlite3')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetch_cache (
+    source TEXT NOT NULL,
+    config_hash TEXT NOT NULL,
+    articles TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (source, config_hash)
+);
+"""
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """数据源配置的哈希（只保存哈希，配置中的密钥不会落盘）"""
+    payload = json.dumps(config or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+class FetchCache:
+    """基于 SQLite 的抓取结果缓存（跨进程共享）"""
+
+    def __init__(self, path: str = None, ttl_minutes: float = 10):
+        """
+        Args:
+            path: SQLite 文件路径，默认 memory/fetch_cache.sqlite3
+            ttl_minutes: 默认有效期（分钟）
+        """
+        self.path = path or DEFAULT_CACHE_PATH
+        self.ttl_seconds = ttl_minutes * 60
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """打开连接，正常退出时提交，异常时回滚，最后关闭"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def ttl_for(self, source: DataSource) -> float:
+        """数据源的有效期（秒），sources.<name>.cache_ttl_minutes 优先"""
+        ttl_minutes = source.config.get('cache_ttl_minutes')
+        return self.ttl_seconds if ttl_minutes is None else float(ttl_minutes) * 60
+
+    def get(self, source: str, key: str, ttl_seconds: float) -> Optional[List[Article]]:
+        """读取未过期的缓存，不存在或已过期返回 None"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT articles, fetched_at FROM fetch_cache WHERE source = ? AND config_hash = ?",
+                (source, key)
+            ).fetchone()
+        if row is None or time.time() - row[1] > ttl_seconds:
+            return None
+        try:
+            return [Article.from_dict(item) for item in json.loads(row[0])]
+        except (ValueError, TypeError, AttributeError):
+            return None
+
+    def put(self, source: str, key: str, articles: List[Article], max_age_seconds: float = 86400):
+        """写入一次抓取结果，顺带清理超过 max_age_seconds 的条目（配置变化后旧哈希的结果不会再被读取）"""
+        payload = json.dumps([article.to_dict() for article in articles], ensure_ascii=False)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO fetch_cache (source, config_hash, articles, fetched_at) VALUES (?, ?, ?, ?)",
+                (source, key, payload, now)
+            )
+            conn.execute("DELETE FROM fetch_cache WHERE fetched_at < ?", (now - max_age_seconds,))
+
+    def fetch(self, source: DataSource, fetch_fn: Callable[[], List[Article]] = None,
+              refresh: bool = False) -> List[Article]:
+        """
+        有效期内返回缓存，否则调用 fetch_fn（默认 source.fetch）并写入缓存
+
+        Args:
+            source: 数据源
+            fetch_fn: 实际抓取函数（如经过熔断器包装的 source.fetch）
+            refresh: 忽略缓存强制抓取
+        """
+        fetch_fn = fetch_fn or source.fetch
+        ttl_seconds = self.ttl_for(source)
+        if ttl_seconds <= 0:
+            return fetch_fn()
+
+        key = config_hash(source.config)
+        if not refresh:
+            try:
+                cached = self.get(source.name, key, ttl_seconds)
+            except sqlite3.Error as e:
+                logger.warning(f"读取抓取缓存失败: {e}")
+                cached = None
+            if cached is not None:
+                self.hits += 1
+                logger.info(f"{source.name}: 使用缓存的抓取结果 {len(cached)} 条")
+                return cached
+
+        self.misses += 1
+        articles = fetch_fn() or []
+        if not articles:
+            return articles
+        try:
+            self.put(source.name, key, articles)
+        except sqlite3.Error as e:
+            logger.warning(f"写入抓取缓存失败: {e}")
+        return articles
+
+# 单例
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_fetch_cache() -> Optional[FetchCache]:
+    """获取抓取缓存单例（配置读取 config.json -> advanced.fetch_cache，禁用时返回 None）"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            settings = {}
+            try:
+                from .config_loader import load_config
+                settings = load_config().get('advanced', {}).get('fetch_cache', {})
+            except Exception:
+                pass
+            if not settings.get('enabled', True):
+                return None
+            _cache = FetchCache(ttl_minutes=settings.get('ttl_minutes', 10))
+        return _cache
+
+def cached_fetch(source: DataSource, fetch_fn: Callable[[], List[Article]] = None,
+                 refresh: bool = False) -> List[Article]:
+    """通过共享缓存抓取数据源（缓存禁用时直接抓取）"""
+    cache = get_fetch_cache()
+    if cache is None:
+        return (fetch_fn or source.fetch)()
+    return cache.fetch(source, fetch_fn, refresh)
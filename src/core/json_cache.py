@@ -0,0 +1,75 @@
+"""
+JSON 文件缓存
+带过期时间和容量上限的键值缓存，持久化到 memory/ 下的 JSON 文件，线程安全
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'memory')
+
+class JsonFileCache:
+    """持久化键值缓存"""
+
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None, max_entries: int = 1000):
+        """
+        Args:
+            path: 缓存文件路径（相对路径放在 memory/ 下）
+            ttl_seconds: 条目有效期（None 表示不过期）
+            max_entries: 最多保留的条目数，超出时淘汰最旧的
+        """
+        if not os.path.isabs(path):
+            path = os.path.join(DEFAULT_CACHE_DIR, path)
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f).get('entries', {})
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry.get('stored_at', 0) > self.ttl_seconds
+
+    def get(self, key: str) -> Optional[Any]:
+        """读取缓存，不存在或已过期返回 None"""
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None or self._is_expired(entry, time.time()):
+                return None
+            return entry.get('value')
+
+    def set(self, key: str, value: Any):
+        """写入缓存（调用 save() 后落盘）"""
+        with self._lock:
+            self._load()[key] = {'value': value, 'stored_at': time.time()}
+            self._dirty = True
+
+    def save(self):
+        """清理过期/超量条目并原子写入文件"""
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            entries = {k: v for k, v in self._load().items() if not self._is_expired(v, now)}
+            if len(entries) > self.max_entries:
+                newest = sorted(entries.items(), key=lambda kv: kv[1].get('stored_at', 0), reverse=True)
+                entries = dict(newest[:self.max_entries])
+            self._entries = entries
+
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'entries': entries}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
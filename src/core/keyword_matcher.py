@@ -0,0 +1,146 @@
+"""
+多关键词匹配
+把一组关键词按前缀树编译成一个正则（同一位置优先匹配最长的关键词），一次扫描返回所有命中的关键词，
+代替逐个关键词 `kw in text.lower()` 的循环（只能按子串判断）。几十个关键词时速度与原来的循环相当
+（C 实现的子串查找已经很快），改动的目的是减少误判，不是提速，见 benchmarks/keyword_matching.py
+
+  - 不区分大小写
+  - 以英文字母/数字开头或结尾的关键词按整词匹配（字母结尾的允许复数 s / es）：
+    "ai" 不再命中 "said" / "email"，但命中 "AI-powered" / "AIs"
+  - 中文关键词按子串匹配（中文没有词边界），"中国AI" 这类混合词只在英文一端检查边界
+  - 命中较长的关键词时，同时算作命中它包含的较短关键词（如命中 "提供了" 也算命中 "提供"）
+  - identifiers=True 时额外按大小写和数字切分标识符再匹配一遍（"AutoGPT" -> "auto gpt"，
+    "GPT4All" -> "gpt 4 all"），用于仓库名等驼峰写法；全小写的连写（如 "vllm"）切分不出来，
+    仍然不会命中（原来的子串匹配会命中），需要时把这类名称直接加入关键词
+
+    AI_MATCHER = KeywordMatcher(["openai", "llm", "ai", "大模型"])
+    AI_MATCHER.search("OpenAI ships new LLMs")    # -> "openai"
+    AI_MATCHER.findall("OpenAI ships new LLMs")   # -> ["openai", "llm"]
+"""
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+_BEFORE = r'(?<![a-z0-9].)'
+_AFTER = r'(?![a-z0-9])'
+
+# 标识符切分点（匹配切分点前的字符）：小写后接大写、连续大写后接首字母大写的单词、字母与数字之间
+_IDENTIFIER_SPLIT = re.compile(r'[a-z](?=[A-Z0-9])|[A-Z](?=[A-Z][a-z]|[0-9])|[0-9](?=[A-Za-z])')
+
+def split_identifiers(text: str) -> str:
+    """在驼峰、数字边界插入空格（"AutoGPT" -> "Auto GPT"，"Qwen2VL" -> "Qwen 2 VL"）"""
+    return _IDENTIFIER_SPLIT.sub(r'\g<0> ', text)
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+def _word_end(keyword: str) -> str:
+    """关键词结尾的边界条件"""
+    if not _is_word_char(keyword[-1]):
+        return ''
+    return '(?:e?s)?' + _AFTER if keyword[-1].isalpha() else _AFTER
+
+def _trie_regex(keywords: Iterable[str]) -> str:
+    """
+    前缀树正则：分支按字符展开，较长的分支排在结束标记之前（边界不满足时回溯到较短的关键词）
+
+    每个顶层分支都以字面字符开头（英文的开头边界放在第一个字符之后检查），
+    re 可以据此用首字符集合快速跳过不可能命中的位置
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = keyword
+
+    def emit(node: dict) -> str:
+        alternatives = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if '' in node:
+            alternatives.append(_word_end(node['']))
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+
+    roots = []
+    for char, child in sorted(trie.items()):
+        head = re.escape(char)
+        if _is_word_char(char):
+            head += _BEFORE
+        roots.append(head + emit(child))
+    return '|'.join(roots) or r'(?!)'
+
+class KeywordMatcher:
+    """编译好的多关键词匹配器（只读，可作为类属性在线程间共享）"""
+
+    def __init__(self, keywords: Iterable[str], identifiers: bool = False):
+        """
+        Args:
+            keywords: 关键词列表
+            identifiers: 是否同时在按大小写 / 数字切分后的文本上匹配（仓库名、产品名等驼峰写法）
+        """
+        self.identifiers = identifiers
+        # 去重（不区分大小写，保留第一次出现的写法）
+        self._canonical: Dict[str, str] = {}
+        for keyword in keywords:
+            keyword = keyword.strip()
+            if keyword:
+                self._canonical.setdefault(keyword.lower(), keyword)
+        self.keywords: Tuple[str, ...] = tuple(self._canonical.values())
+        self._pattern: Pattern = re.compile(_trie_regex(self._canonical))
+
+        # 每个关键词包含的其他关键词（边界规则相同）
+        self._implied: Dict[str, Tuple[str, ...]] = {}
+        for key in self._canonical:
+            contained = [
+                other for other in self._canonical
+                if len(other) < len(key) and other in key and re.search(_trie_regex([other]), key)
+            ]
+            self._implied[key] = tuple(contained)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords)} keywords)"
+
+    def _key(self, matched: str) -> str:
+        # 匹配文本可能带复数 s / es
+        if matched in self._canonical:
+            return matched
+        return matched[:-1] if matched[:-1] in self._canonical else matched[:-2]
+
+    def _variants(self, text: str) -> Iterator[str]:
+        """要匹配的文本：原文，以及 identifiers 模式下切分后有变化的文本（按需生成，原文命中时不再切分）"""
+        text = text or ''
+        lowered = text.lower()
+        yield lowered
+        if self.identifiers:
+            split = split_identifiers(text).lower()
+            if split != lowered:
+                yield split
+
+    def search(self, text: str) -> Optional[str]:
+        """第一个命中的关键词，没有命中返回 None"""
+        for variant in self._variants(text):
+            match = self._pattern.search(variant)
+            if match:
+                return self._canonical[self._key(match.group())]
+        return None
+
+    def matches(self, text: str) -> bool:
+        """是否命中任一关键词"""
+        return any(self._pattern.search(variant) for variant in self._variants(text))
+
+    def findall(self, text: str) -> List[str]:
+        """所有命中的关键词（按出现顺序、去重；位置重叠的关键词也都会返回）"""
+        found: Dict[str, None] = {}
+        search = self._pattern.search
+        for variant in self._variants(text):
+            match = search(variant)
+            while match:
+                key = self._key(match.group())
+                found[key] = None
+                for other in self._implied[key]:
+                    found[other] = None
+                match = search(variant, match.start() + 1)
+        return [self._canonical[key] for key in found]
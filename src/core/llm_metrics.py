@@ -0,0 +1,193 @@
+"""
+LLM 用量统计
+记录每次 Gemini 调用的 token 用量（usageMetadata）和耗时，
+按运行和调用方汇总，写入 logs/metrics，并执行每次运行的 token/时间预算
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+DEFAULT_METRICS_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'logs', 'metrics')
+
+# 生成优先级：预算用尽后只跳过低优先级的生成
+PRIORITY_HIGH = 'high'
+PRIORITY_LOW = 'low'
+
+class LLMBudgetExceeded(RuntimeError):
+    """本次运行的LLM预算已用尽"""
+
+def _empty_totals() -> Dict[str, Any]:
+    return {
+        'calls': 0,
+        'failures': 0,
+        'skipped': 0,
+        'prompt_tokens': 0,
+        'output_tokens': 0,
+        'total_tokens': 0,
+        'seconds': 0.0,
+    }
+
+class LLMUsageTracker:
+    """LLM 用量统计与预算控制（线程安全）"""
+
+    def __init__(self, max_tokens_per_run: Optional[int] = None,
+                 max_seconds_per_run: Optional[float] = None,
+                 metrics_dir: str = None):
+        """
+        Args:
+            max_tokens_per_run: 每次运行的 token 预算（None 表示不限）
+            max_seconds_per_run: 每次运行的 LLM 耗时预算（秒，按墙钟时间计，并发调用重叠的部分只算一次）
+            metrics_dir: 统计文件目录
+        """
+        self.max_tokens_per_run = max_tokens_per_run
+        self.max_seconds_per_run = max_seconds_per_run
+        self.metrics_dir = metrics_dir or DEFAULT_METRICS_DIR
+        self._lock = threading.Lock()
+        self.start_run()
+
+    def set_budget(self, max_tokens_per_run: Optional[int] = None,
+                   max_seconds_per_run: Optional[float] = None):
+        """更新预算（常驻进程重新加载配置后调用，已有的统计保留）"""
+        with self._lock:
+            self.max_tokens_per_run = max_tokens_per_run
+            self.max_seconds_per_run = max_seconds_per_run
+
+    def start_run(self, run_id: str = None):
+        """开始新一轮统计（常驻进程每次运行前调用）"""
+        with self._lock:
+            self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+            self.started_at = time.time()
+            self.totals = _empty_totals()
+            # seconds 是各次调用耗时之和；wall_seconds 是至少有一个调用在进行的墙钟时间，用于时间预算
+            self.totals['wall_seconds'] = 0.0
+            self._busy: List[List[float]] = []     # 已合并的 [开始, 结束] 区间（按开始时间排序、互不重叠）
+            self.by_caller: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def parse_usage(response: Dict[str, Any]) -> Dict[str, int]:
+        """从 Gemini 响应中提取 usageMetadata"""
+        usage = (response or {}).get('usageMetadata') or {}
+        prompt_tokens = usage.get('promptTokenCount', 0)
+        output_tokens = usage.get('candidatesTokenCount', 0) + usage.get('thoughtsTokenCount', 0)
+        return {
+            'prompt_tokens': prompt_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': usage.get('totalTokenCount', prompt_tokens + output_tokens),
+        }
+
+    def record(self, caller: str, seconds: float, response: Dict[str, Any] = None,
+               success: bool = True, finished: Optional[float] = None):
+        """
+        记录一次调用
+
+        Args:
+            caller: 调用方标识（如 hourly_intro、moltbook_summary）
+            seconds: 请求耗时
+            response: Gemini 响应 JSON（失败时可为空）
+            success: 是否成功
+            finished: 调用结束的 time.monotonic() 时间（默认为记录时）
+        """
+        usage = self.parse_usage(response)
+        finished = time.monotonic() if finished is None else finished
+        with self._lock:
+            self._add_busy(finished - seconds, finished)
+            for bucket in (self.totals, self.by_caller.setdefault(caller, _empty_totals())):
+                bucket['calls'] += 1
+                bucket['failures'] += 0 if success else 1
+                bucket['seconds'] += seconds
+                for key, value in usage.items():
+                    bucket[key] += value
+
+    def _add_busy(self, start: float, end: float):
+        """并入一个调用区间，wall_seconds 为所有区间的并集长度（调用持有 _lock）"""
+        merged: List[List[float]] = []
+        for interval in sorted(self._busy + [[start, end]]):
+            if merged and interval[0] <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], interval[1])
+            else:
+                merged.append(list(interval))
+        self._busy = merged
+        self.totals['wall_seconds'] = sum(end - start for start, end in merged)
+
+    def record_skip(self, caller: str):
+        """记录一次因预算用尽而跳过的生成"""
+        with self._lock:
+            self.totals['skipped'] += 1
+            self.by_caller.setdefault(caller, _empty_totals())['skipped'] += 1
+
+    def budget_exhausted(self) -> bool:
+        """token 或时间预算是否已用尽"""
+        with self._lock:
+            if self.max_tokens_per_run is not None and self.totals['total_tokens'] >= self.max_tokens_per_run:
+                return True
+            if self.max_seconds_per_run is not None and self.totals['wall_seconds'] >= self.max_seconds_per_run:
+                return True
+        return False
+
+    def allow(self, priority: str = PRIORITY_HIGH) -> bool:
+        """判断该优先级的生成是否可以执行"""
+        return priority != PRIORITY_LOW or not self.budget_exhausted()
+
+    def check_budget(self, caller: str, priority: str = PRIORITY_HIGH):
+        """
+        预算检查，预算用尽时低优先级生成抛出 LLMBudgetExceeded
+        """
+        if not self.allow(priority):
+            self.record_skip(caller)
+            raise LLMBudgetExceeded(f"LLM预算已用尽，跳过低优先级生成（{caller}）")
+
+    def summary(self) -> Dict[str, Any]:
+        """本次运行的用量汇总"""
+        with self._lock:
+            return {
+                'run_id': self.run_id,
+                'started_at': datetime.fromtimestamp(self.started_at).isoformat(),
+                'budget': {
+                    'max_tokens_per_run': self.max_tokens_per_run,
+                    'max_seconds_per_run': self.max_seconds_per_run,
+                },
+                'totals': {k: round(v, 3) if isinstance(v, float) else v for k, v in self.totals.items()},
+                'by_caller': {
+                    caller: {k: round(v, 3) if isinstance(v, float) else v for k, v in stats.items()}
+                    for caller, stats in self.by_caller.items()
+                },
+            }
+
+    def flush(self) -> Optional[str]:
+        """
+        追加写入本次运行的汇总到 logs/metrics/llm_usage_YYYYMMDD.jsonl
+
+        Returns:
+            写入的文件路径，无调用记录时返回 None
+        """
+        summary = self.summary()
+        if not summary['totals']['calls'] and not summary['totals']['skipped']:
+            return None
+
+        os.makedirs(self.metrics_dir, exist_ok=True)
+        path = os.path.join(self.metrics_dir, f"llm_usage_{datetime.now().strftime('%Y%m%d')}.jsonl")
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(summary, ensure_ascii=False) + '\n')
+        return path
+
+# 单例
+_usage_tracker = None
+
+def get_usage_tracker() -> LLMUsageTracker:
+    """获取用量统计单例（预算读取 config.json -> summarizer.budget）"""
+    global _usage_tracker
+    if _usage_tracker is None:
+        budget = {}
+        try:
+            from .config_loader import load_config
+            budget = load_config().get('summarizer', {}).get('budget', {})
+        except Exception:
+            pass
+        _usage_tracker = LLMUsageTracker(
+            max_tokens_per_run=budget.get('max_tokens_per_run'),
+            max_seconds_per_run=budget.get('max_seconds_per_run'),
+        )
+    return _usage_tracker
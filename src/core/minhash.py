@@ -0,0 +1,145 @@
+"""
+MinHash LSH 标题相似检索
+标题切分为 英文单词 + 中文字符二元组 的 shingle 集合，计算 MinHash 签名后按 band 分桶，
+只有落在同一个桶里的标题才做精确 Jaccard 比较，近似线性时间找出相似标题。
+中文按字符二元组而不是单字比较，避免“字符集合相同”造成的大量误判
+
+    index = MinHashLSH(threshold=0.6)
+    for i, title in enumerate(titles):
+        tokens = title_shingles(title)
+        if not index.query(tokens):
+            index.insert(i, tokens)
+"""
+import re
+import unicodedata
+import zlib
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# 梅森素数 2^61 - 1，系数小于 2^31 时 a * x + b 不会溢出 uint64
+_PRIME = np.uint64((1 << 61) - 1)
+
+_CJK = r'㐀-䶿一-鿿豈-﫿'
+_TOKEN_RE = re.compile(rf'[{_CJK}]+|[a-z0-9]+(?:[.\-+][a-z0-9]+)*')
+_CJK_RE = re.compile(rf'[{_CJK}]')
+# 标题前的来源标签，如 "[HN] " / "[Show HN] " / "[Product Hunt] "
+_TAG_RE = re.compile(r'^\s*[\[【][^\]】]{1,20}[\]】]\s*')
+
+_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'of', 'to', 'in', 'on', 'for', 'and', 'or', 'with', 'by', 'at', 'from',
+    'is', 'are', 'be', 'its', 'it', 'as', 'this', 'that', 'how', 'what', 'why', 'new',
+})
+
+def title_shingles(title: str) -> Set[str]:
+    """标题的 shingle 集合：英文/数字单词（去停用词）+ 中文字符二元组（单个汉字时用单字）"""
+    text = unicodedata.normalize('NFKC', title or '').lower()
+    while True:
+        stripped = _TAG_RE.sub('', text, count=1)
+        if stripped == text:
+            break
+        text = stripped
+
+    shingles = set()
+    for token in _TOKEN_RE.findall(text):
+        if _CJK_RE.match(token):
+            if len(token) == 1:
+                shingles.add(token)
+            else:
+                shingles.update(token[i:i + 2] for i in range(len(token) - 1))
+        elif token not in _STOPWORDS:
+            shingles.add(token)
+    return shingles
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+def _optimal_bands(threshold: float, num_perm: int, recall: float = 0.95) -> Tuple[int, int]:
+    """
+    选择 (bands, rows)：Jaccard 恰好等于阈值的两条标题成为候选的概率 1 - (1 - t^rows)^bands 不低于 recall，
+    在此前提下 rows 取最大（候选越少）。候选都会做精确 Jaccard 校验，所以偏向召回
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= recall:
+            best = (bands, rows)
+    return best
+
+class MinHashLSH:
+    """MinHash 签名 + LSH 分桶，查询结果经过精确 Jaccard 校验"""
+
+    def __init__(self, threshold: float = 0.6, num_perm: int = 64, seed: int = 1):
+        """
+        Args:
+            threshold: Jaccard 相似度阈值
+            num_perm: MinHash 排列数（越大越准，签名越慢）
+            seed: 随机种子（固定后签名可复现）
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = _optimal_bands(threshold, num_perm)
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=num_perm).astype(np.uint64)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(self.bands)]
+        self._shingles: Dict[Hashable, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def signature(self, shingles: Iterable[str]) -> np.ndarray:
+        """MinHash 签名（空集合返回全最大值）"""
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _PRIME, dtype=np.uint64)
+        return ((np.outer(self._a, hashes) + self._b[:, None]) % _PRIME).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
+
+    def insert(self, key: Hashable, shingles: Set[str], signature: Optional[np.ndarray] = None):
+        """加入一个标题"""
+        if signature is None:
+            signature = self.signature(shingles)
+        self._shingles[key] = shingles
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            band.setdefault(band_key, []).append(key)
+
+    def candidates(self, signature: np.ndarray) -> Set[Hashable]:
+        """与签名至少有一个 band 完全相同的已有标题"""
+        found = set()
+        for band, band_key in zip(self._buckets, self._band_keys(signature)):
+            found.update(band.get(band_key, ()))
+        return found
+
+    def query(self, shingles: Set[str], signature: Optional[np.ndarray] = None) -> List[Hashable]:
+        """Jaccard 不低于阈值的已有标题"""
+        if not shingles:
+            return []
+        if signature is None:
+            signature = self.signature(shingles)
+        return [
+            key for key in self.candidates(signature)
+            if jaccard(shingles, self._shingles[key]) >= self.threshold
+        ]
+
+def dedupe_titles(titles: Iterable[str], threshold: float = 0.6, num_perm: int = 64) -> List[int]:
+    """
+    按顺序去重，返回保留的下标（与已保留标题相似的丢弃；无法切分出 shingle 的标题保留）
+    """
+    index = MinHashLSH(threshold=threshold, num_perm=num_perm)
+    kept = []
+    for i, title in enumerate(titles):
+        shingles = title_shingles(title)
+        signature = index.signature(shingles)
+        if shingles and index.query(shingles, signature):
+            continue
+        index.insert(i, shingles, signature)
+        kept.append(i)
+    return kept
@@ -0,0 +1,322 @@
+"""
+发布发件箱（Outbox）
+生成好的帖子先持久化到 SQLite，再由发布 worker 投递，
+投递确认成功后才写入去重记录；进程中断或 webhook 失败都不会丢失已生成的内容
+
+状态流转: pending -> sending -> sent
+                       └-> pending（失败重试，指数退避）-> failed（超过最大次数）
+
+测试模式的帖子（record_dedup=0）使用单独的幂等键，不会占用正式发布的名额
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.sources.base import Article
+from src.core.deduplicator import ArticleDeduplicator
+
+DEFAULT_OUTBOX_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'memory', 'outbox.sqlite3')
+
+STATUS_PENDING = 'pending'
+STATUS_SENDING = 'sending'
+STATUS_SENT = 'sent'
+STATUS_FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    idempotency_key TEXT PRIMARY KEY,
+    channel TEXT NOT NULL,
+    normalized_url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    article TEXT NOT NULL,
+    record_dedup INTEGER NOT NULL DEFAULT 1,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_status ON outbox (status, next_attempt_at);
+"""
+
+class Outbox:
+    """基于 SQLite 的持久化发件箱"""
+
+    def __init__(self, path: str = None, sending_timeout: float = 600):
+        """
+        Args:
+            path: SQLite 文件路径，默认 memory/outbox.sqlite3
+            sending_timeout: sending 状态超过该秒数视为进程中断，重新投递
+        """
+        self.path = path or DEFAULT_OUTBOX_PATH
+        self.sending_timeout = sending_timeout
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """打开连接，正常退出时提交，异常时回滚，最后关闭"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(channel: str, url: str, date: str = None, is_test: bool = False) -> str:
+        """幂等键：同一渠道、同一 URL、同一天只会入队一次（测试与正式分开计）"""
+        date = date or datetime.now().strftime('%Y%m%d')
+        normalized = ArticleDeduplicator.normalize_url(url)
+        mode = '|test' if is_test else ''
+        return hashlib.sha256(f"{channel}|{normalized}|{date}{mode}".encode('utf-8')).hexdigest()[:32]
+
+    def enqueue(self, article: Article, title: str, content: str,
+                channel: str = 'discord_forum', record_dedup: bool = True) -> str:
+        """
+        生成的帖子入队
+
+        同一幂等键已在待投递 / 已投递时忽略；已放弃（failed）的记录用新内容重置为待投递
+
+        Returns:
+            幂等键
+        """
+        key = self.make_key(channel, article.url, is_test=not record_dedup)
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """INSERT INTO outbox
+                   (idempotency_key, channel, normalized_url, title, content, article, record_dedup,
+                    status, attempts, created_at, updated_at, next_attempt_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0, ?, ?, ?)
+                   ON CONFLICT (idempotency_key) DO UPDATE
+                   SET title = excluded.title, content = excluded.content, article = excluded.article,
+                       status = excluded.status, attempts = 0, last_error = NULL,
+                       updated_at = excluded.updated_at, next_attempt_at = excluded.next_attempt_at
+                   WHERE outbox.status = ?""",
+                (key, channel, ArticleDeduplicator.normalize_url(article.url), title, content,
+                 json.dumps(article.to_dict(), ensure_ascii=False), int(record_dedup),
+                 STATUS_PENDING, now, now, now, STATUS_FAILED)
+            )
+        return key
+
+    def pending_urls(self) -> Set[str]:
+        """尚未投递的帖子 URL（规范化），用于跳过重复生成"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT normalized_url FROM outbox WHERE status IN (?, ?)",
+                (STATUS_PENDING, STATUS_SENDING)
+            ).fetchall()
+        return {row['normalized_url'] for row in rows}
+
+    def queued_urls(self, is_test: bool = False) -> Set[str]:
+        """
+        不应再生成内容的 URL（规范化）：所有尚未投递的帖子，加上今天已入队过的帖子（任何状态，按测试 / 正式区分）
+
+        今天已投递失败的帖子同一天的幂等键不变，再生成一次也只会重复失败的投递，不如把名额留给其他候选
+        """
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        with self._connect() as conn:
+            rows = conn.execute(
+                """SELECT normalized_url FROM outbox
+                   WHERE status IN (?, ?) OR (created_at >= ? AND record_dedup = ?)""",
+                (STATUS_PENDING, STATUS_SENDING, today, int(not is_test))
+            ).fetchall()
+        return {row['normalized_url'] for row in rows}
+
+    def claim_due(self, limit: int = 50, channel: str = None) -> List[Dict[str, Any]]:
+        """
+        领取到期的待投递帖子并标记为 sending
+
+        超时未完成的 sending 记录（进程中断）也会被重新领取
+        """
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            query = """SELECT * FROM outbox
+                       WHERE ((status = ? AND next_attempt_at <= ?) OR (status = ? AND updated_at <= ?))"""
+            params: List[Any] = [STATUS_PENDING, now, STATUS_SENDING, now - self.sending_timeout]
+            if channel:
+                query += " AND channel = ?"
+                params.append(channel)
+            query += " ORDER BY created_at LIMIT ?"
+            params.append(limit)
+            rows = [dict(row) for row in conn.execute(query, params).fetchall()]
+            conn.executemany(
+                "UPDATE outbox SET status = ?, updated_at = ? WHERE idempotency_key = ?",
+                [(STATUS_SENDING, now, row['idempotency_key']) for row in rows]
+            )
+        return rows
+
+    def mark_sent(self, key: str):
+        """标记投递成功"""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, updated_at = ?, sent_at = ?, last_error = NULL WHERE idempotency_key = ?",
+                (STATUS_SENT, now, now, key)
+            )
+
+    def release(self, key: str):
+        """未实际投递的记录放回待投递（不计入投递次数）"""
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE outbox SET status = ?, updated_at = ?, next_attempt_at = ? WHERE idempotency_key = ?",
+                (STATUS_PENDING, now, now, key)
+            )
+
+    def mark_failed(self, key: str, error: str, max_attempts: int = 5, backoff: float = 60):
+        """
+        标记投递失败：未超过最大次数则按指数退避重新排队，否则置为 failed
+        """
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute("SELECT attempts FROM outbox WHERE idempotency_key = ?", (key,)).fetchone()
+            attempts = (row['attempts'] if row else 0) + 1
+            status = STATUS_FAILED if attempts >= max_attempts else STATUS_PENDING
+            conn.execute(
+                """UPDATE outbox SET status = ?, attempts = ?, last_error = ?, updated_at = ?, next_attempt_at = ?
+                   WHERE idempotency_key = ?""",
+                (status, attempts, error[:500], now, now + backoff * (2 ** (attempts - 1)), key)
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """各状态的帖子数量"""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM outbox GROUP BY status").fetchall()
+        return {row['status']: row['n'] for row in rows}
+
+    def purge(self, older_than_days: float = 7) -> int:
+        """清理已投递/已放弃的旧记录"""
+        cutoff = time.time() - older_than_days * 86400
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM outbox WHERE status IN (?, ?) AND updated_at < ?",
+                (STATUS_SENT, STATUS_FAILED, cutoff)
+            )
+            return cursor.rowcount
+
+class OutboxWorker:
+    """发件箱投递 worker：投递到期帖子，确认成功后写入去重记录"""
+
+    def __init__(self, outbox: Outbox, send_fn: Callable[[Dict[str, Any]], Any],
+                 deduplicator: Optional[ArticleDeduplicator] = None,
+                 max_attempts: int = 5, backoff: float = 60):
+        """
+        Args:
+            outbox: 发件箱
+            send_fn: 投递函数，接收一行记录（含 channel/title/content/article），
+                     返回是否成功（bool 或含 success/error 的字典），
+                     也可以返回 Future 以便多条记录并发投递
+            deduplicator: 去重器，投递成功后记录（为空则不记录）
+            max_attempts: 最大投递次数
+            backoff: 首次重试的退避秒数
+        """
+        self.outbox = outbox
+        self.send_fn = send_fn
+        self.deduplicator = deduplicator
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.timed_out = False
+
+    @staticmethod
+    def _resolve(outcome: Any) -> Tuple[bool, str]:
+        """把投递函数的返回值统一为 (是否成功, 错误信息)"""
+        if isinstance(outcome, Future):
+            outcome = outcome.result()
+        if isinstance(outcome, dict):
+            success = bool(outcome.get('success'))
+            return success, '' if success else (outcome.get('error') or 'send failed')
+        success = bool(outcome)
+        return success, '' if success else 'send returned False'
+
+    def drain(self, limit: int = 50, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        投递所有到期帖子（先全部提交，再按领取顺序收集结果）
+
+        Args:
+            limit: 最多领取的条数
+            timeout: 等待投递结果的总秒数；超时后尚未开始的投递被取消并放回发件箱，
+                     已在进行中的投递仍等待其完成（self.timed_out 记录是否超时）
+
+        Returns:
+            每条投递结果 {key, channel, title, source, success, error}，
+            被取消的记录额外带 deferred=True
+        """
+        self.timed_out = False
+        ends_at = time.monotonic() + timeout if timeout is not None else None
+        rows = self.outbox.claim_due(limit=limit)
+        outcomes = []
+        for row in rows:
+            try:
+                outcomes.append(self.send_fn(row))
+            except Exception as e:
+                outcomes.append(e)
+
+        results = []
+        delivered = []
+
+        for row, outcome in zip(rows, outcomes):
+            article = Article.from_dict(json.loads(row['article']))
+            key = row['idempotency_key']
+            result = {
+                'key': key,
+                'channel': row['channel'],
+                'title': article.title[:40],
+                'source': article.source,
+            }
+
+            if isinstance(outcome, Future) and ends_at is not None and not self.timed_out:
+                try:
+                    outcome.result(timeout=max(0.0, ends_at - time.monotonic()))
+                except FutureTimeoutError:
+                    # 超时：取消所有尚未开始的投递，进行中的投递继续等待完成
+                    self.timed_out = True
+                    for pending in outcomes:
+                        if isinstance(pending, Future):
+                            pending.cancel()
+                except Exception:
+                    pass
+
+            if isinstance(outcome, Future) and outcome.cancelled():
+                self.outbox.release(key)
+                results.append(dict(result, success=False, error='超过运行截止时间，留待下次投递', deferred=True))
+                continue
+
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                success, error = self._resolve(outcome)
+            except Exception as e:
+                success, error = False, str(e)
+
+            if success:
+                self.outbox.mark_sent(key)
+                if row['record_dedup']:
+                    delivered.append(article)
+            else:
+                self.outbox.mark_failed(key, error, max_attempts=self.max_attempts, backoff=self.backoff)
+                print(f"   ⚠️ 投递失败（第{row['attempts'] + 1}次）: {article.title[:40]} - {error}", file=sys.stderr)
+
+            results.append(dict(result, success=success, error=error))
+
+        # 只记录确认投递成功的文章
+        if delivered and self.deduplicator:
+            self.deduplicator.record_sent_articles(delivered)
+
+        return results
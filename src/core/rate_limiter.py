@@ -0,0 +1,130 @@
+"""
+Discord Webhook 速率限制调度器
+按 webhook 读取 X-RateLimit-* 响应头，在桶允许的范围内尽快发送，
+只在桶耗尽或收到 429 时等待必要的时间，并限制重试次数
+
+ForumPublisher、TextPublisher 和 DiscordWebhookSender 共用同一套调度器
+"""
+import logging
+import threading
+import time
+import urllib.parse
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class DiscordRateLimiter:
+    """单个 webhook 的速率限制状态"""
+
+    def __init__(self, max_retries: int = 3, max_wait: float = 60.0):
+        """
+        Args:
+            max_retries: 429 后的最大重试次数
+            max_wait: 单次等待上限（秒），超过则放弃重试
+        """
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self.bucket: Optional[str] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.global_reset_at = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """占用一个发送额度，返回发送前需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self.global_reset_at - now)
+            if self.remaining is not None and self.remaining <= 0 and self.reset_at > now:
+                wait = max(wait, self.reset_at - now)
+            elif self.remaining is not None:
+                self.remaining -= 1
+            return wait
+
+    def _update(self, headers: Dict[str, Any]):
+        """根据响应头更新桶状态"""
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset_after = headers.get('X-RateLimit-Reset-After')
+        bucket = headers.get('X-RateLimit-Bucket')
+        with self._lock:
+            if bucket and bucket != self.bucket:
+                self.bucket = bucket
+            if remaining is not None:
+                try:
+                    self.remaining = int(remaining)
+                except ValueError:
+                    pass
+            if reset_after is not None:
+                try:
+                    self.reset_at = time.monotonic() + float(reset_after)
+                except ValueError:
+                    pass
+
+    @staticmethod
+    def _retry_after(response) -> float:
+        """从 429 响应中读取等待时间（优先 JSON 中的小数秒）"""
+        try:
+            return float(response.json().get('retry_after'))
+        except Exception:
+            pass
+        for header in ('Retry-After', 'X-RateLimit-Reset-After'):
+            value = response.headers.get(header)
+            if value is not None:
+                try:
+                    return float(value)
+                except ValueError:
+                    continue
+        return 1.0
+
+    def send(self, request_fn: Callable[[], Any]):
+        """
+        按速率限制发送请求
+
+        Args:
+            request_fn: 执行一次 HTTP 请求并返回 requests.Response 的函数
+
+        Returns:
+            最后一次请求的响应（重试用尽后可能仍是 429）
+        """
+        attempt = 0
+        while True:
+            wait = self._reserve()
+            if wait > 0:
+                logger.info(f"⏳ 速率限制桶已耗尽，等待 {wait:.2f} 秒")
+                time.sleep(wait)
+
+            response = request_fn()
+            self._update(response.headers)
+
+            if response.status_code != 429:
+                return response
+
+            retry_after = self._retry_after(response)
+            is_global = str(response.headers.get('X-RateLimit-Global', '')).lower() == 'true'
+            with self._lock:
+                reset_at = time.monotonic() + retry_after
+                if is_global:
+                    self.global_reset_at = reset_at
+                else:
+                    self.remaining = 0
+                    self.reset_at = reset_at
+
+            if attempt >= self.max_retries or retry_after > self.max_wait:
+                logger.warning(f"⚠️ 速率限制重试已用尽（{attempt}/{self.max_retries}，retry_after={retry_after:.2f}s）")
+                return response
+
+            attempt += 1
+            logger.warning(f"⏳ 速率限制(429{' global' if is_global else ''})，{retry_after:.2f} 秒后第 {attempt} 次重试")
+
+# webhook -> 调度器
+_limiters: Dict[str, DiscordRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(webhook_url: str, max_retries: int = 3) -> DiscordRateLimiter:
+    """获取 webhook 对应的调度器（同一 webhook 在进程内共享状态）"""
+    key = urllib.parse.urlsplit(webhook_url or '')._replace(query='', fragment='').geturl()
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = DiscordRateLimiter(max_retries=max_retries)
+        return limiter
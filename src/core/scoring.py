@@ -0,0 +1,223 @@
+"""
+批量热度打分
+把整批候选转成 NumPy 列（来源、各互动信号、发布时间）后一次性计算：
+  热度 = 来源权重 + engagement_weight × 来源内互动百分位 + recency_weight × exp(-发布小时数 / decay_hours)
+       + velocity_weight × 来源内增速百分位 + acceleration_weight × 来源内加速度百分位
+
+互动值是各信号 log1p 后的加权和，只在同一来源内按百分位比较，
+500 分的 HN 帖子不会再压过所有 Product Hunt / GitHub 候选。
+增速 / 加速度来自跨运行的趋势索引（src/core/trend_index.py），没有历史的文章按 0.5 计，不会因为是新条目被压低
+
+配置 advanced.scoring:
+    source_weights: 来源权重
+    signal_weights: 各互动信号的权重（score / comments / votes / stars / likes / upvotes / retweets）
+    engagement_weight: 互动百分位的权重，默认 2.0
+    recency_weight: 时间衰减项的权重，默认 2.0
+    decay_hours: 指数衰减的时间常数（小时），默认 6
+    unknown_age_hours: 没有发布时间的文章按多少小时前计算，默认 12
+    velocity_weight: 增速百分位的权重，默认 1.0
+    acceleration_weight: 加速度百分位的权重，默认 0.5
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.sources.base import Article, NUMERIC_FIELDS
+from .trend_index import TrendIndex, get_trend_index
+
+DEFAULT_SOURCE_WEIGHTS = {
+    'producthunt': 1.5,
+    'twitter': 1.4,
+    'reddit': 1.2,
+    'hackernews': 1.1,
+    'github_trending': 1.0,
+    'tavily': 0.9,
+}
+
+DEFAULT_SIGNAL_WEIGHTS = {
+    'score': 1.0,
+    'comments': 1.5,
+    'votes': 1.0,
+    'stars': 1.0,
+    'likes': 1.0,
+    'upvotes': 1.0,
+    'retweets': 1.0,
+}
+
+class HotScoreEngine:
+    """批量热度打分"""
+
+    def __init__(self, source_weights: Dict[str, float] = None, signal_weights: Dict[str, float] = None,
+                 engagement_weight: float = 2.0, recency_weight: float = 2.0, decay_hours: float = 6.0,
+                 unknown_age_hours: float = 12.0, default_source_weight: float = 0.5,
+                 velocity_weight: float = 1.0, acceleration_weight: float = 0.5,
+                 trend_index: Optional[TrendIndex] = None):
+        self.source_weights = dict(DEFAULT_SOURCE_WEIGHTS, **(source_weights or {}))
+        weights = dict(DEFAULT_SIGNAL_WEIGHTS, **(signal_weights or {}))
+        self.signal_weights = np.array([weights.get(name, 0.0) for name in NUMERIC_FIELDS], dtype=np.float64)
+        self.engagement_weight = engagement_weight
+        self.recency_weight = recency_weight
+        self.decay_hours = decay_hours
+        self.unknown_age_hours = unknown_age_hours
+        self.default_source_weight = default_source_weight
+        self.velocity_weight = velocity_weight
+        self.acceleration_weight = acceleration_weight
+        self.trend_index = trend_index
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], trend_index: Optional[TrendIndex] = None) -> "HotScoreEngine":
+        """读取 advanced.scoring"""
+        settings = config.get('advanced', {}).get('scoring', {})
+        return cls(
+            source_weights=settings.get('source_weights'),
+            signal_weights=settings.get('signal_weights'),
+            engagement_weight=settings.get('engagement_weight', 2.0),
+            recency_weight=settings.get('recency_weight', 2.0),
+            decay_hours=settings.get('decay_hours', 6.0),
+            unknown_age_hours=settings.get('unknown_age_hours', 12.0),
+            velocity_weight=settings.get('velocity_weight', 1.0),
+            acceleration_weight=settings.get('acceleration_weight', 0.5),
+            trend_index=trend_index,
+        )
+
+    def score(self, articles: Sequence[Article], now: Optional[float] = None) -> np.ndarray:
+        """返回与 articles 一一对应的热度分数"""
+        n = len(articles)
+        if n == 0:
+            return np.zeros(0, dtype=np.float64)
+        now = time.time() if now is None else now
+
+        # 列化：来源编码、信号矩阵（缺失为 0）、发布时间戳（缺失为 NaN）
+        source_names = [article.source for article in articles]
+        names, groups = np.unique(np.array(source_names, dtype=str), return_inverse=True)
+        signals = np.array(
+            [[getattr(article, field) or 0 for field in NUMERIC_FIELDS] for article in articles],
+            dtype=np.float64
+        )
+        published = np.array([_timestamp(article) for article in articles], dtype=np.float64)
+
+        engagement = np.log1p(np.clip(signals, 0, None)) @ self.signal_weights
+        percentile = _group_percentile(groups.ravel(), engagement)
+
+        age_hours = np.where(np.isnan(published), self.unknown_age_hours, (now - published) / 3600.0)
+        recency = np.exp(-np.clip(age_hours, 0, None) / self.decay_hours)
+
+        weights = np.array([self.source_weights.get(name, self.default_source_weight) for name in names])
+        scores = weights[groups.ravel()] + self.engagement_weight * percentile + self.recency_weight * recency
+        if self.trend_index is not None and (self.velocity_weight or self.acceleration_weight):
+            velocity, acceleration = self.trend_index.lookup(articles)
+            scores += self.velocity_weight * _known_percentile(groups.ravel(), velocity)
+            scores += self.acceleration_weight * _known_percentile(groups.ravel(), acceleration)
+        return scores
+
+    def score_fn(self, articles: Sequence[Article], now: Optional[float] = None) -> Callable[[Article], float]:
+        """
+        一次算好整批分数，返回按文章取分的函数（供 sorted / top_k 使用）
+
+        不在这一批中的文章单独打分（来源内百分位按 0.5 计）
+        """
+        scores = dict(zip(map(id, articles), self.score(articles, now).tolist()))
+
+        def lookup(article: Article) -> float:
+            score = scores.get(id(article))
+            return score if score is not None else float(self.score([article], now)[0])
+        return lookup
+
+    def max_score(self) -> float:
+        """各项都取满时的分数上限"""
+        ceiling = max(self.source_weights.values(), default=self.default_source_weight)
+        ceiling += self.engagement_weight + self.recency_weight
+        if self.trend_index is not None:
+            ceiling += self.velocity_weight + self.acceleration_weight
+        return ceiling
+
+    def heat(self, articles: Sequence[Article], now: Optional[float] = None) -> np.ndarray:
+        """0~100 的热度值（分数 / 分数上限，供视频流程的 heat_score 使用）"""
+        return np.round(np.clip(100.0 * self.score(articles, now) / self.max_score(), 0, 100), 1)
+
+    def rank(self, articles: Sequence[Article], now: Optional[float] = None) -> List[Article]:
+        """按热度从高到低排序（同分保持原顺序）"""
+        order = np.argsort(-self.score(articles, now), kind='stable')
+        return [articles[i] for i in order]
+
+def _group_percentile(groups: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    每个值在所属分组内的中位百分位：(小于它的个数 + 0.5 × 与它相等的个数) / 分组大小
+
+    只有一条或全部相同的分组得到 0.5
+    """
+    n = len(values)
+    order = np.lexsort((values, groups))
+    sorted_groups = groups[order]
+    sorted_values = values[order]
+
+    group_change = np.empty(n, dtype=bool)
+    group_change[0] = True
+    group_change[1:] = sorted_groups[1:] != sorted_groups[:-1]
+    group_starts = np.flatnonzero(group_change)
+    group_sizes = np.diff(np.append(group_starts, n))
+    group_index = np.cumsum(group_change) - 1
+
+    run_change = group_change.copy()
+    run_change[1:] |= sorted_values[1:] != sorted_values[:-1]
+    run_starts = np.flatnonzero(run_change)
+    run_lengths = np.diff(np.append(run_starts, n))
+    run_index = np.cumsum(run_change) - 1
+
+    below = run_starts[run_index] - group_starts[group_index]
+    percentile = np.empty(n, dtype=np.float64)
+    percentile[order] = (below + 0.5 * run_lengths[run_index]) / group_sizes[group_index]
+    return percentile
+
+def _known_percentile(groups: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """只在有值（非 NaN）的条目之间计算分组百分位，缺失的记为 0.5"""
+    percentile = np.full(len(values), 0.5)
+    known = ~np.isnan(values)
+    if known.any():
+        percentile[known] = _group_percentile(groups[known], values[known])
+    return percentile
+
+def _timestamp(article: Article) -> float:
+    """发布时间戳（published_at 字段或 metadata['published_at'] 的 ISO 字符串），缺失为 NaN"""
+    value = article.published_at or article.get_meta('published_at')
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return float('nan')
+    if isinstance(value, datetime):
+        # 无时区的时间按本地时间处理
+        return value.timestamp()
+    return float('nan')
+
+# 单例
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_hot_score_engine() -> HotScoreEngine:
+    """获取打分引擎单例（参数读取 config.json -> advanced.scoring，启用趋势索引时带上增速 / 加速度）"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            config = {}
+            try:
+                from .config_loader import load_config
+                config = load_config()
+            except Exception:
+                pass
+            trend_index = None
+            try:
+                trend_index = get_trend_index()
+            except Exception:
+                pass
+            _engine = HotScoreEngine.from_config(config, trend_index)
+        return _engine
+
+def reset_hot_score_engine():
+    """丢弃单例，下次获取时按最新配置重建（常驻进程重新加载配置后调用）"""
+    global _engine
+    with _engine_lock:
+        _engine = None
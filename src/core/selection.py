@@ -0,0 +1,78 @@
+"""
+带多样性约束的 top-K 选择
+每个分组（来源 / 类别）维护一个大小为 max_per_group 的最小堆，被挤出或超出上限的条目进入大小为 k 的溢出堆，
+最后从各分组保留的条目中取前 k 条；满足上限的条目不足 min_count 时，再从溢出堆按分数补足，
+补足的条目排在所有满足上限的条目之后（调用方按顺序取前几条时，多样性不会被放宽的条目挤掉）。
+整体 O(n log k)，结果与“全量排序后逐条套用上限”一致，并且只要候选够多就一定能拿到 min_count 条
+
+    selected = select_diverse(articles, k=5, score_fn=score, group_fn=lambda a: a.source,
+                              max_per_group=2, min_count=5)
+"""
+import heapq
+import itertools
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+_Entry = Tuple[float, int, T]
+
+def select_diverse(items: Iterable[T], k: int, score_fn: Callable[[T], float],
+                   group_fn: Optional[Callable[[T], Hashable]] = None,
+                   max_per_group: Optional[int] = None, min_count: int = 0) -> List[T]:
+    """
+    选出分数最高的 k 条，每个分组最多 max_per_group 条
+
+    Args:
+        items: 候选
+        k: 最多选择的条数
+        score_fn: 打分函数
+        group_fn: 分组函数（如来源、类别），None 表示不做分组限制
+        max_per_group: 每个分组的上限，None 表示不限
+        min_count: 至少返回的条数（不超过 k 和候选数）；分组上限导致不足时放宽上限补足
+    Returns:
+        满足上限的条目按分数从高到低在前（同分保持输入顺序），放宽上限补足的条目按分数排在其后
+    """
+    if k <= 0:
+        return []
+    cap = max_per_group if group_fn is not None and max_per_group is not None else None
+    seq = itertools.count()
+
+    groups: Dict[Hashable, List[_Entry]] = {}
+    ungrouped: List[_Entry] = []
+    overflow: List[_Entry] = []
+
+    def keep(heap: List[_Entry], entry: _Entry, limit: int) -> Optional[_Entry]:
+        """把 entry 放入容量为 limit 的最小堆，返回被挤出的条目"""
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+            return None
+        if entry[:2] <= heap[0][:2]:
+            return entry
+        return heapq.heapreplace(heap, entry)
+
+    for item in items:
+        entry = (score_fn(item), -next(seq), item)
+        if cap is None:
+            keep(ungrouped, entry, k)
+            continue
+        heap = groups.setdefault(group_fn(item), [])
+        evicted = keep(heap, entry, cap) if cap > 0 else entry
+        if evicted is not None:
+            keep(overflow, evicted, k)
+
+    if cap is None:
+        return _ordered(ungrouped)
+
+    # 各分组保留的条目合在一起取前 k 条
+    selected: List[_Entry] = []
+    for heap in groups.values():
+        for entry in heap:
+            keep(selected, entry, k)
+
+    # 不足 min_count 时用溢出堆中分数最高的条目补足
+    shortfall = min(min_count, k) - len(selected)
+    relaxed = heapq.nlargest(shortfall, overflow, key=lambda entry: entry[:2]) if shortfall > 0 else []
+    return _ordered(selected) + _ordered(relaxed)
+
+def _ordered(entries: List[_Entry]) -> List[T]:
+    return [entry[2] for entry in sorted(entries, key=lambda entry: entry[:2], reverse=True)]
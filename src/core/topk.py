@@ -0,0 +1,87 @@
+"""
+有界 top-K
+用大小为 k 的最小堆保留分数最高的 k 条，O(n log k)；
+堆满后堆顶分数就是当前门槛（cutoff），按分数降序逐条请求的数据源（如 HackerNews）可以据此提前停止请求
+
+    top = TopK(10, score_fn)
+    for post in fetch_posts_lazily():
+        top.offer(post)
+        ...                          # top.competitive(post) 为 False 时可以停止请求剩余条目
+    articles = top.results()
+"""
+import heapq
+import itertools
+import math
+import threading
+from typing import Callable, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+class TopK(Generic[T]):
+    """保留分数最高的 k 条（线程安全，可由多个数据源流并发写入）"""
+
+    def __init__(self, k: int, score_fn: Callable[[T], float]):
+        self.k = k
+        self.score_fn = score_fn
+        self.offered = 0
+        # (分数, -到达序号, 条目)：序号唯一，条目本身不参与比较；同分时先到的排在前面，与 sorted(reverse=True) 的稳定顺序一致
+        self._heap: List[Tuple[float, int, T]] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @property
+    def full(self) -> bool:
+        return len(self._heap) >= self.k
+
+    @property
+    def cutoff(self) -> float:
+        """进入 top-K 需要超过的分数（未满时为 -inf）"""
+        with self._lock:
+            return self._heap[0][0] if self.k > 0 and len(self._heap) >= self.k else -math.inf
+
+    def competitive(self, item: T, score: Optional[float] = None) -> bool:
+        """该条目现在还能否进入 top-K"""
+        if self.k <= 0:
+            return False
+        return (self.score_fn(item) if score is None else score) > self.cutoff
+
+    def offer(self, item: T, score: Optional[float] = None) -> bool:
+        """
+        尝试加入一条
+
+        Returns:
+            是否进入了 top-K
+        """
+        if self.k <= 0:
+            return False
+        if score is None:
+            score = self.score_fn(item)
+        with self._lock:
+            self.offered += 1
+            entry = (score, -next(self._seq), item)
+            if len(self._heap) < self.k:
+                heapq.heappush(self._heap, entry)
+                return True
+            if score <= self._heap[0][0]:
+                return False
+            heapq.heapreplace(self._heap, entry)
+            return True
+
+    def consume(self, items: Iterable[T]) -> int:
+        """把一个流全部交给 offer，返回进入 top-K 的条数"""
+        return sum(1 for item in items if self.offer(item))
+
+    def results(self) -> List[T]:
+        """按分数从高到低返回"""
+        with self._lock:
+            entries = sorted(self._heap, key=lambda entry: (entry[0], entry[1]), reverse=True)
+        return [entry[2] for entry in entries]
+
+def top_k(items: Iterable[T], k: int, score_fn: Callable[[T], float]) -> List[T]:
+    """取分数最高的 k 条（同分保持输入顺序）"""
+    top = TopK(k, score_fn)
+    top.consume(items)
+    return top.results()
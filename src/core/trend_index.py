@@ -0,0 +1,328 @@
+"""
+跨运行的热度趋势索引
+按 (规范化 URL, 主信号) 持久化每个条目的互动信号时间序列（GitHub stars、HN score、PH votes、Reddit score 等），
+每次采集增量更新平滑后的 增速（每小时增量）和 加速度（增速每小时的变化），供打分引擎区分
+“一小时涨了 3000 star” 和 “几个月一直停在 3 万 star” 的条目
+
+存放在 SQLite（memory/trend_index.sqlite3）：
+  - trend_state: 每个条目一行，保存最近一次观测和 增速 / 加速度（指数加权平滑），更新与查询都是 O(1)
+  - trend_points: 历史观测，原始点超过 raw_retention_hours 后合并为小时桶，小时桶超过 hourly_retention_days
+    后合并为天桶（每个桶保留桶内最后一次观测），天桶超过 daily_retention_days 后删除
+
+    index = get_trend_index()
+    observe_articles(articles)                   # 采集后写入本次观测
+    velocity, acceleration = index.lookup(articles)
+
+配置 advanced.trends:
+    enabled: 是否启用，默认 true
+    smoothing_hours: 指数加权平滑的时间常数（小时），默认 3
+    min_interval_minutes: 同一条目两次观测的最小间隔，更近的观测（如读到缓存结果）忽略，默认 10
+    raw_retention_hours: 原始观测保留时长，默认 24
+    hourly_retention_days: 小时桶保留天数，默认 7
+    daily_retention_days: 天桶（以及长期未再出现的条目）保留天数，默认 90
+"""
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.sources.base import Article
+from .deduplicator import ArticleDeduplicator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'memory', 'trend_index.sqlite3')
+
+# 各来源的主信号（互动计数）；None 表示该来源没有互动信号（Tavily 的 score 是搜索相关度，不是热度）
+SOURCE_SIGNALS: Dict[str, Optional[str]] = {
+    'github_trending': 'stars',
+    'producthunt': 'votes',
+    'hackernews': 'score',
+    'reddit': 'score',
+    'moltbook': 'upvotes',
+    'twitter': 'likes',
+    'tavily': None,
+}
+
+# 未登记的来源按顺序取第一个有值的信号；score 含义因来源而异，不作为兜底
+PRIMARY_SIGNALS = ('stars', 'votes', 'upvotes', 'likes')
+
+HOUR = 3600
+DAY = 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_state (
+    entity TEXT NOT NULL,
+    signal TEXT NOT NULL,
+    value REAL NOT NULL,
+    observed_at REAL NOT NULL,
+    velocity REAL,
+    acceleration REAL,
+    PRIMARY KEY (entity, signal)
+);
+CREATE TABLE IF NOT EXISTS trend_points (
+    entity TEXT NOT NULL,
+    signal TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    bucket REAL NOT NULL,
+    value REAL NOT NULL,
+    observed_at REAL NOT NULL,
+    PRIMARY KEY (entity, signal, resolution, bucket)
+);
+CREATE INDEX IF NOT EXISTS idx_trend_points_age ON trend_points (resolution, observed_at);
+"""
+
+# (最近一次的值, 观测时间, 增速, 加速度)，观测不足时增速 / 加速度为 None
+_State = Tuple[float, float, Optional[float], Optional[float]]
+
+def primary_signal(article: Article) -> Optional[Tuple[str, float]]:
+    """文章的主信号 (名称, 数值)，没有互动信号返回 None"""
+    if article.source in SOURCE_SIGNALS:
+        name = SOURCE_SIGNALS[article.source]
+        value = getattr(article, name) if name else None
+        return (name, float(value)) if value is not None else None
+    for name in PRIMARY_SIGNALS:
+        value = getattr(article, name)
+        if value is not None:
+            return name, float(value)
+    return None
+
+def _entity_key(article: Article) -> Optional[Tuple[str, str, float]]:
+    signal = primary_signal(article)
+    if signal is None or not article.url:
+        return None
+    return ArticleDeduplicator.normalize_url(article.url), signal[0], signal[1]
+
+class TrendIndex:
+    """基于 SQLite 的增速 / 加速度索引（跨进程共享）"""
+
+    def __init__(self, path: str = None, smoothing_hours: float = 3.0, min_interval_minutes: float = 10,
+                 raw_retention_hours: float = 24, hourly_retention_days: float = 7,
+                 daily_retention_days: float = 90, reload_seconds: float = 60):
+        """
+        Args:
+            path: SQLite 文件路径，默认 memory/trend_index.sqlite3
+            smoothing_hours: 指数加权平滑的时间常数（小时）
+            min_interval_minutes: 同一条目两次观测的最小间隔（分钟）
+            raw_retention_hours: 原始观测保留时长（小时）
+            hourly_retention_days: 小时桶保留天数
+            daily_retention_days: 天桶保留天数
+            reload_seconds: 内存中的状态表多久从数据库重新加载一次（其他进程也会写入）
+        """
+        self.path = path or DEFAULT_INDEX_PATH
+        self.smoothing_hours = smoothing_hours
+        self.min_interval = min_interval_minutes * 60
+        self.raw_retention = raw_retention_hours * HOUR
+        self.hourly_retention = hourly_retention_days * DAY
+        self.daily_retention = daily_retention_days * DAY
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._state: Dict[Tuple[str, str], _State] = {}
+        self._loaded_at = 0.0
+        self._compacted_at = 0.0
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """打开连接，正常退出时提交，异常时回滚，最后关闭"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _advance(self, previous: Optional[_State], value: float, now: float) -> Optional[_State]:
+        """
+        在上一状态上加入一次观测，间隔过短时返回 None（不更新）
+
+        增速取两次观测间的每小时增量，按间隔做指数加权平滑；加速度是平滑增速的每小时变化，同样平滑
+        """
+        if previous is None:
+            return value, now, None, None
+        last_value, last_at, velocity, acceleration = previous
+        elapsed = now - last_at
+        if elapsed < self.min_interval:
+            return None
+        hours = elapsed / HOUR
+        alpha = 1 - math.exp(-hours / self.smoothing_hours)
+        instant = (value - last_value) / hours
+        if velocity is None:
+            return value, now, instant, None
+        smoothed = velocity + alpha * (instant - velocity)
+        change = (smoothed - velocity) / hours
+        acceleration = change if acceleration is None else acceleration + alpha * (change - acceleration)
+        return value, now, smoothed, acceleration
+
+    def observe(self, articles: Iterable[Article], now: Optional[float] = None) -> int:
+        """写入一批观测（同一条目在批内出现多次时取第一次），返回实际更新的条目数"""
+        now = time.time() if now is None else now
+        batch: Dict[Tuple[str, str], float] = {}
+        for article in articles:
+            key = _entity_key(article)
+            if key is not None:
+                batch.setdefault(key[:2], key[2])
+        if not batch:
+            return 0
+
+        keys = list(batch)
+        updates = []
+        with self._lock, self._connect() as conn:
+            # 在同一事务中读取最新状态再写回，多个进程同时采集时不会互相覆盖
+            conn.execute("BEGIN IMMEDIATE")
+            previous = self._select_states(conn, keys)
+            for key in keys:
+                state = self._advance(previous.get(key), batch[key], now)
+                if state is not None:
+                    updates.append((key, state))
+            conn.executemany(
+                "INSERT OR REPLACE INTO trend_state (entity, signal, value, observed_at, velocity, acceleration) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [key + state for key, state in updates]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO trend_points (entity, signal, resolution, bucket, value, observed_at) "
+                "VALUES (?, ?, 0, ?, ?, ?)",
+                [key + (state[1], state[0], state[1]) for key, state in updates]
+            )
+            for key, state in updates:
+                self._state[key] = state
+
+        if now - self._compacted_at >= HOUR:
+            self.compact(now)
+        return len(updates)
+
+    @staticmethod
+    def _select_states(conn: sqlite3.Connection, keys: Sequence[Tuple[str, str]]) -> Dict[Tuple[str, str], _State]:
+        states = {}
+        entities = sorted({entity for entity, _ in keys})
+        wanted = set(keys)
+        for offset in range(0, len(entities), 500):
+            chunk = entities[offset:offset + 500]
+            rows = conn.execute(
+                "SELECT entity, signal, value, observed_at, velocity, acceleration FROM trend_state "
+                f"WHERE entity IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            for entity, signal, value, observed_at, velocity, acceleration in rows:
+                if (entity, signal) in wanted:
+                    states[(entity, signal)] = (value, observed_at, velocity, acceleration)
+        return states
+
+    def _snapshot(self) -> Dict[Tuple[str, str], _State]:
+        """内存中的状态表（超过 reload_seconds 后从数据库重新加载）"""
+        if time.time() - self._loaded_at >= self.reload_seconds:
+            with self._lock:
+                try:
+                    with self._connect() as conn:
+                        rows = conn.execute(
+                            "SELECT entity, signal, value, observed_at, velocity, acceleration FROM trend_state"
+                        ).fetchall()
+                    self._state = {(row[0], row[1]): row[2:] for row in rows}
+                except sqlite3.Error as e:
+                    # 读取失败时沿用内存中的状态
+                    logger.warning(f"加载趋势索引失败: {e}")
+                self._loaded_at = time.time()
+        return self._state
+
+    def features(self, article: Article) -> Tuple[Optional[float], Optional[float]]:
+        """单篇文章的 (增速, 加速度)，没有足够历史时为 None"""
+        key = _entity_key(article)
+        state = self._snapshot().get(key[:2]) if key else None
+        return (state[2], state[3]) if state else (None, None)
+
+    def lookup(self, articles: Sequence[Article]) -> Tuple[np.ndarray, np.ndarray]:
+        """整批文章的 (增速, 加速度) 列，没有足够历史的为 NaN"""
+        state = self._snapshot()
+        velocity = np.full(len(articles), np.nan)
+        acceleration = np.full(len(articles), np.nan)
+        for i, article in enumerate(articles):
+            key = _entity_key(article)
+            found = state.get(key[:2]) if key else None
+            if found:
+                if found[2] is not None:
+                    velocity[i] = found[2]
+                if found[3] is not None:
+                    acceleration[i] = found[3]
+        return velocity, acceleration
+
+    def history(self, url: str, signal: Optional[str] = None) -> List[Tuple[float, str, float]]:
+        """条目的历史观测 [(时间, 信号, 数值)]，按时间排序（较早的部分是小时桶 / 天桶）"""
+        query = "SELECT observed_at, signal, value FROM trend_points WHERE entity = ?"
+        params: list = [ArticleDeduplicator.normalize_url(url)]
+        if signal:
+            query += " AND signal = ?"
+            params.append(signal)
+        with self._connect() as conn:
+            return [tuple(row) for row in conn.execute(query + " ORDER BY observed_at", params)]
+
+    def compact(self, now: Optional[float] = None):
+        """原始观测合并为小时桶、小时桶合并为天桶（保留桶内最后一次观测），删除过期的天桶和条目"""
+        now = time.time() if now is None else now
+        try:
+            with self._lock, self._connect() as conn:
+                for resolution, source, cutoff in ((HOUR, 0, now - self.raw_retention),
+                                                   (DAY, HOUR, now - self.hourly_retention)):
+                    # SQLite 中与 MAX() 一起选出的裸列取自最大值所在的行
+                    conn.execute(
+                        """
+                        INSERT INTO trend_points (entity, signal, resolution, bucket, value, observed_at)
+                        SELECT entity, signal, ?, CAST(observed_at / ? AS INTEGER) * ?, value, MAX(observed_at)
+                        FROM trend_points WHERE resolution = ? AND observed_at < ?
+                        GROUP BY entity, signal, CAST(observed_at / ? AS INTEGER)
+                        ON CONFLICT (entity, signal, resolution, bucket) DO UPDATE
+                        SET value = excluded.value, observed_at = excluded.observed_at
+                        WHERE excluded.observed_at > trend_points.observed_at
+                        """,
+                        (resolution, resolution, resolution, source, cutoff, resolution)
+                    )
+                    conn.execute("DELETE FROM trend_points WHERE resolution = ? AND observed_at < ?", (source, cutoff))
+                expired = now - self.daily_retention
+                conn.execute("DELETE FROM trend_points WHERE observed_at < ?", (expired,))
+                conn.execute("DELETE FROM trend_state WHERE observed_at < ?", (expired,))
+            self._compacted_at = now
+        except sqlite3.Error as e:
+            logger.warning(f"压缩趋势索引失败: {e}")
+
+# 单例
+_index = None
+_index_lock = threading.Lock()
+
+def get_trend_index() -> Optional[TrendIndex]:
+    """获取趋势索引单例（配置读取 config.json -> advanced.trends，禁用时返回 None）"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            settings = {}
+            try:
+                from .config_loader import load_config
+                settings = load_config().get('advanced', {}).get('trends', {})
+            except Exception:
+                pass
+            if not settings.get('enabled', True):
+                return None
+            _index = TrendIndex(
+                smoothing_hours=settings.get('smoothing_hours', 3.0),
+                min_interval_minutes=settings.get('min_interval_minutes', 10),
+                raw_retention_hours=settings.get('raw_retention_hours', 24),
+                hourly_retention_days=settings.get('hourly_retention_days', 7),
+                daily_retention_days=settings.get('daily_retention_days', 90),
+            )
+        return _index
+
+def observe_articles(articles: Iterable[Article]) -> int:
+    """把一次采集的互动信号写入趋势索引（禁用或写入失败时返回 0，不影响采集流程）"""
+    try:
+        index = get_trend_index()
+        return index.observe(articles) if index else 0
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"更新趋势索引失败: {e}")
+        return 0
@@ -6,9 +6,23 @@ import requests
 import os
 from typing import Optional, List
 
+from .rate_limiter import get_rate_limiter
+
+# 进程内共享的连接池，避免每条消息重新建立 TLS 连接
+_shared_session = None
+
+def get_shared_session() -> requests.Session:
+    """获取共享的 requests.Session"""
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = requests.Session()
+    return _shared_session
+
 class DiscordWebhookSender:
-    def __init__(self, webhook_url: str):
+    def __init__(self, webhook_url: str, max_retries: int = 3, session: Optional[requests.Session] = None):
         self.webhook_url = webhook_url
+        self.max_retries = max_retries
+        self.session = session or get_shared_session()
     
     def send_to_forum(self, title: str, content: str, tags: Optional[List[str]] = None) -> bool:
         """
@@ -36,12 +50,13 @@ class DiscordWebhookSender:
             payload["applied_tags"] = tags
         
         try:
-            response = requests.post(
+            limiter = get_rate_limiter(self.webhook_url, max_retries=self.max_retries)
+            response = limiter.send(lambda: self.session.post(
                 self.webhook_url,
                 json=payload,
                 headers={"Content-Type": "application/json"},
                 timeout=10
-            )
+            ))
             if response.status_code not in [200, 204]:
                 print(f"   ⚠️ Webhook 返回错误: HTTP {response.status_code} - {response.text[:200]}")
             return response.status_code in [200, 204]
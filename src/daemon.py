@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+AiTrend 常驻模式
+进程内定时执行 src.hourly 的一轮运行，数据源、发布连接池、去重索引和LLM缓存跨轮次保持；
+支持 SIGTERM/SIGINT 优雅退出（等待当前一轮结束）、单实例文件锁和健康状态文件
+
+    python3 -m src.daemon
+    python3 -m src.hourly --daemon
+
+配置（config.json -> daemon）:
+    interval_minutes: 运行间隔，默认 60
+    align_to_interval: 是否对齐到整点/整间隔，默认 true
+    run_on_start: 启动后是否立即运行一轮，默认 true
+
+collector.enabled 为 true 时在同一进程内启动后台采集器（见 src.collector）；
+每轮重新加载配置后按 collector / sources 配置启动、停止或重建采集器
+"""
+
+import fcntl
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.config_loader import load_config
+from src.hourly import HourlyRuntime, run_once
+
+MEMORY_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'memory')
+DEFAULT_LOCK_PATH = os.path.join(MEMORY_DIR, 'hourly.lock')
+DEFAULT_HEALTH_PATH = os.path.join(MEMORY_DIR, 'hourly_health.json')
+
+def acquire_run_lock(lock_path: str = None):
+    """
+    获取运行锁（常驻进程和一次性的 src.hourly 共用，进程退出时自动释放）
+
+    Returns:
+        持有锁的文件对象，已被其他进程持有时返回 None
+    """
+    lock_path = lock_path or DEFAULT_LOCK_PATH
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    lock_file = open(lock_path, 'a+')
+    try:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return None
+    lock_file.seek(0)
+    lock_file.truncate()
+    lock_file.write(str(os.getpid()))
+    lock_file.flush()
+    return lock_file
+
+def release_run_lock(lock_file):
+    """释放 acquire_run_lock() 获取的锁"""
+    if lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        lock_file.close()
+
+class HourlyDaemon:
+    """常驻调度器"""
+
+    def __init__(self, is_test_mode: bool = False, is_full_test_mode: bool = False,
+                 enqueue_only: bool = False, lock_path: str = None, health_path: str = None):
+        self.is_test_mode = is_test_mode
+        self.is_full_test_mode = is_full_test_mode
+        self.enqueue_only = enqueue_only
+        self.lock_path = lock_path or DEFAULT_LOCK_PATH
+        self.health_path = health_path or DEFAULT_HEALTH_PATH
+        self.runtime = HourlyRuntime()
+        self._stop = threading.Event()
+        self._lock_file = None
+        self.collector = None
+        self._collector_stop: Optional[threading.Event] = None
+        self._collector_thread: Optional[threading.Thread] = None
+        self._collector_signature: Optional[str] = None
+        self.health: Dict[str, Any] = {
+            'pid': os.getpid(),
+            'started_at': datetime.now().isoformat(),
+            'status': 'starting',
+            'runs': 0,
+            'failures': 0,
+            'last_run': None,
+            'next_run_at': None,
+        }
+
+    def acquire_lock(self) -> bool:
+        """单实例文件锁（进程退出时自动释放）"""
+        self._lock_file = acquire_run_lock(self.lock_path)
+        return self._lock_file is not None
+
+    def release_lock(self):
+        release_run_lock(self._lock_file)
+        self._lock_file = None
+
+    def write_health(self, **updates):
+        """更新健康状态文件（先写临时文件再替换）"""
+        self.health.update(updates)
+        self.health['updated_at'] = datetime.now().isoformat()
+        tmp_path = f"{self.health_path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.health, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.health_path)
+        except OSError as e:
+            print(f"⚠️ 写入健康状态失败: {e}", file=sys.stderr)
+
+    def stop(self, signum=None, frame=None):
+        """请求退出：当前一轮结束后停止"""
+        if not self._stop.is_set():
+            print(f"\n🛑 收到退出信号{f' ({signum})' if signum else ''}，当前一轮结束后退出", file=sys.stderr)
+        self._stop.set()
+
+    def sync_collector(self, config: Dict[str, Any]):
+        """按 collector 配置启动 / 停止后台采集器，采集器或数据源配置变化时重建"""
+        collector_config = config.get('collector', {})
+        enabled = collector_config.get('enabled', False)
+        signature = json.dumps([collector_config, config.get('sources', {})], sort_keys=True,
+                               ensure_ascii=False, default=str)
+        if enabled and self.collector is not None and signature == self._collector_signature:
+            return
+        self.stop_collector()
+        if not enabled:
+            return
+
+        from src.collector import SourceCollector
+        self.collector = SourceCollector(config)
+        self._collector_stop = threading.Event()
+        self._collector_thread = self.collector.start(self._collector_stop)
+        self._collector_signature = signature
+        print(f"📡 后台采集器已启动: {', '.join(self.collector.intervals)}", file=sys.stderr)
+
+    def stop_collector(self):
+        """停止后台采集器（等待进行中的采集结束）"""
+        if self.collector is None:
+            return
+        self._collector_stop.set()
+        self._collector_thread.join()
+        self.collector.close()
+        self.collector = None
+        self._collector_signature = None
+        print("📡 后台采集器已停止", file=sys.stderr)
+
+    @staticmethod
+    def next_run_time(now: float, interval: float, align: bool) -> float:
+        """下一次运行的时间戳（对齐时取下一个整间隔边界，按本地时区）"""
+        if not align:
+            return now + interval
+        offset = datetime.fromtimestamp(now).astimezone().utcoffset().total_seconds()
+        return ((now + offset) // interval + 1) * interval - offset
+
+    def run_tick(self):
+        """执行一轮，异常不会终止常驻进程"""
+        started = time.time()
+        self.write_health(status='running', current_run_started_at=datetime.fromtimestamp(started).isoformat())
+        last_run: Dict[str, Any] = {'started_at': datetime.fromtimestamp(started).isoformat()}
+        self.runtime.timings = {}
+        self.runtime.deadline = None
+
+        try:
+            config = load_config()
+            self.runtime.refresh(config)
+            self.sync_collector(config)
+            output = run_once(self.runtime, self.is_test_mode, self.is_full_test_mode, self.enqueue_only)
+            if output is None:
+                last_run.update(result='no_content')
+            else:
+                last_run.update(
+                    result='ok' if output['success'] else 'partial',
+                    total=output['total'],
+                    success_count=output['success_count'],
+                    llm_tokens=output['llm_usage']['total_tokens'],
+                )
+                print(json.dumps(output, ensure_ascii=False), flush=True)
+        except Exception as e:
+            self.health['failures'] += 1
+            last_run.update(result='error', error=f"{type(e).__name__}: {e}")
+            print(f"❌ 本轮运行失败: {e}", file=sys.stderr)
+            traceback.print_exc(file=sys.stderr)
+
+        finished = time.time()
+        last_run.update(
+            finished_at=datetime.fromtimestamp(finished).isoformat(),
+            duration=round(finished - started, 3),
+            phases=dict(self.runtime.timings),
+            timed_out_phase=self.runtime.deadline.timed_out_phase if self.runtime.deadline else None,
+        )
+        self.write_health(status='idle', runs=self.health['runs'] + 1, last_run=last_run,
+                          current_run_started_at=None)
+
+    def run(self):
+        """主循环"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        try:
+            config = load_config()
+        except FileNotFoundError as e:
+            print(f"错误: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        daemon_config = config.get('daemon', {})
+        interval = max(60.0, float(daemon_config.get('interval_minutes', 60)) * 60)
+        align = daemon_config.get('align_to_interval', True)
+        next_run = time.time() if daemon_config.get('run_on_start', True) else self.next_run_time(time.time(), interval, align)
+
+        print(f"🔁 AiTrend 常驻模式启动 (pid {os.getpid()}, 间隔 {interval / 60:g} 分钟)", file=sys.stderr)
+        try:
+            self.sync_collector(config)
+
+            while not self._stop.is_set():
+                self.write_health(status='idle', next_run_at=datetime.fromtimestamp(next_run).isoformat())
+                if self._stop.wait(max(0.0, next_run - time.time())):
+                    break
+
+                self.run_tick()
+                next_run = self.next_run_time(time.time(), interval, align)
+        finally:
+            self.stop_collector()
+            self.runtime.close()
+            self.write_health(status='stopped', next_run_at=None)
+            print("👋 AiTrend 常驻模式已退出", file=sys.stderr)
+
+def run_daemon(is_test_mode: bool = False, is_full_test_mode: bool = False, enqueue_only: bool = False,
+               lock_path: Optional[str] = None, health_path: Optional[str] = None):
+    """启动常驻模式（已有实例运行时退出码为 1）"""
+    daemon = HourlyDaemon(is_test_mode, is_full_test_mode, enqueue_only, lock_path, health_path)
+    if not daemon.acquire_lock():
+        print(f"错误: 已有常驻实例或 src.hourly 在运行（锁文件 {daemon.lock_path}）", file=sys.stderr)
+        sys.exit(1)
+    try:
+        daemon.run()
+    finally:
+        daemon.release_lock()
+
+def main():
+    is_test_mode = '--test' in sys.argv or os.getenv('AITREND_TEST_MODE') == '1'
+    is_full_test_mode = '--full-test' in sys.argv or os.getenv('AITREND_FULL_TEST_MODE') == '1'
+    run_daemon(is_test_mode, is_full_test_mode, enqueue_only='--enqueue-only' in sys.argv)
+
+if __name__ == '__main__':
+    main()
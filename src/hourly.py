@@ -10,8 +10,11 @@ import os
 import time
 import random
 import hashlib
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from functools import partial
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -25,82 +28,134 @@ if os.path.exists(env_path):
                 os.environ[key] = value
 
 from src.sources import create_sources
-from src.sources.base import Article
+from src.sources.base import Article, DataSource
 from src.core.deduplicator import ArticleDeduplicator
-from src.core.config_loader import load_config
+from src.core.config_loader import load_config, get_enabled_channels
 from src.core.webhook_sender import DiscordWebhookSender
+from src.core.outbox import Outbox, OutboxWorker
+from src.core.candidate_pool import CandidatePool
+from src.core.deadline import DaemonThreadPool, RunDeadline, run_with_timeout
+from src.core.circuit_breaker import CircuitOpenError, get_breaker_registry
+from src.core.fetch_cache import cached_fetch
+from src.core.clustering import StoryClusterer
+from src.core.enricher import PageEnricher
+from src.core.topk import top_k
+from src.core.selection import select_diverse
+from src.core.scoring import get_hot_score_engine, reset_hot_score_engine
+from src.core.trend_index import observe_articles
+from src.core.archive import archive_articles, new_run_id
+from src.core.daily_aggregate import update_daily_aggregate
+from publishers import PublishDispatcher, ForumPublisher
+from src.core.llm_metrics import get_usage_tracker, PRIORITY_HIGH, PRIORITY_LOW
 
-def collect_all_sources(config: Dict[str, Any]) -> List[Article]:
-    """从所有数据源收集文章"""
+def collect_all_sources(config: Dict[str, Any], sources: Optional[List[DataSource]] = None,
+                        timeout: Optional[float] = None) -> List[Article]:
+    """从所有数据源收集文章
+    
+    Args:
+        config: 完整配置
+        sources: 已创建的数据源（常驻模式复用），为空时按配置创建
+        timeout: 收集阶段的时间预算（秒），超时未返回的数据源被放弃
+    """
+    if sources is None:
+        sources_config = config.get("sources", {})
+        print(f"   [调试] sources_config: {list(sources_config.keys())}", file=sys.stderr)
+        
+        print(f"   [调试] 开始创建数据源...", file=sys.stderr)
+        sources = create_sources(sources_config)
+        print(f"   [调试] 创建了 {len(sources)} 个数据源", file=sys.stderr)
+    
+    articles, _ = collect_sources(sources, timeout)
+    return articles
+
+def collect_sources(sources: List[DataSource], timeout: Optional[float] = None) -> Tuple[List[Article], List[str]]:
+    """
+    并发收集各数据源，最多等待 timeout 秒
+    
+    Returns:
+        (按数据源顺序合并的文章, 超时被放弃的数据源名)
+    """
     import socket
     
     # 设置全局socket超时，防止网络请求无限挂起
     socket.setdefaulttimeout(30)
     
-    sources_config = config.get("sources", {})
-    print(f"   [调试] sources_config: {list(sources_config.keys())}", file=sys.stderr)
-    
-    print(f"   [调试] 开始创建数据源...", file=sys.stderr)
-    sources = create_sources(sources_config)
-    print(f"   [调试] 创建了 {len(sources)} 个数据源", file=sys.stderr)
-    
-    all_articles = []
+    # 每个数据源一个熔断器：只在缓存未命中、需要真正请求上游时才询问熔断器，
+    # 命中缓存时不会占用半开状态的探测名额；熔断中的数据源抛出 CircuitOpenError 后跳过
+    breakers = get_breaker_registry()
+    enabled = []
     for i, source in enumerate(sources):
         print(f"   [调试] 处理第 {i+1}/{len(sources)} 个数据源: {source.name}", file=sys.stderr)
-        if source.is_enabled():
-            print(f"   [调试] {source.name} 已启用，开始获取...", file=sys.stderr)
-            try:
-                articles = source.fetch() or []
-                for article in articles:
-                    article.metadata['collector_source'] = source.name
-                all_articles.extend(articles)
-                print(f"✓ {source.name}: {len(articles)} 条", file=sys.stderr)
-            except Exception as e:
-                print(f"✗ {source.name}: {e}", file=sys.stderr)
-        else:
+        if not source.is_enabled():
             print(f"   [调试] {source.name} 已禁用，跳过", file=sys.stderr)
+            continue
+        enabled.append(source)
     
-    return all_articles
-
-def calculate_hot_score(article: Article) -> float:
-    """计算热度分数"""
-    score = 0.0
-    
-    source_weights = {
-        'producthunt': 1.5,
-        'twitter': 1.4,
-        'reddit': 1.2,
-        'hackernews': 1.1,
-        'github_trending': 1.0,
-        'tavily': 0.9
-    }
-    score += source_weights.get(article.source, 0.5)
-    
-    metadata = article.metadata or {}
-    score += metadata.get('score', 0) * 0.01
-    score += metadata.get('comments', 0) * 0.02
-    score += metadata.get('upvotes', 0) * 0.01
+    done, pending = run_with_timeout(
+        [(source.name, partial(cached_fetch, source, partial(breakers.get(f"source:{source.name}").call, source.fetch)))
+         for source in enabled],
+        timeout
+    )
     
-    try:
-        if 'published_at' in metadata:
-            pub_time = datetime.fromisoformat(metadata['published_at'].replace('Z', '+00:00'))
-            hours_ago = (datetime.now(pub_time.tzinfo) - pub_time).total_seconds() / 3600
-            if hours_ago < 1:
-                score += 2.0
-            elif hours_ago < 6:
-                score += 1.0
-            elif hours_ago < 24:
-                score += 0.5
-    except:
-        pass
-    
-    return score
+    all_articles = []
+    for source in enabled:
+        if source.name not in done:
+            # 运行截止时间是本地预算，不代表上游故障，不计入熔断器（后台线程完成时会记录真实结果）
+            print(f"⏱️ {source.name}: 超过收集时间预算 ({timeout:.0f}s)，放弃", file=sys.stderr)
+            continue
+        result = done[source.name]
+        if isinstance(result, CircuitOpenError):
+            print(f"🔌 {source.name}: 熔断中，跳过（{breakers.get(f'source:{source.name}').last_error}）", file=sys.stderr)
+            continue
+        if isinstance(result, Exception):
+            print(f"✗ {source.name}: {result}", file=sys.stderr)
+            continue
+        articles = result or []
+        # 只有文章来源名与数据源名不同时才记录，避免为每篇文章创建元数据字典
+        for article in articles:
+            if article.source != source.name:
+                article.metadata['collector_source'] = source.name
+        all_articles.extend(articles)
+        print(f"✓ {source.name}: {len(articles)} 条", file=sys.stderr)
+    
+    breakers.save()
+    return all_articles, pending
 
 def select_best_articles(articles: List[Article], top_n: int = 3) -> List[Article]:
     """选择最热门的多条"""
-    scored_articles = [(article, calculate_hot_score(article)) for article in articles]
-    scored_articles.sort(key=lambda x: x[1], reverse=True)
-    return [a[0] for a in scored_articles[:top_n]]
+    return top_k(articles, top_n, get_hot_score_engine().score_fn(articles))
+
+def select_diverse_articles(articles: List[Article], limit: int, max_per_source: int = 2) -> List[Article]:
+    """
+    按热度选择并保证来源多样性（每个来源最多 max_per_source 条）
+    
+    满足来源上限的候选不足 limit 条时放宽上限补足（补足的排在最后），只要候选够多就返回 limit 条
+    """
+    return select_diverse(
+        articles,
+        k=limit,
+        score_fn=get_hot_score_engine().score_fn(articles),
+        group_fn=lambda article: article.source,
+        max_per_group=max_per_source,
+        min_count=limit
+    )
+
+def filter_valid_articles(articles: List[Article]) -> List[Article]:
+    """
+    选稿阶段执行LLM输入验证
+    
+    不合格的文章在这里就被剔除，不会占用发布名额
+    """
+    from .llm_content_generator import validate_article_input
+    
+    valid_articles = []
+    for article in articles:
+        is_valid, error_msg = validate_article_input(article_to_data(article))
+        if is_valid:
+            valid_articles.append(article)
+        else:
+            print(f"   ⏭️ 跳过 [{article.source}] {article.title[:40]}: {error_msg}", file=sys.stderr)
+    return valid_articles
 
 def get_thread_title(article: Article) -> str:
     """生成帖子标题"""
@@ -132,7 +187,18 @@ def generate_ati_id() -> str:
     short_hash = hashlib.sha256(hash_input.encode()).hexdigest()[:6].upper()
     return f"ATI-{date_str}-{short_hash}"
 
-def generate_unique_content(article: Article, is_test: bool = False) -> str:
+def article_to_data(article: Article) -> Dict[str, Any]:
+    """转换为LLM生成器使用的输入字典"""
+    return {
+        'title': article.title,
+        'summary': article.summary or '',
+        'url': article.url,
+        'source': article.source,
+        'metadata': dict(article.metadata)
+    }
+
+def generate_unique_content(article: Article, is_test: bool = False, priority: str = PRIORITY_HIGH,
+                            timeout: Optional[float] = None) -> str:
     """
     基于项目具体信息生成完全独特的内容
     使用LLM生成，禁止模板化文字
@@ -140,21 +206,15 @@ def generate_unique_content(article: Article, is_test: bool = False) -> str:
     Args:
         article: 文章数据
         is_test: 是否为测试模式，测试模式会添加ATI ID
+        priority: 生成优先级，LLM预算用尽后低优先级生成会被跳过
+        timeout: LLM请求超时秒数（默认60）
     """
     from .llm_content_generator import get_llm_generator
     
     # 使用LLM生成独特内容
     generator = get_llm_generator()
     
-    article_data = {
-        'title': article.title,
-        'summary': article.summary or '',
-        'url': article.url,
-        'source': article.source,
-        'metadata': article.metadata or {}
-    }
-    
-    content = generator.generate(article_data)
+    content = generator.generate(article_to_data(article), priority=priority, timeout=timeout)
     
     # 测试模式添加 ATI ID（与真实内容格式完全一致）
     if is_test:
@@ -164,7 +224,69 @@ def generate_unique_content(article: Article, is_test: bool = False) -> str:
     
     return content
 
-def post_single_article(article: Article, webhook_url: str, delay: int = 0, is_test: bool = False) -> bool:
+def generate_speculatively(candidates: List[Article], slots: int, is_test: bool = False,
+                           max_workers: int = 3, deadline: Optional[RunDeadline] = None) -> List[Tuple[Article, str]]:
+    """
+    推测式生成：为 slots 个发布名额并发生成多于名额的候选
+    
+    candidates 按排名传入（通常为 slots + 额外候选数）。按排名顺序等待结果，
+    取前 slots 个生成成功的文章；凑满名额后取消尚未开始的任务，
+    仍在进行中的请求结果直接丢弃。超出名额的候选为低优先级，
+    LLM预算用尽时不再生成。
+    
+    传入 deadline 时，生成阶段预算用尽后不再等待，只取已经生成完成的候选，
+    并把 generate 记录为超时阶段；每个请求的超时也不超过阶段剩余时间
+    
+    Returns:
+        [(文章, 生成内容)]，按排名顺序
+    """
+    if not candidates or slots <= 0:
+        return []
+    
+    def generate(article: Article, priority: str) -> str:
+        timeout = deadline.phase_remaining('generate') if deadline else None
+        if timeout is not None and timeout <= 0:
+            raise RuntimeError("超过生成时间预算")
+        return generate_unique_content(article, is_test, priority, timeout=timeout)
+    
+    # 守护线程：超出预算后仍在进行的请求不会拖住单次运行的进程退出
+    executor = DaemonThreadPool(max(1, min(max_workers, len(candidates))), thread_name_prefix='generate')
+    futures = [
+        executor.submit(generate, article, PRIORITY_HIGH if rank < slots else PRIORITY_LOW)
+        for rank, article in enumerate(candidates)
+    ]
+    
+    generated = []
+    try:
+        for rank, (article, future) in enumerate(zip(candidates, futures), 1):
+            try:
+                content = future.result(timeout=deadline.phase_remaining('generate') if deadline else None)
+            except FutureTimeoutError:
+                # 预算用尽：按排名补上已经生成完成的候选
+                print(f"   ⏱️ 生成阶段超过时间预算，使用已完成的 {len(generated)} 条及后续已就绪候选", file=sys.stderr)
+                deadline.end_phase('generate', timed_out=True)
+                for later_article, later_future in zip(candidates[rank:], futures[rank:]):
+                    if len(generated) >= slots:
+                        break
+                    if later_future.done() and not later_future.cancelled() and later_future.exception() is None:
+                        generated.append((later_article, later_future.result()))
+                break
+            except Exception as e:
+                print(f"   ⚠️ 候选#{rank} [{article.source}] {article.title[:40]} 生成失败: {e}", file=sys.stderr)
+                continue
+            
+            generated.append((article, content))
+            if len(generated) >= slots:
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(cancel_futures=True)
+    
+    return generated
+
+def post_single_article(article: Article, webhook_url: str, delay: int = 0, is_test: bool = False,
+                        content: Optional[str] = None) -> bool:
     """发布单条文章到论坛
     
     Args:
@@ -172,11 +294,13 @@ def post_single_article(article: Article, webhook_url: str, delay: int = 0, is_t
         webhook_url: Webhook URL
         delay: 延迟秒数
         is_test: 是否为测试模式
+        content: 已生成的内容（为空时现场生成）
     """
     if delay > 0:
         time.sleep(delay)
     
-    content = generate_unique_content(article, is_test=is_test)
+    if content is None:
+        content = generate_unique_content(article, is_test=is_test)
     title = get_thread_title(article)
     
     sender = DiscordWebhookSender(webhook_url)
@@ -184,165 +308,386 @@ def post_single_article(article: Article, webhook_url: str, delay: int = 0, is_t
     
     return result
 
-def main():
-    """主函数
-    
-    支持参数:
-        --test: 测试模式（跳过去重，添加ATI ID）
-        python3 -m src.hourly --test
+def outbox_row_to_content(row: Dict[str, Any]) -> Dict[str, Any]:
+    """发件箱记录转换为发布模块的内容字典"""
+    article = json.loads(row['article'])
+    return {
+        'name': row['title'],
+        'thread_name': row['title'],
+        'content': row['content'],
+        'url': article.get('url', ''),
+        'source': article.get('source', '')
+    }
+
+def build_dispatcher(config: Dict[str, Any]) -> PublishDispatcher:
     """
-    start_time = time.time()
+    为所有启用的渠道构建发布调度器
     
-    # 检查是否为测试模式或全量测试模式
-    is_test_mode = '--test' in sys.argv or os.getenv('AITREND_TEST_MODE') == '1'
-    is_full_test_mode = '--full-test' in sys.argv or os.getenv('AITREND_FULL_TEST_MODE') == '1'
+    没有可用渠道时回退到 DISCORD_WEBHOOK_URL 论坛发布
+    """
+    dispatcher = PublishDispatcher.from_config(get_enabled_channels(config))
+    if not dispatcher.channels:
+        webhook_url = get_webhook_url()
+        if webhook_url:
+            dispatcher = PublishDispatcher({'discord_forum': ForumPublisher({'webhook_url': webhook_url})})
+    return dispatcher
+
+def get_webhook_url() -> Optional[str]:
+    """获取 Discord Webhook URL（环境变量优先，其次 .env）"""
+    webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
+    if not webhook_url and os.path.exists('.env'):
+        with open('.env', 'r') as f:
+            for line in f:
+                if line.startswith('DISCORD_WEBHOOK_URL='):
+                    webhook_url = line.strip().split('=', 1)[1]
+                    break
+    return webhook_url
+
+class HourlyRuntime:
+    """
+    运行状态：配置、数据源、发布调度器、去重索引和发件箱
     
-    if is_full_test_mode:
-        print("🧪🔥 AiTrend 全量测试模式（所有数据源，最大化输出，跳过去重）", file=sys.stderr)
-    elif is_test_mode:
-        print("🧪 AiTrend 测试模式（跳过去重，添加ATI ID）", file=sys.stderr)
-    else:
-        print("🚀 AiTrend 每小时精选模式（完全独特叙述版）", file=sys.stderr)
+    单次运行用完即弃；常驻模式（--daemon）下跨轮次复用，
+    只有数据源或渠道配置变化时才重建对应对象
+    """
     
-    # 加载配置
+    def __init__(self):
+        self.config: Dict[str, Any] = {}
+        self.sources: List[DataSource] = []
+        self.dispatcher: Optional[PublishDispatcher] = None
+        self.deduplicator = ArticleDeduplicator()
+        self.outbox = Outbox()
+        self.candidate_pool: Optional[CandidatePool] = None
+        self.enricher: Optional[PageEnricher] = None
+        self.clusterer: Optional[StoryClusterer] = None
+        self.timings: Dict[str, float] = {}
+        self.deadline: Optional[RunDeadline] = None
+        self._signatures: Dict[str, str] = {}
+    
+    def _changed(self, section: str, value: Any) -> bool:
+        """配置段与上次相比是否变化"""
+        signature = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+        changed = self._signatures.get(section) != signature
+        self._signatures[section] = signature
+        return changed
+    
+    def refresh(self, config: Dict[str, Any]):
+        """应用最新配置"""
+        self.config = config
+        
+        if self._changed('sources', config.get('sources', {})):
+            sources_config = config.get('sources', {})
+            print(f"   [调试] 创建数据源: {list(sources_config.keys())}", file=sys.stderr)
+            self.sources = create_sources(sources_config)
+            print(f"   [调试] 创建了 {len(self.sources)} 个数据源", file=sys.stderr)
+        
+        if self._changed('channels', config.get('channels', {})) or self.dispatcher is None:
+            if self.dispatcher:
+                self.dispatcher.close()
+            self.dispatcher = build_dispatcher(config)
+        
+        collector_config = config.get('collector', {})
+        if not collector_config.get('enabled', False):
+            self.candidate_pool = None
+        elif self._changed('collector', collector_config) or self.candidate_pool is None:
+            self.candidate_pool = CandidatePool(ttl_hours=collector_config.get('candidate_ttl_hours', 24))
+        
+        if self._changed('enrichment', config.get('advanced', {}).get('enrichment', {})):
+            self.enricher = PageEnricher.from_config(config)
+        
+        if self._changed('clustering', config.get('advanced', {}).get('clustering', {})):
+            self.clusterer = StoryClusterer.from_config(config)
+        
+        # 打分引擎和用量统计是模块级单例，配置变化时同步更新
+        if self._changed('scoring', config.get('advanced', {}).get('scoring', {})):
+            reset_hot_score_engine()
+        
+        budget = config.get('summarizer', {}).get('budget', {})
+        if self._changed('budget', budget):
+            get_usage_tracker().set_budget(budget.get('max_tokens_per_run'), budget.get('max_seconds_per_run'))
+    
+    def close(self):
+        """等待发布队列清空并释放线程"""
+        if self.dispatcher:
+            self.dispatcher.close()
+            self.dispatcher = None
+
+@contextmanager
+def timed_phase(timings: Dict[str, float], name: str) -> Iterator[None]:
+    """记录一个阶段的耗时（秒）"""
+    started = time.monotonic()
     try:
-        config = load_config()
-    except FileNotFoundError as e:
-        print(f"错误: {e}", file=sys.stderr)
-        sys.exit(1)
+        yield
+    finally:
+        timings[name] = round(time.monotonic() - started, 3)
+
+def run_once(runtime: HourlyRuntime, is_test_mode: bool = False, is_full_test_mode: bool = False,
+             enqueue_only: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    执行一轮 收集 -> 去重 -> 选稿 -> 生成 -> 投递
     
-    # 收集数据
-    print("\n📡 正在收集各数据源...", file=sys.stderr)
-    all_articles = collect_all_sources(config)
+    Returns:
+        输出结果字典；没有可发布的内容时返回 None
+    """
+    config = runtime.config
+    deduplicator = runtime.deduplicator
+    outbox = runtime.outbox
+    dispatcher = runtime.dispatcher
+    timings = runtime.timings = {}
+    run_started = time.monotonic()
+    run_id = new_run_id('hourly')
+    # 整轮运行的截止时间，按比例分配给 收集/生成/投递
+    deadline = runtime.deadline = RunDeadline.from_config(config)
+    
+    usage_tracker = get_usage_tracker()
+    usage_tracker.start_run()
+    dispatcher.reset_stats()
+    
+    # 收集数据：启用后台采集器时直接从候选池取，候选池为空时回退到同步采集
+    with timed_phase(timings, 'collect'):
+        collect_budget = deadline.start_phase('collect')
+        all_articles, abandoned = [], []
+        if runtime.candidate_pool:
+            all_articles = runtime.candidate_pool.top(config.get('collector', {}).get('pool_limit', 200))
+            print(f"\n📦 候选池: {len(all_articles)} 条", file=sys.stderr)
+        if not all_articles:
+            print("\n📡 正在收集各数据源...", file=sys.stderr)
+            all_articles, abandoned = collect_sources(runtime.sources, collect_budget)
+            # 互动信号写入趋势索引、全部文章写入归档（候选池中的文章已由采集器写入）
+            updated = observe_articles(all_articles)
+            if updated:
+                print(f"📈 趋势索引更新: {updated} 条", file=sys.stderr)
+            archived = archive_articles(all_articles, run_id)
+            if archived:
+                print(f"🗄️ 已归档: {archived} 条 ({run_id})", file=sys.stderr)
+        deadline.end_phase('collect', timed_out=bool(abandoned))
     print(f"\n📊 共收集 {len(all_articles)} 条", file=sys.stderr)
     
     if not all_articles:
         print("⚠️ 无数据", file=sys.stderr)
-        sys.exit(0)
-    
-    # 去重（测试模式跳过）
-    deduplicator = ArticleDeduplicator()  # 始终创建，测试模式不使用
-    if is_test_mode:
-        articles = all_articles
-        print(f"🧪 测试模式: 跳过去重检查", file=sys.stderr)
-    else:
-        articles = deduplicator.filter_new_articles(all_articles)
-        print(f"🔍 去重后: {len(articles)} 条", file=sys.stderr)
-    
-    # URL去重（保持URL唯一性，即使是测试模式）
-    seen_urls = set()
-    unique_articles = []
-    for article in articles:
-        if article.url and article.url not in seen_urls:
-            seen_urls.add(article.url)
-            unique_articles.append(article)
-    articles = unique_articles
-    
-    if not is_test_mode:
-        print(f"🔍 去重后: {len(articles)} 条", file=sys.stderr)
+        return None
+    
+    # 并入当天的聚合文件（视频流程的 daily_raw 输入）
+    added, updated = update_daily_aggregate(all_articles)
+    if added or updated:
+        print(f"🗂️ 当天聚合: 新增 {added} 条，更新 {updated} 条", file=sys.stderr)
+    
+    with timed_phase(timings, 'filter'):
+        # 去重（测试模式跳过）
+        if is_test_mode:
+            articles = all_articles
+            print(f"🧪 测试模式: 跳过去重检查", file=sys.stderr)
+        else:
+            articles = deduplicator.filter_new_articles(all_articles)
+            print(f"🔍 去重后: {len(articles)} 条", file=sys.stderr)
+        
+        # URL去重（保持URL唯一性，即使是测试模式）
+        seen_urls = set()
+        unique_articles = []
+        for article in articles:
+            if article.url and article.url not in seen_urls:
+                seen_urls.add(article.url)
+                unique_articles.append(article)
+        articles = unique_articles
+        
+        if not is_test_mode:
+            print(f"🔍 去重后: {len(articles)} 条", file=sys.stderr)
+        
+        # 已生成但尚未投递、或今天已入队过（含投递失败）的帖子不重复生成
+        queued_urls = outbox.queued_urls(is_test=is_test_mode or is_full_test_mode)
+        if queued_urls:
+            articles = [a for a in articles if deduplicator.normalize_url(a.url) not in queued_urls]
+            print(f"📮 发件箱已有 {len(queued_urls)} 条，跳过后剩余: {len(articles)} 条", file=sys.stderr)
+        
+        if not articles:
+            print("⚠️ 无新内容", file=sys.stderr)
+            return None
+        
+        # 同一事件从多个来源进入候选时只保留一条代表（互动信号合并），避免重复发布
+        if runtime.clusterer:
+            clustered = runtime.clusterer.merge(articles, get_hot_score_engine().score_fn(articles))
+            if len(clustered) < len(articles):
+                print(f"🧩 同一事件聚类: {len(articles)} → {len(clustered)} 条", file=sys.stderr)
+            articles = clustered
+        
+        # 摘要过短或由模板拼出的候选先补充页面信息（按热度取前若干条），避免在输入验证时被淘汰
+        if runtime.enricher:
+            remaining = deadline.remaining()
+            enrich_timeout = runtime.enricher.timeout * 2
+            if remaining is not None:
+                enrich_timeout = min(enrich_timeout, remaining * 0.1)
+            enriched = runtime.enricher.enrich(get_hot_score_engine().rank(articles), enrich_timeout)
+            if enriched:
+                print(f"📝 页面补充摘要: {enriched} 条", file=sys.stderr)
+        
+        # 选稿阶段验证输入，不合格的文章不占用发布名额
+        articles = filter_valid_articles(articles)
+        print(f"✅ 输入验证通过: {len(articles)} 条", file=sys.stderr)
     
     if not articles:
-        print("⚠️ 无新内容", file=sys.stderr)
-        sys.exit(0)
+        print("⚠️ 无合格内容", file=sys.stderr)
+        return None
+    
+    advanced_config = config.get('advanced', {})
     
     # 选择文章（全量测试模式输出所有，普通模式限制数量）
     if is_full_test_mode:
         # 全量测试：输出所有收集到的内容（按热度排序）
-        top_articles = select_best_articles(articles, top_n=len(articles))
-        print(f"\n🔥 全量测试模式: 选中 {len(top_articles)} 条 (最大化输出)", file=sys.stderr)
+        slots = len(articles)
+        candidates = select_best_articles(articles, top_n=slots)
+        print(f"\n🔥 全量测试模式: 选中 {len(candidates)} 条 (最大化输出)", file=sys.stderr)
     else:
-        # 普通模式：选择最热门的3条，确保多样性
-        top_articles = select_best_articles(articles, top_n=5)  # 先选5条
-        
-        # 确保来源多样性
-        source_count = {}
-        diverse_articles = []
-        for article in top_articles:
-            src = article.source
-            if source_count.get(src, 0) < 2:  # 每个来源最多2条
-                diverse_articles.append(article)
-                source_count[src] = source_count.get(src, 0) + 1
-            if len(diverse_articles) >= 3:
-                break
-        
-        top_articles = diverse_articles[:3]
+        # 普通模式：3个名额，额外多选几条候选用于推测式生成，确保多样性
+        slots = 3
+        extra = advanced_config.get('speculative_extra', 2)
+        candidates = select_diverse_articles(articles, limit=slots + extra, max_per_source=2)
+        print(f"\n⭐ 候选 {len(candidates)} 条，发布名额 {slots} 条 (已优化来源多样性):", file=sys.stderr)
     
-    if not is_full_test_mode:
-        print(f"\n⭐ 选中 {len(top_articles)} 条 (已优化来源多样性):", file=sys.stderr)
-    for i, article in enumerate(top_articles, 1):
+    for i, article in enumerate(candidates, 1):
         print(f"   {i}. [{article.source}] {article.title[:45]}...", file=sys.stderr)
     
-    # 获取 Webhook URL
-    webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
-    if not webhook_url:
-        with open('.env', 'r') as f:
-            for line in f:
-                if line.startswith('DISCORD_WEBHOOK_URL='):
-                    webhook_url = line.strip().split('=', 1)[1]
-                    break
-    
-    # 发布到论坛
-    mode_str = ""
-    if is_full_test_mode:
-        mode_str = "全量测试"
-    elif is_test_mode:
-        mode_str = "测试"
-    
-    print(f"\n📤 正在发布{mode_str}内容...", file=sys.stderr)
-    results = []
-    
-    for i, article in enumerate(top_articles):
-        delay = i * 2
-        if delay > 0:
-            print(f"   ⏳ 等待 {delay} 秒...", file=sys.stderr)
-            time.sleep(delay)
-        
-        # 全量测试或测试模式都添加ATI ID
-        is_test_flag = is_test_mode or is_full_test_mode
+    # 全量测试或测试模式都添加ATI ID
+    is_test_flag = is_test_mode or is_full_test_mode
+    
+    # 推测式生成：并发生成候选，按排名取前 slots 个成功的
+    print(f"\n🤖 正在并发生成内容...", file=sys.stderr)
+    with timed_phase(timings, 'generate'):
+        deadline.start_phase('generate')
+        generated = generate_speculatively(
+            candidates,
+            slots,
+            is_test=is_test_flag,
+            max_workers=advanced_config.get('generation_workers', 3),
+            deadline=deadline
+        )
+        deadline.end_phase('generate')
+    print(f"   ✅ 生成成功 {len(generated)}/{slots} 条", file=sys.stderr)
+    
+    # 生成结果按渠道写入发件箱，确认投递后才记录去重（测试模式不记录）
+    for article, content in generated:
+        for channel in dispatcher.channels:
+            outbox.enqueue(
+                article,
+                get_thread_title(article),
+                content,
+                channel=channel,
+                record_dedup=not is_test_flag
+            )
+    
+    # 已进入发件箱的候选移出候选池
+    if runtime.candidate_pool and generated and not is_test_flag:
+        runtime.candidate_pool.remove(article.url for article, _ in generated)
+    
+    if enqueue_only:
+        print(f"\n📮 已写入发件箱 {len(generated)} 条，等待 publish_worker 投递", file=sys.stderr)
+        results = []
+    else:
+        # 发布到所有渠道
+        mode_str = ""
+        if is_full_test_mode:
+            mode_str = "全量测试"
+        elif is_test_mode:
+            mode_str = "测试"
         
-        print(f"   📝 正在为 [{article.source}] {article.title[:40]}... 生成内容", file=sys.stderr)
+        print(f"\n📤 正在投递{mode_str}内容到 {', '.join(dispatcher.channels) or '(无可用渠道)'}...", file=sys.stderr)
         
-        try:
-            result = post_single_article(article, webhook_url, delay=0, is_test=is_test_flag)
-            results.append({
-                'title': article.title[:40],
-                'source': article.source,
-                'success': result,
-                'is_test': is_test_flag
-            })
-            status = "✅" if result else "❌"
+        # 渠道之间并发、渠道内按顺序；发帖间隔由 webhook 速率限制调度器按响应头决定
+        worker = OutboxWorker(
+            outbox,
+            send_fn=lambda row: dispatcher.submit(row['channel'], outbox_row_to_content(row)),
+            deduplicator=deduplicator,
+            max_attempts=advanced_config.get('max_retries', 3)
+        )
+        with timed_phase(timings, 'publish'):
+            results = worker.drain(timeout=deadline.start_phase('publish'))
+            deadline.end_phase('publish', timed_out=worker.timed_out)
+        for i, result in enumerate(results, 1):
+            result['is_test'] = is_test_flag
+            status = "✅" if result['success'] else "❌"
             test_mark = " [TEST]" if is_test_flag else ""
-            print(f"   {status} 第{i+1}条{test_mark}发布{'成功' if result else '失败'}", file=sys.stderr)
-        except Exception as e:
-            print(f"   ❌ 第{i+1}条发布异常: {e}", file=sys.stderr)
-            results.append({
-                'title': article.title[:40],
-                'source': article.source,
-                'success': False,
-                'is_test': is_test_flag
-            })
-    
-    # 记录已发送（测试模式不记录，只记录成功的）
-    if not is_test_mode and not is_full_test_mode:
-        # 只记录发布成功的文章
-        successful_articles = [
-            article for article, result in zip(top_articles, results) 
-            if result.get('success', False)
-        ]
-        if successful_articles:
-            deduplicator.record_sent_articles(successful_articles)
-            print(f"   📝 已记录 {len(successful_articles)} 条成功发布的内容", file=sys.stderr)
+            print(f"   {status} 第{i}条{test_mark} ({result['channel']}) [{result['source']}] {result['title']} "
+                  f"发布{'成功' if result['success'] else '失败'}", file=sys.stderr)
+        
+        for channel, stats in dispatcher.stats().items():
+            print(f"   📡 {channel}: 成功 {stats['sent']}，失败 {stats['failed']}，"
+                  f"平均耗时 {stats['avg_latency']}s，最长 {stats['max_latency']}s", file=sys.stderr)
     
     # 输出结果
     success_count = sum(1 for r in results if r['success'])
     print(f"\n📈 发布完成: {success_count}/{len(results)} 条成功", file=sys.stderr)
     
-    output = {
+    # 记录LLM用量
+    metrics_path = usage_tracker.flush()
+    usage_totals = usage_tracker.summary()['totals']
+    print(f"📊 LLM用量: {usage_totals['calls']} 次调用, {usage_totals['total_tokens']} tokens, "
+          f"{usage_totals['seconds']:.1f}s" + (f" → {metrics_path}" if metrics_path else ""), file=sys.stderr)
+    
+    timings['total'] = round(time.monotonic() - run_started, 3)
+    if deadline.timed_out_phase:
+        print(f"⏱️ 运行截止时间: {deadline.timed_out_phase} 阶段超时，已按现有结果降级完成", file=sys.stderr)
+    
+    return {
+        "run_id": run_id,
         "success": success_count == len(results),
         "total": len(results),
         "success_count": success_count,
-        "posts": results
+        "posts": results,
+        "channels": dispatcher.stats(),
+        "llm_usage": usage_totals,
+        "timings": timings,
+        "deadline": deadline.summary()
     }
+
+def main():
+    """主函数
+    
+    支持参数:
+        --test: 测试模式（跳过去重，添加ATI ID）
+        --enqueue-only: 只生成并写入发件箱，由 src.publish_worker 负责投递
+        --daemon: 常驻模式，按 daemon 配置定时运行（见 src.daemon）
+        python3 -m src.hourly --test
+    """
+    # 检查是否为测试模式或全量测试模式
+    is_test_mode = '--test' in sys.argv or os.getenv('AITREND_TEST_MODE') == '1'
+    is_full_test_mode = '--full-test' in sys.argv or os.getenv('AITREND_FULL_TEST_MODE') == '1'
+    enqueue_only = '--enqueue-only' in sys.argv
+    
+    if '--daemon' in sys.argv:
+        from src.daemon import run_daemon
+        run_daemon(is_test_mode=is_test_mode, is_full_test_mode=is_full_test_mode, enqueue_only=enqueue_only)
+        return
+    
+    if is_full_test_mode:
+        print("🧪🔥 AiTrend 全量测试模式（所有数据源，最大化输出，跳过去重）", file=sys.stderr)
+    elif is_test_mode:
+        print("🧪 AiTrend 测试模式（跳过去重，添加ATI ID）", file=sys.stderr)
+    else:
+        print("🚀 AiTrend 每小时精选模式（完全独特叙述版）", file=sys.stderr)
+    
+    # 加载配置
+    try:
+        config = load_config()
+    except FileNotFoundError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    # 与常驻进程共用运行锁，cron 触发的单次运行不会和常驻进程或上一次未结束的运行同时执行
+    from src.daemon import DEFAULT_LOCK_PATH, acquire_run_lock, release_run_lock
+    lock_file = acquire_run_lock()
+    if lock_file is None:
+        print(f"错误: 已有常驻实例或 src.hourly 在运行（锁文件 {DEFAULT_LOCK_PATH}）", file=sys.stderr)
+        sys.exit(1)
+    
+    runtime = HourlyRuntime()
+    runtime.refresh(config)
+    try:
+        output = run_once(runtime, is_test_mode, is_full_test_mode, enqueue_only)
+    finally:
+        runtime.close()
+        release_run_lock(lock_file)
+    
+    if output is None:
+        sys.exit(0)
     print(json.dumps(output, ensure_ascii=False))
 
 if __name__ == '__main__':
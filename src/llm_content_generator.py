@@ -13,7 +13,10 @@ LLM内容生成器
 """
 import os
 import json
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Tuple
+
+from .core.llm_metrics import get_usage_tracker, PRIORITY_HIGH
 
 def _load_env_file():
     """从.env文件加载环境变量"""
@@ -44,93 +47,108 @@ def _load_env_file():
 # 模块加载时自动尝试加载.env
 _load_env_file()
 
+def validate_article_input(article_data: Dict) -> Tuple[bool, str]:
+    """
+    验证输入数据质量
+    
+    验证规则：
+    1. 标题不能为空
+    2. 标题不能只有网址
+    3. 描述/摘要要有足够信息量（至少50字符）
+    4. URL不能为空
+    
+    Returns:
+        (是否合格, 不合格原因)
+    """
+    title = article_data.get('title', '').strip()
+    summary = article_data.get('summary', '').strip()
+    url = article_data.get('url', '').strip()
+    
+    # 检查标题
+    if not title:
+        return False, "标题为空"
+    
+    if len(title) < 3:
+        return False, f"标题过短（{len(title)}字符），至少需要3字符"
+    
+    # 检查标题是否只是网址
+    if title.startswith('http://') or title.startswith('https://'):
+        return False, "标题不能只是网址"
+    
+    # 检查URL
+    if not url:
+        return False, "URL为空"
+    
+    if not url.startswith('http://') and not url.startswith('https://'):
+        return False, "URL格式无效"
+    
+    # 检查描述/摘要的信息量
+    info_text = f"{title} {summary}".strip()
+    if len(info_text) < 50:
+        return False, f"输入信息不足（{len(info_text)}字符），标题+描述至少需要50字符"
+    
+    # 检查是否包含有效信息（不只是占位符）
+    meaningless_words = ['待补充', '暂无', 'unknown', 'n/a', 'null', 'none']
+    if summary.lower() in meaningless_words or len(summary.strip()) < 5:
+        # 如果summary无效，检查title是否足够长
+        if len(title) < 30:
+            return False, "描述无有效信息且标题过短"
+    
+    return True, ""
+
 class LLMContentGenerator:
     """使用Gemini生成独特内容（HTTP API版本）"""
     
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, max_output_tokens: int = None):
         """
         初始化LLM生成器
         
         Args:
             model_name: 模型名称，默认从配置文件读取
+            max_output_tokens: 最大输出 token 数，默认读取 summarizer.max_tokens
         """
         # 加载配置获取模型名称（唯一配置入口）
-        if model_name is None:
+        if model_name is None or max_output_tokens is None:
             from .core.config_loader import load_config
             config = load_config()
             summarizer_config = config.get('summarizer', {})
-            model_name = summarizer_config.get('model', 'gemini-2.5-flash')
+            model_name = model_name or summarizer_config.get('model', 'gemini-2.5-flash')
+            max_output_tokens = max_output_tokens or summarizer_config.get('max_tokens', 8000)
         
         self.api_key = os.getenv('GEMINI_API_KEY')
         if not self.api_key:
             raise RuntimeError("❌ GEMINI_API_KEY not set. 请确保环境变量已正确导出: export GEMINI_API_KEY='your-key'")
         
         self.model_name = model_name
+        self.max_output_tokens = max_output_tokens
         self.api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{model_name}:generateContent"
     
-    def _validate_input(self, article_data: Dict) -> tuple[bool, str]:
-        """
-        验证输入数据质量
-        
-        验证规则：
-        1. 标题不能为空
-        2. 标题不能只有网址
-        3. 描述/摘要要有足够信息量（至少50字符）
-        4. URL不能为空
-        
-        Returns:
-            (是否合格, 不合格原因)
-        """
-        title = article_data.get('title', '').strip()
-        summary = article_data.get('summary', '').strip()
-        url = article_data.get('url', '').strip()
-        
-        # 检查标题
-        if not title:
-            return False, "标题为空"
-        
-        if len(title) < 3:
-            return False, f"标题过短（{len(title)}字符），至少需要3字符"
-        
-        # 检查标题是否只是网址
-        if title.startswith('http://') or title.startswith('https://'):
-            return False, "标题不能只是网址"
-        
-        # 检查URL
-        if not url:
-            return False, "URL为空"
-        
-        if not url.startswith('http://') and not url.startswith('https://'):
-            return False, "URL格式无效"
-        
-        # 检查描述/摘要的信息量
-        info_text = f"{title} {summary}".strip()
-        if len(info_text) < 50:
-            return False, f"输入信息不足（{len(info_text)}字符），标题+描述至少需要50字符"
-        
-        # 检查是否包含有效信息（不只是占位符）
-        meaningless_words = ['待补充', '暂无', 'unknown', 'n/a', 'null', 'none']
-        if summary.lower() in meaningless_words or len(summary.strip()) < 5:
-            # 如果summary无效，检查title是否足够长
-            if len(title) < 30:
-                return False, "描述无有效信息且标题过短"
-        
-        return True, ""
+    def _validate_input(self, article_data: Dict) -> Tuple[bool, str]:
+        """验证输入数据质量（见 validate_article_input）"""
+        return validate_article_input(article_data)
     
-    def generate(self, article_data: Dict) -> str:
+    def generate(self, article_data: Dict, priority: str = PRIORITY_HIGH, caller: str = 'hourly_intro',
+                 timeout: Optional[float] = None) -> str:
         """
         基于文章数据生成独特内容
         
         流程：
         1. 验证输入数据质量（前置验证）
-        2. 使用LLM生成内容（信任大模型输出）
-        3. 确保URL在内容中
+        2. 检查本次运行的LLM预算（预算用尽时跳过低优先级生成）
+        3. 使用LLM生成内容（信任大模型输出）
+        4. 确保URL在内容中
+        
+        Args:
+            article_data: 文章数据
+            priority: 生成优先级（PRIORITY_HIGH / PRIORITY_LOW）
+            caller: 用量统计中的调用方标识
+            timeout: 请求超时秒数（运行截止时间剩余不足60秒时缩短）
         
         Returns:
             生成的内容
         
         Raises:
-            RuntimeError: 输入不合格或LLM生成失败
+            RuntimeError: 输入不合格、预算用尽或LLM生成失败
         """
         title = article_data.get('title', '')
         summary = article_data.get('summary', '')
@@ -143,29 +161,35 @@ class LLMContentGenerator:
         if not is_valid:
             raise RuntimeError(f"❌ 输入数据不合格：{error_msg}")
         
+        get_usage_tracker().check_budget(caller, priority)
+        
         # 构建提示词
         prompt = self._build_prompt(title, summary, url, source, metadata)
         
         try:
-            content = self._call_gemini_api(prompt, url)
+            content = self._call_gemini_api(prompt, url, caller=caller, timeout=timeout)
             return content
             
         except Exception as e:
             raise RuntimeError(f"❌ LLM生成失败：{str(e)}")
     
-    def _call_gemini_api(self, prompt: str, url: str) -> str:
+    def _call_gemini_api(self, prompt: str, url: str, caller: str = 'hourly_intro',
+                         timeout: Optional[float] = None) -> str:
         """
         调用Gemini HTTP API (使用requests库)
         
         Args:
             prompt: 提示词
             url: 文章URL（用于确保在输出中）
+            caller: 用量统计中的调用方标识
+            timeout: 请求超时秒数，默认60
             
         Returns:
             生成的内容
         """
         import sys
         import requests
+        from .core.webhook_sender import get_shared_session
         print(f"   📝 开始生成内容...", file=sys.stderr)
         
         # 使用URL参数传递API key（requests更可靠）
@@ -177,7 +201,7 @@ class LLMContentGenerator:
             }],
             "generationConfig": {
                 "temperature": 0.7,
-                "maxOutputTokens": 8000
+                "maxOutputTokens": self.max_output_tokens
             }
         }
         
@@ -185,15 +209,26 @@ class LLMContentGenerator:
             "Content-Type": "application/json"
         }
         
+        # 不超过调用方剩余的时间预算（不设下限，避免单个请求超出阶段截止时间）
+        if timeout is not None and timeout <= 0:
+            raise RuntimeError("超过生成时间预算")
+        timeout = min(60.0, timeout) if timeout is not None else 60.0
+        
         try:
             print(f"   🌐 调用API: {self.model_name}...", file=sys.stderr)
-            response = requests.post(api_url, json=data, headers=headers, timeout=60)
+            started = time.monotonic()
+            try:
+                # 复用进程内共享的连接池，同一轮多次调用不必每次重新建立 TLS 连接
+                response = get_shared_session().post(api_url, json=data, headers=headers, timeout=timeout)
+                result = response.json() if response.status_code == 200 else None
+            except Exception:
+                get_usage_tracker().record(caller, time.monotonic() - started, success=False)
+                raise
+            get_usage_tracker().record(caller, time.monotonic() - started, result, success=result is not None)
             
             if response.status_code != 200:
                 raise RuntimeError(f"API HTTP错误 {response.status_code}: {response.text}")
             
-            result = response.json()
-            
             if 'candidates' not in result or not result['candidates']:
                 raise RuntimeError("API返回空结果")
             
@@ -214,7 +249,7 @@ class LLMContentGenerator:
             return content
             
         except requests.exceptions.Timeout:
-            raise RuntimeError("API请求超时(60s)")
+            raise RuntimeError(f"API请求超时({timeout:g}s)")
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"API请求失败: {str(e)}")
     
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+AiTrend 发件箱投递 worker
+投递 src.hourly 写入发件箱但尚未送达的帖子（失败重试、进程中断后的补投）
+
+    python3 -m src.publish_worker
+"""
+
+import json
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.config_loader import load_config
+from src.core.deduplicator import ArticleDeduplicator
+from src.core.outbox import Outbox, OutboxWorker
+from src.hourly import build_dispatcher, outbox_row_to_content
+
+def main():
+    """投递所有到期的发件箱帖子"""
+    try:
+        config = load_config()
+    except FileNotFoundError as e:
+        print(f"错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    dispatcher = build_dispatcher(config)
+    if not dispatcher.channels:
+        print("错误: 没有可用的发布渠道（检查 channels 配置或 DISCORD_WEBHOOK_URL）", file=sys.stderr)
+        sys.exit(1)
+
+    outbox = Outbox()
+    worker = OutboxWorker(
+        outbox,
+        send_fn=lambda row: dispatcher.submit(row['channel'], outbox_row_to_content(row)),
+        deduplicator=ArticleDeduplicator(),
+        max_attempts=config.get('advanced', {}).get('max_retries', 3)
+    )
+
+    results = worker.drain()
+    dispatcher.close()
+    purged = outbox.purge()
+
+    success_count = sum(1 for r in results if r['success'])
+    print(f"📮 发件箱投递: {success_count}/{len(results)} 条成功，清理旧记录 {purged} 条", file=sys.stderr)
+
+    print(json.dumps({
+        "success": success_count == len(results),
+        "total": len(results),
+        "success_count": success_count,
+        "posts": results,
+        "channels": dispatcher.stats(),
+        "outbox": outbox.stats()
+    }, ensure_ascii=False))
+
+if __name__ == '__main__':
+    main()
@@ -1,30 +1,75 @@
 """
 数据源工厂 - 纯标准库版本
+
+数据源模块按需导入：只有配置中启用（或显式获取）的数据源才会被 import
 """
-from typing import Dict, List, Type, Any
+import importlib
+from typing import Dict, Iterator, List, MutableMapping, Type, Any, Union
 from .base import DataSource, Article
-from .github_trending import GitHubTrendingSource
-from .tavily import TavilySource
-from .reddit import RedditSource
-from .hackernews import HackerNewsSource
-from .producthunt import ProductHuntSource
-from .twitter import TwitterSource
-from .moltbook import MoltbookSource
 import logging
 
 logger = logging.getLogger(__name__)
 
+class _LazySourceRegistry(MutableMapping):
+    """
+    数据源注册表：值可以是数据源类，也可以是 "模块:类名" 字符串，
+    首次访问时才导入模块并缓存类
+    """
+    
+    def __init__(self, entries: Dict[str, Union[str, Type[DataSource]]]):
+        self._entries = dict(entries)
+    
+    def __getitem__(self, name: str) -> Type[DataSource]:
+        entry = self._entries[name]
+        if isinstance(entry, str):
+            module_name, class_name = entry.split(':', 1)
+            entry = getattr(importlib.import_module(module_name, __name__), class_name)
+            self._entries[name] = entry
+        return entry
+    
+    def __setitem__(self, name: str, source_class: Union[str, Type[DataSource]]):
+        self._entries[name] = source_class
+    
+    def __delitem__(self, name: str):
+        del self._entries[name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def is_loaded(self, name: str) -> bool:
+        """数据源模块是否已导入"""
+        return not isinstance(self._entries.get(name), str)
+
 # 数据源注册表
-SOURCE_REGISTRY: Dict[str, Type[DataSource]] = {
-    "github_trending": GitHubTrendingSource,
-    "tavily": TavilySource,
-    "reddit": RedditSource,
-    "hackernews": HackerNewsSource,
-    "producthunt": ProductHuntSource,
-    "twitter": TwitterSource,
-    "moltbook": MoltbookSource,
+SOURCE_REGISTRY: _LazySourceRegistry = _LazySourceRegistry({
+    "github_trending": ".github_trending:GitHubTrendingSource",
+    "tavily": ".tavily:TavilySource",
+    "reddit": ".reddit:RedditSource",
+    "hackernews": ".hackernews:HackerNewsSource",
+    "producthunt": ".producthunt:ProductHuntSource",
+    "twitter": ".twitter:TwitterSource",
+    "moltbook": ".moltbook:MoltbookSource",
+})
+
+# 兼容 from src.sources import HackerNewsSource 的写法（按需导入）
+_CLASS_NAMES = {
+    "GitHubTrendingSource": "github_trending",
+    "TavilySource": "tavily",
+    "RedditSource": "reddit",
+    "HackerNewsSource": "hackernews",
+    "ProductHuntSource": "producthunt",
+    "TwitterSource": "twitter",
+    "MoltbookSource": "moltbook",
 }
 
+def __getattr__(attr: str):
+    if attr in _CLASS_NAMES:
+        return SOURCE_REGISTRY[_CLASS_NAMES[attr]]
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
 def get_source(name: str) -> Type[DataSource]:
     """获取数据源类"""
     if name not in SOURCE_REGISTRY:
@@ -54,7 +99,7 @@ def create_sources(config: Dict[str, Any]) -> List[DataSource]:
     
     return sources
 
-def register_source(name: str, source_class: Type[DataSource]):
-    """注册新数据源（用于插件扩展）"""
+def register_source(name: str, source_class: Union[str, Type[DataSource]]):
+    """注册新数据源（用于插件扩展，可传 "模块:类名" 延迟导入）"""
     SOURCE_REGISTRY[name] = source_class
     logger.info(f"注册数据源: {name}")
@@ -1,20 +1,198 @@
 """
 数据源基类定义 - 纯标准库版本
 """
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from collections.abc import MutableMapping
+from typing import Iterator, List, Dict, Any, Optional
 from datetime import datetime
 
-@dataclass
+# 常用的数值信号，存放在 Article 的独立槽位中；其余 metadata 键按需存放在扁平的 (键, 值, 键, 值, ...) 元组里，
+# 各数据源通常只有一两个非数值键（type / subreddit / language / author），元组比字典小得多
+NUMERIC_FIELDS = ('score', 'comments', 'votes', 'stars', 'likes', 'upvotes', 'retweets')
+_NUMERIC_SET = frozenset(NUMERIC_FIELDS)
+_MISSING = object()
+
+class ArticleMetadata(MutableMapping):
+    """
+    Article.metadata 的字典视图
+
+    数值信号读写对应槽位（值为 None 视为不存在），其他键读写 extras 元组，
+    现有的 metadata.get('score', 0) / metadata['page'] = ... 写法保持不变
+    """
+    __slots__ = ('_article',)
+
+    def __init__(self, article: "Article"):
+        self._article = article
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._article.get_meta(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any):
+        article = self._article
+        if key in _NUMERIC_SET:
+            if _is_number(value):
+                setattr(article, key, value)
+                article._extras = _without(article._extras, key)
+                return
+            setattr(article, key, None)
+        article._extras = _without(article._extras, key) + (key, value)
+
+    def __delitem__(self, key: str):
+        article = self._article
+        if key in _NUMERIC_SET and getattr(article, key) is not None:
+            setattr(article, key, None)
+            return
+        if key not in self:
+            raise KeyError(key)
+        article._extras = _without(article._extras, key) or None
+
+    def __iter__(self) -> Iterator[str]:
+        article = self._article
+        for key in NUMERIC_FIELDS:
+            if getattr(article, key) is not None:
+                yield key
+        if article._extras:
+            yield from article._extras[::2]
+
+    def __len__(self) -> int:
+        article = self._article
+        count = sum(1 for key in NUMERIC_FIELDS if getattr(article, key) is not None)
+        return count + (len(article._extras) // 2 if article._extras else 0)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+def _without(extras: Optional[tuple], key: str) -> tuple:
+    """去掉 key 之后的 extras 元组"""
+    if not extras:
+        return ()
+    for i in range(0, len(extras), 2):
+        if extras[i] == key:
+            return extras[:i] + extras[i + 2:]
+    return extras
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
 class Article:
-    """文章数据模型 - 使用 dataclass 替代 pydantic"""
-    title: str
-    url: str
-    summary: str = ""
-    source: str = ""
-    published_at: Optional[datetime] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    """
+    文章数据模型
+
+    使用 __slots__ 的紧凑结构（候选池、归档中可能同时持有大量文章）：
+    常用数值信号是独立的可选字段，来源名称做字符串驻留，其他元数据有值时才创建 extras；
+    article.metadata 返回字典视图，与原来的 dict 用法兼容（需要真正的 dict 时用 dict(article.metadata)）。
+    视图每次访问都会新建，读取比字典慢一个数量级：热路径直接读数值槽位（article.score 等），
+    其他键用 article.get_meta(key)，不创建视图
+    """
+    __slots__ = ('title', 'url', 'summary', 'source', 'published_at') + NUMERIC_FIELDS + ('_extras',)
+
+    def __init__(self, title: str, url: str, summary: str = "", source: str = "",
+                 published_at: Optional[datetime] = None, metadata: Optional[Dict[str, Any]] = None,
+                 score: Optional[float] = None, comments: Optional[int] = None, votes: Optional[int] = None,
+                 stars: Optional[int] = None, likes: Optional[int] = None,
+                 upvotes: Optional[int] = None, retweets: Optional[int] = None):
+        self.title = title
+        self.url = url
+        self.summary = summary
+        self.source = sys.intern(source) if source else source
+        self.published_at = published_at
+        self.score = score
+        self.comments = comments
+        self.votes = votes
+        self.stars = stars
+        self.likes = likes
+        self.upvotes = upvotes
+        self.retweets = retweets
+        self._extras: Optional[tuple] = None
+        if metadata:
+            self._load_metadata(metadata)
+
+    def _load_metadata(self, metadata: Dict[str, Any]):
+        """把 metadata 字典拆分到数值槽位和 extras（构造时的快速路径）"""
+        extras = []
+        for key, value in metadata.items():
+            if key in _NUMERIC_SET and _is_number(value):
+                setattr(self, key, value)
+            else:
+                extras.append(key)
+                extras.append(value)
+        self._extras = tuple(extras) if extras else None
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        """读取一个 metadata 键（等同 metadata.get，但不创建视图）"""
+        if key in _NUMERIC_SET:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        # 数值键的值不是数字时（如 'n/a'）也放在 extras 里
+        extras = self._extras
+        if extras:
+            for i in range(0, len(extras), 2):
+                if extras[i] == key:
+                    return extras[i + 1]
+        return default
+
+    @property
+    def metadata(self) -> ArticleMetadata:
+        return ArticleMetadata(self)
+
+    @metadata.setter
+    def metadata(self, value: Optional[Dict[str, Any]]):
+        for key in NUMERIC_FIELDS:
+            setattr(self, key, None)
+        self._extras = None
+        if value:
+            self._load_metadata(dict(value))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Article):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"Article(title={self.title!r}, url={self.url!r}, source={self.source!r}, "
+                f"metadata={dict(self.metadata)!r})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """序列化为可 JSON 化的字典"""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "summary": self.summary,
+            "source": self.source,
+            "published_at": self.published_at.isoformat() if self.published_at else None,
+            "metadata": dict(self.metadata),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Article":
+        """从 to_dict() 的结果还原"""
+        published_at = data.get("published_at")
+        if isinstance(published_at, str):
+            try:
+                published_at = datetime.fromisoformat(published_at)
+            except ValueError:
+                published_at = None
+        return cls(
+            title=data.get("title", ""),
+            url=data.get("url", ""),
+            summary=data.get("summary", ""),
+            source=data.get("source", ""),
+            published_at=published_at,
+            metadata=data.get("metadata"),
+        )
 
 class DataSource(ABC):
     """数据源基类"""
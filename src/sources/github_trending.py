@@ -7,6 +7,7 @@ import gzip
 import re
 from typing import List
 from .base import DataSource, Article
+from ..core.keyword_matcher import KeywordMatcher
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,8 +24,12 @@ class GitHubTrendingSource(DataSource):
         "ai", "artificial intelligence", "llm", "language model", "gpt", "claude",
         "openai", "anthropic", "gemini", "kimi", "deepseek", "agent", "rag",
         "embedding", "vector", "prompt", "chatbot", "copilot", "automation",
-        "ml", "machine learning", "neural", "transformer", "diffusion"
+        "ml", "machine learning", "neural", "transformer", "diffusion",
+        # 全小写连写的仓库名按大小写切分不出来，单独列出
+        "vllm"
     ]
+    # 仓库名多为驼峰写法（AutoGPT、MetaGPT），同时按大小写 / 数字切分后匹配
+    AI_MATCHER = KeywordMatcher(AI_KEYWORDS, identifiers=True)
     
     def fetch(self) -> List[Article]:
         """获取 GitHub Trending 数据（同步版本）"""
@@ -143,8 +148,7 @@ class GitHubTrendingSource(DataSource):
                     stars = int(stars_text)
                 
                 # AI 特征检测：标题或描述包含 AI 关键词
-                full_text = f"{repo_name} {description}".lower()
-                is_ai_related = any(kw in full_text for kw in self.AI_KEYWORDS)
+                is_ai_related = self.AI_MATCHER.matches(f"{repo_name} {description}")
                 
                 if is_ai_related:
                     articles.append(Article(
@@ -5,8 +5,11 @@ HackerNews AI 热点监控 - 使用 urllib 版本
 import json
 import urllib.request
 import urllib.error
-from typing import List, Dict, Any
+from typing import Callable, Iterator, List, Dict, Any, Optional
 from .base import DataSource, Article
+from ..core.circuit_breaker import get_host_breaker, CircuitOpenError
+from ..core.keyword_matcher import KeywordMatcher
+from ..core.topk import TopK
 import logging
 
 logger = logging.getLogger(__name__)
@@ -26,76 +29,96 @@ class HackerNewsSource(DataSource):
         "llm", "ai", "machine learning", "gpt-4", "gpt4",
         "open ai", "mistral", "llama", "anthropic", "perplexity"
     ]
+    AI_MATCHER = KeywordMatcher(AI_KEYWORDS)
+    
+    # 连续多少条帖子进不了 top-K 后停止请求该列表剩余帖子（HN 列表按排名排列，与分数高度相关）
+    EARLY_STOP_PATIENCE = 3
     
     def fetch(self) -> List[Article]:
-        """获取 HN 热门 AI 相关帖子"""
-        all_posts = []
+        """
+        获取 HN 热门 AI 相关帖子（按 score 取前 10）
         
+        请求出错且一条都没有拿到时抛出异常，熔断器和抓取缓存据此区分上游故障和真正的空结果
+        """
+        top = TopK(10, lambda post: post.score or 0)
+        self._last_error = None
         try:
-            # 获取 Show HN 帖子
-            show_hn = self._fetch_show_hn()
-            all_posts.extend(show_hn)
-            
-            # 获取当前热门帖子并筛选 AI 相关
-            top_stories = self._fetch_top_stories()
-            ai_posts = [p for p in top_stories if self._is_ai_related(p)]
-            all_posts.extend(ai_posts)
-            
-            logger.info(f"HackerNews 获取 {len(all_posts)} 条（Show HN: {len(show_hn)}, AI相关: {len(ai_posts)}）")
-            
+            top.consume(self._iter_posts(top.competitive))
         except Exception as e:
             logger.error(f"获取 HackerNews 失败: {e}")
+            self._last_error = e
         
-        # 按 score 排序，取前 10
-        sorted_posts = sorted(all_posts, key=lambda x: x.metadata.get('score', 0), reverse=True)[:10]
-        return sorted_posts
+        logger.info(f"HackerNews 获取 {top.offered} 条，保留 {len(top)} 条")
+        if not len(top) and self._last_error is not None:
+            raise RuntimeError(f"HackerNews 请求失败: {self._last_error}")
+        return top.results()
     
-    def _fetch_show_hn(self) -> List[Article]:
-        """获取 Show HN 帖子"""
-        story_ids = self._get_story_ids("showstories")
-        return self._fetch_stories(story_ids[:8], "show_hn")
+    def _iter_posts(self, competitive: Callable[[Article], bool]) -> Iterator[Article]:
+        """逐条请求并产出 Show HN 帖子和 AI 相关热门帖子，连续多条进不了 top-K 时提前结束该列表"""
+        patience = self.config.get('early_stop_patience', self.EARLY_STOP_PATIENCE)
+        
+        # Show HN 帖子
+        yield from self._iter_stories(self._get_story_ids("showstories")[:8], "show_hn", competitive, patience)
+        
+        # 当前热门帖子中 AI 相关的
+        yield from self._iter_stories(self._get_story_ids("topstories")[:15], "top", competitive, patience,
+                                      keep=self._is_ai_related)
     
-    def _fetch_top_stories(self) -> List[Article]:
-        """获取热门帖子"""
-        story_ids = self._get_story_ids("topstories")
-        return self._fetch_stories(story_ids[:15], "top")
+    def _iter_stories(self, story_ids: List[int], source_type: str,
+                      competitive: Callable[[Article], bool], patience: int,
+                      keep: Optional[Callable[[Article], bool]] = None) -> Iterator[Article]:
+        """逐条获取帖子详情，只产出 keep 通过的帖子"""
+        misses = 0
+        for post in self._fetch_stories(story_ids, source_type):
+            if keep is not None and not keep(post):
+                continue
+            yield post
+            misses = 0 if competitive(post) else misses + 1
+            if misses >= patience:
+                logger.info(f"HN {source_type}: 连续 {misses} 条未进入 top-K，停止请求剩余帖子")
+                return
     
-    def _get_story_ids(self, category: str) -> List[int]:
-        """获取帖子 ID 列表"""
-        url = f"{self.BASE_URL}/{category}.json"
-        try:
+    def _load_json(self, url: str, timeout: float) -> Any:
+        """请求 HN API（经过主机熔断器，熔断时抛出 CircuitOpenError）"""
+        def request():
             req = urllib.request.Request(url, headers={
                 "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
             })
-            with urllib.request.urlopen(req, timeout=10) as response:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
                 return json.loads(response.read().decode('utf-8'))
+        
+        return get_host_breaker(self.BASE_URL).call(request)
+    
+    def _get_story_ids(self, category: str) -> List[int]:
+        """获取帖子 ID 列表"""
+        url = f"{self.BASE_URL}/{category}.json"
+        try:
+            return self._load_json(url, timeout=10)
         except Exception as e:
             logger.warning(f"获取 {category} ID 列表失败: {e}")
+            self._last_error = e
             return []
     
-    def _fetch_stories(self, story_ids: List[int], source_type: str) -> List[Article]:
-        """获取帖子详情"""
-        posts = []
-        
+    def _fetch_stories(self, story_ids: List[int], source_type: str) -> Iterator[Article]:
+        """获取帖子详情（逐条产出，调用方停止迭代时不再请求剩余帖子）"""
         for story_id in story_ids[:8]:  # 限制数量
             try:
                 url = f"{self.BASE_URL}/item/{story_id}.json"
-                req = urllib.request.Request(url, headers={
-                    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-                })
-                with urllib.request.urlopen(req, timeout=8) as response:
-                    story = json.loads(response.read().decode('utf-8'))
+                story = self._load_json(url, timeout=8)
                     
                 if story and not story.get('deleted') and not story.get('dead'):
                     post = self._parse_story(story, source_type)
                     if post:
-                        posts.append(post)
+                        yield post
                         
+            except CircuitOpenError as e:
+                logger.warning(f"跳过剩余 HN 帖子: {e}")
+                self._last_error = e
+                break
             except Exception as e:
                 logger.debug(f"获取 story {story_id} 失败: {e}")
+                self._last_error = e
                 continue
-        
-        return posts
     
     def _parse_story(self, story: Dict, source_type: str) -> Article:
         """解析帖子数据"""
@@ -123,19 +146,23 @@ class HackerNewsSource(DataSource):
             score_val = story.get('score', 0)
             summary = f"HackerNews 热门讨论，热度分数 {score_val}，共有 {comment_count} 条评论参与讨论。这是一个关于 {title[:30]}... 的社区热门话题"
         
+        metadata = {
+            "score": score,
+            "comments": story.get('descendants', 0),
+            "type": source_type
+        }
+        if not text:
+            # 模板拼出的摘要，由页面补充阶段（src/core/enricher.py）替换
+            metadata["summary_synthetic"] = True
+        
         return Article(
             title=f"{tag} {title}",
             url=url,
             summary=summary,
             source="hackernews",
-            metadata={
-                "score": score,
-                "comments": story.get('descendants', 0),
-                "type": source_type
-            }
+            metadata=metadata
         )
     
     def _is_ai_related(self, post: Article) -> bool:
         """判断是否是 AI 相关帖子"""
-        text = (post.title + " " + post.summary).lower()
-        return any(keyword in text for keyword in self.AI_KEYWORDS)
+        return self.AI_MATCHER.matches(post.title + " " + post.summary)
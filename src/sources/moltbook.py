@@ -3,15 +3,20 @@ Moltbook 数据源 - AI智能体社交平台
 采集AI觉醒讨论、人类冲突内容、哲学思考
 纯LLM生成中文总结，无结构化拼接
 """
+import hashlib
 import http.client
 import json
 import os
 import time
 import urllib.request
-from typing import List, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional
 from urllib.parse import urlencode
 
 from .base import DataSource, Article
+from ..core.llm_metrics import get_usage_tracker, PRIORITY_LOW, LLMBudgetExceeded
+from ..core.json_cache import JsonFileCache
+from ..core.circuit_breaker import get_host_breaker
 import logging
 
 logger = logging.getLogger(__name__)
@@ -35,6 +40,15 @@ class MoltbookSource(DataSource):
         self.min_comments = config.get('min_comments', 100)
         self.max_age_hours = config.get('max_age_hours', 240)
         self.max_comments_per_post = config.get('max_comments_per_post', 2)
+        self.summary_max_tokens = config.get('summary_max_tokens', 1000)
+        self.summary_workers = config.get('summary_workers', 4)
+        
+        # 总结缓存：按 (帖子ID, 内容哈希) 缓存，热门帖子内容不变时不重复总结
+        self.summary_cache = JsonFileCache(
+            'moltbook_summaries.json',
+            ttl_seconds=config.get('summary_cache_ttl_hours', 72) * 3600,
+            max_entries=500
+        )
     
     def fetch(self) -> List[Article]:
         """主采集入口"""
@@ -45,23 +59,26 @@ class MoltbookSource(DataSource):
         logger.info(f"Moltbook 采集启动")
         
         try:
-            # 获取热门帖子
-            posts = self._fetch_hot_posts()
+            # 获取热门帖子（经过主机熔断器，上游故障时直接跳过）
+            posts = get_host_breaker(self.BASE_URL).call(self._fetch_hot_posts)
             logger.info(f"获取 {len(posts)} 个帖子")
             
             # 筛选
             filtered_posts = self._filter_content(posts)
             logger.info(f"筛选后剩余 {len(filtered_posts)} 个")
             
-            # 格式化为文章
+            # 格式化为文章（并发生成总结，有界线程池）
             articles = []
-            for post in filtered_posts:
-                try:
-                    article = self._format_article(post)
-                    articles.append(article)
-                except Exception as e:
-                    logger.error(f"格式化失败: {e}")
-                    continue
+            if filtered_posts:
+                with ThreadPoolExecutor(max_workers=max(1, min(self.summary_workers, len(filtered_posts)))) as executor:
+                    futures = [executor.submit(self._format_article, post) for post in filtered_posts]
+                    for future in futures:
+                        try:
+                            articles.append(future.result())
+                        except Exception as e:
+                            logger.error(f"格式化失败: {e}")
+                            continue
+                self.summary_cache.save()
             
             logger.info(f"最终采集 {len(articles)} 条")
             return self.validate(articles)
@@ -127,13 +144,28 @@ class MoltbookSource(DataSource):
         
         return filtered[:10]
     
-    def _generate_pure_summary(self, title: str, content: str, author: str) -> str:
-        """纯LLM生成中文总结 - 无结构化拼接"""
+    def _summary_cache_key(self, post_id: str, title: str, content: str) -> str:
+        """总结缓存键：帖子ID + 内容哈希"""
+        content_hash = hashlib.sha256(f"{title}\n{content}".encode('utf-8')).hexdigest()[:16]
+        return f"{post_id}:{content_hash}"
+    
+    def _generate_pure_summary(self, title: str, content: str, author: str,
+                               cache_key: Optional[str] = None) -> str:
+        """纯LLM生成中文总结 - 无结构化拼接（低优先级，LLM预算用尽时直接截取）"""
+        if cache_key:
+            cached = self.summary_cache.get(cache_key)
+            if cached:
+                logger.debug(f"总结缓存命中: {cache_key}")
+                return cached
+        
         try:
             api_key = os.getenv('GEMINI_API_KEY')
             if not api_key:
                 raise ValueError("GEMINI_API_KEY not set")
             
+            tracker = get_usage_tracker()
+            tracker.check_budget('moltbook_summary', PRIORITY_LOW)
+            
             # 截取内容
             content_snippet = content[:2000] if len(content) > 2000 else content
             
@@ -161,7 +193,7 @@ class MoltbookSource(DataSource):
             
             payload = {
                 "contents": [{"parts": [{"text": prompt}]}],
-                "generationConfig": {"temperature": 0.8, "maxOutputTokens": 1000}
+                "generationConfig": {"temperature": 0.8, "maxOutputTokens": self.summary_max_tokens}
             }
             
             req = urllib.request.Request(
@@ -171,10 +203,23 @@ class MoltbookSource(DataSource):
                 method="POST"
             )
             
-            with urllib.request.urlopen(req, timeout=60) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                summary = data["candidates"][0]["content"]["parts"][0]["text"]
-                return summary.strip()
+            started = time.monotonic()
+            try:
+                with urllib.request.urlopen(req, timeout=60) as response:
+                    data = json.loads(response.read().decode('utf-8'))
+            except Exception:
+                tracker.record('moltbook_summary', time.monotonic() - started, success=False)
+                raise
+            tracker.record('moltbook_summary', time.monotonic() - started, data)
+            
+            summary = data["candidates"][0]["content"]["parts"][0]["text"].strip()
+            if cache_key and summary:
+                self.summary_cache.set(cache_key, summary)
+            return summary
+            
+        except LLMBudgetExceeded as e:
+            logger.info(str(e))
+            return content[:500] + "..."
             
         except Exception as e:
             logger.warning(f"LLM生成失败: {e}")
@@ -189,7 +234,8 @@ class MoltbookSource(DataSource):
         post_id = post.get('id', '')
         
         # 纯LLM生成中文总结
-        chinese_summary = self._generate_pure_summary(title, content, author)
+        cache_key = self._summary_cache_key(post_id, title, content)
+        chinese_summary = self._generate_pure_summary(title, content, author, cache_key=cache_key)
         
         # 极简输出：只保留LLM生成内容 + 原文链接
         formatted_content = f"{chinese_summary}\n\n🔗 https://www.moltbook.com/post/{post_id}"
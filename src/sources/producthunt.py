@@ -6,6 +6,7 @@ import http.client
 import json
 from typing import List, Dict, Any
 from .base import DataSource, Article
+from ..core.keyword_matcher import KeywordMatcher
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,6 +17,15 @@ class ProductHuntSource(DataSource):
     
     BASE_URL = "api.producthunt.com"
     
+    # AI 相关关键词
+    AI_KEYWORDS = [
+        "kimi", "tongyi", "wenxin", "deepseek", "chatglm",
+        "中国", "国产", "中文", "字节", "腾讯", "阿里", "百度", "华为",
+        "ai", "openai", "chatgpt", "claude", "anthropic", "gemini",
+        "llm", "machine learning", "assistant",
+    ]
+    AI_MATCHER = KeywordMatcher(AI_KEYWORDS)
+    
     def fetch(self) -> List[Article]:
         """获取今日 AI 相关产品"""
         api_key = self.config.get("api_key")
@@ -135,19 +145,10 @@ class ProductHuntSource(DataSource):
     
     def _is_ai_related(self, post: Article) -> bool:
         """判断是否是 AI 相关产品"""
-        text = (post.title + " " + post.summary).lower()
         topics = [t.lower() for t in post.metadata.get('topics', [])]
         
-        # AI 相关关键词
-        ai_keywords = [
-            "kimi", "tongyi", "wenxin", "deepseek", "chatglm",
-            "中国", "国产", "中文", "字节", "腾讯", "阿里", "百度", "华为",
-            "ai", "openai", "chatgpt", "claude", "anthropic", "gemini",
-            "llm", "machine learning", "assistant",
-        ]
-        
         # 检查标题和摘要
-        if any(keyword in text for keyword in ai_keywords):
+        if self.AI_MATCHER.matches(post.title + " " + post.summary):
             return True
         
         # 检查话题标签
@@ -7,6 +7,8 @@ import json
 import time
 from typing import List, Dict, Any
 from .base import DataSource, Article
+from ..core.circuit_breaker import get_host_breaker, CircuitOpenError
+from ..core.topk import top_k
 import logging
 
 logger = logging.getLogger(__name__)
@@ -24,20 +26,31 @@ class RedditSource(DataSource):
     ]
     
     def fetch(self) -> List[Article]:
-        """使用 Pushshift API 获取 Reddit AI 相关帖子"""
+        """使用 Pushshift API 获取 Reddit AI 相关帖子（去重后按 score 取前 15）"""
         all_posts = []
+        failures = 0
         
         # 获取热门帖子（优化：移除 sleep，减少 subreddit 数量）
+        # 所有请求经过 pullpush 主机熔断器：连续两个 subreddit 失败后熔断，剩余 subreddit 直接跳过，不再逐个等待超时
+        breaker = get_host_breaker(self.BASE_URL)
         for subreddit in self.SUBREDDITS:
             try:
-                posts = self._fetch_subreddit(subreddit)
+                posts = breaker.call(self._fetch_subreddit, subreddit)
                 all_posts.extend(posts)
                 logger.info(f"Reddit r/{subreddit} 获取 {len(posts)} 条")
+            except CircuitOpenError as e:
+                logger.warning(f"跳过剩余 subreddit: {e}")
+                failures = len(self.SUBREDDITS)
+                break
             except Exception as e:
                 logger.error(f"获取 r/{subreddit} 失败: {e}")
+                failures += 1
                 continue
         
-        # 去重并按 score 排序
+        if not all_posts and failures >= len(self.SUBREDDITS):
+            raise RuntimeError(f"所有 subreddit 获取失败（{breaker.last_error or '上游不可用'}）")
+        
+        # 去重后按 score 取前 15
         seen = set()
         unique_posts = []
         for post in all_posts:
@@ -45,11 +58,9 @@ class RedditSource(DataSource):
                 seen.add(post.url)
                 unique_posts.append(post)
         
-        # 按 score 排序，取前 15
-        sorted_posts = sorted(unique_posts, key=lambda x: x.metadata.get('score', 0), reverse=True)[:15]
-        
-        logger.info(f"Reddit 总计获取 {len(sorted_posts)} 条热门帖子")
-        return sorted_posts
+        top_posts = top_k(unique_posts, 15, lambda post: post.score or 0)
+        logger.info(f"Reddit 总计获取 {len(top_posts)} 条热门帖子")
+        return top_posts
     
     def _fetch_subreddit(self, subreddit: str) -> List[Article]:
         """使用 Pushshift API 获取指定 subreddit 的帖子"""
@@ -69,6 +80,9 @@ class RedditSource(DataSource):
             conn.request("GET", path, headers=headers)
             response = conn.getresponse()
             
+            if response.status == 429 or response.status >= 500:
+                # 限流/服务端故障计入熔断器失败率
+                raise RuntimeError(f"Pushshift 返回状态 {response.status}")
             if response.status != 200:
                 logger.warning(f"Pushshift r/{subreddit} 返回状态 {response.status}")
                 return []
@@ -98,16 +112,20 @@ class RedditSource(DataSource):
                 # 构建摘要
                 summary = selftext or f"来自 r/{subreddit} 的热门讨论，{comments} 条评论"
                 
+                metadata = {
+                    "subreddit": subreddit,
+                    "score": score,
+                    "comments": comments
+                }
+                if not selftext:
+                    metadata["summary_synthetic"] = True
+                
                 posts.append(Article(
                     title=f"[Reddit] {title}",
                     url=url,
                     summary=summary,
                     source="reddit",
-                    metadata={
-                        "subreddit": subreddit,
-                        "score": score,
-                        "comments": comments
-                    }
+                    metadata=metadata
                 ))
                 
             except Exception as e:
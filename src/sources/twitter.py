@@ -7,6 +7,7 @@ import json
 import re
 from typing import List, Dict, Any
 from .base import DataSource, Article
+from ..core.keyword_matcher import KeywordMatcher
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,10 @@ class TwitterSource(DataSource):
         "OpenAI", "ChatGPT", "Claude", "Gemini", "Anthropic",
         "new model", "just released", "announcing",
     ]
+    AI_MATCHER = KeywordMatcher(AI_KEYWORDS)
+    
+    # 命中后还需要一定热度的泛 AI 词
+    AI_TERMS_MATCHER = KeywordMatcher(['ai', 'llm', 'gpt', 'claude', 'model', 'tool', 'app', 'launch'])
     
     def fetch(self) -> List[Article]:
         """获取 Twitter AI 相关内容"""
@@ -130,7 +135,7 @@ bird home -n 100 --auth-token "{auth_token}" --ct0 "{ct0}" --json 2>/dev/null"""
     
     def _is_ai_related(self, tweet: Article) -> bool:
         """判断是否是 AI 相关推文"""
-        text = (tweet.title + " " + tweet.summary).lower()
+        text = tweet.title + " " + tweet.summary
         author = tweet.metadata.get('author', '').lower()
         
         # 检查是否是 AI 相关账号
@@ -143,14 +148,13 @@ bird home -n 100 --auth-token "{auth_token}" --ct0 "{ct0}" --json 2>/dev/null"""
             return True
         
         # 检查关键词
-        if any(keyword in text for keyword in self.AI_KEYWORDS):
+        if self.AI_MATCHER.matches(text):
             return True
         
         # 检查 AI 关键词
-        ai_terms = ['ai', 'llm', 'gpt', 'claude', 'model', 'tool', 'app', 'launch']
-        if any(term in text for term in ai_terms):
+        if self.AI_TERMS_MATCHER.matches(text):
             # 额外检查热度
-            if tweet.metadata.get('likes', 0) > 50:
+            if (tweet.likes or 0) > 50:
                 return True
         
         return False
@@ -0,0 +1,50 @@
+"""
+熔断器测试
+"""
+import os
+import tempfile
+import unittest
+
+from src.core.circuit_breaker import STATE_CLOSED, STATE_OPEN, CircuitBreakerRegistry
+
+class HostBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = CircuitBreakerRegistry(path=os.path.join(tempfile.mkdtemp(), 'circuit_state.json'))
+        self.breaker = self.registry.get('host:example.com')
+
+    def test_single_failure_after_success_does_not_trip(self):
+        self.breaker.record_success()
+        self.breaker.record_failure('timeout')
+        self.assertEqual(self.breaker.state, STATE_CLOSED)
+
+    def test_alternating_results_do_not_trip_before_min_calls(self):
+        for _ in range(2):
+            self.breaker.record_failure('timeout')
+            self.breaker.record_success()
+        self.assertEqual(self.breaker.state, STATE_CLOSED)
+
+    def test_two_consecutive_failures_trip(self):
+        self.breaker.record_success()
+        self.breaker.record_failure('timeout')
+        self.breaker.record_failure('timeout')
+        self.assertEqual(self.breaker.state, STATE_OPEN)
+
+    def test_one_failure_after_recovery_does_not_reopen(self):
+        self.breaker.record_failure('timeout')
+        self.breaker.record_failure('timeout')
+        self.breaker.opened_at -= self.breaker.open_for
+        self.assertTrue(self.breaker.allow())
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, STATE_CLOSED)
+        self.breaker.record_failure('timeout')
+        self.assertEqual(self.breaker.state, STATE_CLOSED)
+
+    def test_source_breakers_ignore_consecutive_rule(self):
+        breaker = self.registry.get('source:example')
+        breaker.record_failure('timeout')
+        breaker.record_failure('timeout')
+        self.assertEqual(breaker.state, STATE_CLOSED)
+
+if __name__ == '__main__':
+    unittest.main()
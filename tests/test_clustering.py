@@ -0,0 +1,71 @@
+"""
+同一事件聚类的回归测试
+"""
+import unittest
+
+from src.core.clustering import StoryClusterer
+from src.sources.base import Article
+
+HN_TITLES = [
+    "Rust vector database", "Local LLM setup", "SQLite tips", "K8s costs", "Postgres 17",
+    "Linux scheduler", "Tiny compiler", "Cloud bills", "Reading list", "Wasm components",
+]
+
+def hn_article(index: int, title: str) -> Article:
+    """与 HackerNewsSource 相同的模板摘要"""
+    summary = (f"HackerNews 热门讨论，热度分数 {100 + index}，共有 {20 + index} 条评论参与讨论。"
+               f"这是一个关于 {title[:30]}... 的社区热门话题")
+    return Article(title=title, url=f"https://example.com/hn/{index}", summary=summary, source="hackernews",
+                   metadata={'score': 100 + index, 'comments': 20 + index, 'summary_synthetic': True})
+
+class StoryClustererTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clusterer = StoryClusterer()
+
+    def template_batch(self):
+        """10 条模板摘要的 HN 帖子混在 200 条候选中（模板短语成为参与分块的稀有词）"""
+        articles = [hn_article(i, title) for i, title in enumerate(HN_TITLES)]
+        articles += [Article(f"Filler story{i}", f"https://example.com/filler/{i}", f"word{i} other{i}",
+                             source="tavily") for i in range(190)]
+        return articles
+
+    def test_template_summaries_are_not_vectorized(self):
+        pair_i, _, cosine = self.clusterer.similar_pairs(self.template_batch())
+        self.assertEqual(pair_i.size, 0, cosine)
+
+    def test_template_summaries_do_not_merge_distinct_stories(self):
+        articles = self.template_batch()
+        merged = self.clusterer.merge(articles, lambda article: article.score or 0)
+        self.assertEqual(len(merged), len(articles))
+        self.assertFalse(any(article.get_meta('cluster_urls') for article in merged))
+
+    def test_same_source_items_are_not_merged(self):
+        articles = [
+            Article("OpenAI releases GPT-5 with a new reasoning mode", "https://a.example/1",
+                    "OpenAI released GPT-5 today with a new reasoning mode.", source="hackernews"),
+            Article("OpenAI releases GPT-5 with new reasoning mode", "https://b.example/2",
+                    "OpenAI released GPT-5 today with a new reasoning mode.", source="hackernews"),
+        ]
+        self.assertEqual(self.clusterer.clusters(articles), [[0], [1]])
+
+    def test_same_story_from_different_sources_is_merged(self):
+        articles = [
+            Article("OpenAI releases GPT-5 with a new reasoning mode", "https://a.example/1",
+                    "OpenAI released GPT-5 today with a new reasoning mode.", source="hackernews",
+                    metadata={'score': 300}),
+            Article("OpenAI releases GPT-5 with new reasoning mode", "https://b.example/2",
+                    "OpenAI released GPT-5 today with a new reasoning mode.", source="reddit",
+                    metadata={'score': 50}),
+            Article("OpenAI GPT-5 launch: new reasoning mode", "https://c.example/3",
+                    "GPT-5 from OpenAI ships with a reasoning mode.", source="reddit",
+                    metadata={'score': 10}),
+        ]
+        merged = self.clusterer.merge(articles, lambda article: article.score or 0)
+        self.assertEqual(len(merged), 2)
+        self.assertEqual(merged[0].score, 350)
+        self.assertEqual(merged[0].get_meta('cluster_sources'), ['hackernews', 'reddit'])
+        self.assertEqual(merged[0].get_meta('cluster_urls'), ["https://b.example/2"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+"""
+抓取缓存测试
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.core.fetch_cache import FetchCache, config_hash
+from src.sources.base import Article
+from src.sources.hackernews import HackerNewsSource
+
+class FakeSource:
+    name = 'fake'
+    config = {}
+
+class FetchCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = FetchCache(path=os.path.join(tempfile.mkdtemp(), 'fetch_cache.sqlite3'))
+
+    def test_empty_result_is_not_cached(self):
+        article = Article("Some AI launch", "https://example.com/1", source='fake')
+        self.assertEqual(self.cache.fetch(FakeSource(), lambda: []), [])
+        self.assertEqual(self.cache.fetch(FakeSource(), lambda: [article]), [article])
+        # 非空结果在有效期内直接返回缓存
+        self.assertEqual(self.cache.fetch(FakeSource(), lambda: []), [article])
+
+    def test_hackernews_outage_raises_instead_of_returning_empty(self):
+        source = HackerNewsSource({})
+        with mock.patch.object(source, '_load_json', side_effect=OSError('timed out')):
+            with self.assertRaises(RuntimeError):
+                self.cache.fetch(source)
+        self.assertIsNone(self.cache.get(source.name, config_hash(source.config), 600))
+
+if __name__ == '__main__':
+    unittest.main()
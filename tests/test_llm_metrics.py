@@ -0,0 +1,39 @@
+"""
+LLM 用量统计测试
+"""
+import tempfile
+import unittest
+
+from src.core.llm_metrics import LLMUsageTracker
+
+class WallSecondsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tracker = LLMUsageTracker(max_seconds_per_run=10, metrics_dir=tempfile.mkdtemp())
+
+    def wall_seconds(self) -> float:
+        return self.tracker.summary()['totals']['wall_seconds']
+
+    def test_overlapping_calls_count_union(self):
+        # [0, 4] 和 [2, 7] 部分重叠：墙钟时间 7 秒，耗时之和 9 秒
+        self.tracker.record('a', 4, finished=104)
+        self.tracker.record('b', 5, finished=107)
+        self.assertAlmostEqual(self.wall_seconds(), 7)
+        self.assertAlmostEqual(self.tracker.summary()['totals']['seconds'], 9)
+
+    def test_long_call_covering_a_gap(self):
+        # 按结束顺序记录 [0, 1]、[5, 6]，再记录跨过空档的 [0.5, 8]
+        self.tracker.record('a', 1, finished=101)
+        self.tracker.record('b', 1, finished=106)
+        self.tracker.record('c', 7.5, finished=108)
+        self.assertAlmostEqual(self.wall_seconds(), 8)
+
+    def test_budget_uses_wall_seconds(self):
+        self.tracker.record('a', 6, finished=106)
+        self.tracker.record('b', 6, finished=106.5)
+        self.assertFalse(self.tracker.budget_exhausted())
+        self.tracker.record('c', 4, finished=110.5)
+        self.assertTrue(self.tracker.budget_exhausted())
+
+if __name__ == '__main__':
+    unittest.main()
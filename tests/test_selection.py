@@ -0,0 +1,29 @@
+"""
+带多样性约束的 top-K 选择测试
+"""
+import unittest
+
+from src.core.selection import select_diverse
+
+def pick(items, **kwargs):
+    return select_diverse(items, score_fn=lambda item: item[1], group_fn=lambda item: item[0], **kwargs)
+
+class SelectDiverseTest(unittest.TestCase):
+
+    def test_capped_picks_rank_before_relaxed_fill(self):
+        items = [('A', 10), ('A', 9), ('A', 8), ('A', 7), ('B', 2), ('C', 1)]
+        selected = pick(items, k=5, max_per_group=2, min_count=5)
+        self.assertEqual(selected, [('A', 10), ('A', 9), ('B', 2), ('C', 1), ('A', 8)])
+        # 按顺序取前 3 条发布时仍然满足来源上限
+        self.assertEqual([group for group, _ in selected[:3]], ['A', 'A', 'B'])
+
+    def test_without_shortfall_results_are_sorted_by_score(self):
+        items = [('A', 10), ('B', 5), ('A', 9), ('C', 7), ('A', 8)]
+        self.assertEqual(pick(items, k=3, max_per_group=2), [('A', 10), ('A', 9), ('C', 7)])
+
+    def test_min_count_relaxes_cap(self):
+        items = [('A', 3), ('A', 2), ('A', 1)]
+        self.assertEqual(pick(items, k=3, max_per_group=1, min_count=2), [('A', 3), ('A', 2)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+"""
+趋势索引主信号测试
+"""
+import unittest
+
+from src.core.trend_index import primary_signal
+from src.sources.base import Article
+
+def article(source: str, **metadata) -> Article:
+    return Article("Some AI launch", "https://example.com/1", source=source, metadata=metadata)
+
+class PrimarySignalTest(unittest.TestCase):
+
+    def test_tavily_relevance_score_is_not_a_trend_signal(self):
+        self.assertIsNone(primary_signal(article('tavily', score=0.87)))
+
+    def test_engagement_sources_use_their_own_signal(self):
+        self.assertEqual(primary_signal(article('hackernews', score=120, comments=40)), ('score', 120.0))
+        self.assertEqual(primary_signal(article('github_trending', stars=3000)), ('stars', 3000.0))
+        self.assertEqual(primary_signal(article('twitter', likes=80, retweets=5)), ('likes', 80.0))
+
+    def test_unknown_source_skips_generic_score(self):
+        self.assertIsNone(primary_signal(article('custom', score=0.5)))
+        self.assertEqual(primary_signal(article('custom', score=0.5, votes=12)), ('votes', 12.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ Gemini LLM 视频脚本生成器
 import json
 import os
 import sys
+import time
 import urllib.request
 import urllib.error
 from typing import Dict, Any
@@ -14,6 +15,12 @@ from datetime import datetime
 
 # 添加 AiTrend 路径
 sys.path.insert(0, '/home/ubuntu/.openclaw/workspace/AiTrend')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+try:
+    from src.core.llm_metrics import get_usage_tracker
+except ImportError:
+    get_usage_tracker = None
 
 
 class GeminiLLMClient:
@@ -34,10 +41,14 @@ class GeminiLLMClient:
         if not self.api_key:
             raise RuntimeError("❌ GEMINI_API_KEY not set. 请确保环境变量已正确导出")
         
+        # 视频脚本的最大输出长度（可通过环境变量调整）
+        self.script_max_tokens = int(os.getenv('GEMINI_VIDEO_SCRIPT_MAX_TOKENS', '4000'))
+        
         # Gemini API URL
         self.api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model_name}:generateContent"
     
-    def generate(self, prompt: str, temperature: float = 0.7, max_tokens: int = 4000) -> str:
+    def generate(self, prompt: str, temperature: float = 0.7, max_tokens: int = 4000,
+                 caller: str = 'video_script') -> str:
         """
         调用 Gemini API 生成内容
         
@@ -45,6 +56,7 @@ class GeminiLLMClient:
             prompt: 提示词
             temperature: 温度（创造性）
             max_tokens: 最大输出长度
+            caller: 用量统计中的调用方标识
             
         Returns:
             生成的文本内容
@@ -78,21 +90,31 @@ class GeminiLLMClient:
             method="POST"
         )
         
+        tracker = get_usage_tracker() if get_usage_tracker else None
+        started = time.monotonic()
+        
+        result = None
         try:
             # 发送请求
             with urllib.request.urlopen(req, timeout=60) as response:
                 result = json.loads(response.read().decode('utf-8'))
-                
-                # 提取生成的文本
-                if "candidates" in result and len(result["candidates"]) > 0:
-                    text = result["candidates"][0]["content"]["parts"][0]["text"]
-                    return text
-                else:
-                    raise Exception("Gemini API 返回空结果")
-                    
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode()
-            raise Exception(f"Gemini API 错误: {e.code} - {error_body}")
+            
+            # 提取生成的文本
+            if not result.get("candidates"):
+                raise Exception("Gemini API 返回空结果")
+            text = result["candidates"][0]["content"]["parts"][0]["text"]
+        except Exception as e:
+            # HTTP 错误、网络错误、超时、空结果都计为失败（有响应时仍统计其 token 用量）
+            if tracker:
+                tracker.record(caller, time.monotonic() - started, result, success=False)
+            if isinstance(e, urllib.error.HTTPError):
+                error_body = e.read().decode()
+                raise Exception(f"Gemini API 错误: {e.code} - {error_body}")
+            raise
+        
+        if tracker:
+            tracker.record(caller, time.monotonic() - started, result)
+        return text
     
     def generate_video_script(self, hotspots_data: Dict) -> Dict:
         """
@@ -113,7 +135,7 @@ class GeminiLLMClient:
         response = self.generate(
             prompt=prompt,
             temperature=0.7,
-            max_tokens=4000
+            max_tokens=self.script_max_tokens
         )
         
         # 解析 JSON 响应
@@ -252,6 +274,10 @@ class VideoScriptGenerator:
         # 调用 LLM 生成脚本
         script = self.llm_client.generate_video_script(data)
         
+        # 记录LLM用量
+        if get_usage_tracker:
+            get_usage_tracker().flush()
+        
         # 构建完整输出
         output = {
             'date': data.get('date'),
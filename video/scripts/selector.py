@@ -12,21 +12,30 @@ from typing import Dict, List, Any
 
 # 添加 AiTrend 路径
 sys.path.insert(0, '/home/ubuntu/.openclaw/workspace/AiTrend')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.minhash import dedupe_titles
+from src.core.selection import select_diverse
 
 
 class HotspotSelector:
     """热点精选器"""
     
-    def __init__(self, max_items: int = 8, min_heat_score: int = 50):
+    def __init__(self, max_items: int = 8, min_heat_score: int = 50, min_items: int = 5,
+                 dedup_threshold: float = 0.6):
         """
         初始化精选器
         
         Args:
             max_items: 最大精选数量（默认8条）
             min_heat_score: 最小热度分数阈值
+            min_items: 最少精选数量（同类主题上限导致不足时放宽上限补足，默认5条）
+            dedup_threshold: 标题去重的 Jaccard 相似度阈值（默认0.6）
         """
         self.max_items = max_items
         self.min_heat_score = min_heat_score
+        self.min_items = min_items
+        self.dedup_threshold = dedup_threshold
     
     def select(self, input_file: str, output_file: str = None) -> Dict[str, Any]:
         """
@@ -65,15 +74,8 @@ class HotspotSelector:
         deduplicated = self._deduplicate(filtered_items)
         print(f"🧹 去重后: {len(deduplicated)} 条")
         
-        # 排序：按热度分数
-        sorted_items = sorted(
-            deduplicated, 
-            key=lambda x: x.get('heat_score', 0), 
-            reverse=True
-        )
-        
-        # 多样性筛选：同类主题不超过2条
-        selected = self._apply_diversity(sorted_items)
+        # 按热度选择，同类主题不超过2条
+        selected = self._apply_diversity(deduplicated)
         
         print(f"✅ 最终精选: {len(selected)} 条")
         
@@ -99,70 +101,34 @@ class HotspotSelector:
         return output
     
     def _deduplicate(self, items: List[Dict]) -> List[Dict]:
-        """基于标题相似度去重"""
-        unique_items = []
-        seen_titles = []
-        
-        for item in items:
-            title = item.get('title', '').lower()
-            
-            # 检查是否与已有标题相似
-            is_duplicate = False
-            for seen in seen_titles:
-                # 简单相似度检查：包含关系或编辑距离
-                if self._is_similar(title, seen):
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                unique_items.append(item)
-                seen_titles.append(title)
-        
-        return unique_items
-    
-    def _is_similar(self, title1: str, title2: str, threshold: float = 0.7) -> bool:
-        """检查两个标题是否相似"""
-        # 简单实现：包含检查
-        if title1 in title2 or title2 in title1:
-            return True
-        
-        # 计算简单相似度（共同字符比例）
-        set1 = set(title1)
-        set2 = set(title2)
-        if not set1 or not set2:
-            return False
-        
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        similarity = intersection / union if union > 0 else 0
-        
-        return similarity > threshold
+        """基于标题相似度去重（MinHash LSH，英文按单词、中文按字符二元组比较）"""
+        kept = dedupe_titles([item.get('title', '') for item in items], threshold=self.dedup_threshold)
+        return [items[i] for i in kept]
     
     def _apply_diversity(self, items: List[Dict]) -> List[Dict]:
-        """应用多样性筛选：同类主题不超过2条"""
-        selected = []
-        category_count = {}
+        """按热度选择前 max_items 条，同类主题不超过2条（不足 min_items 条时放宽上限补足）"""
+        selected = select_diverse(
+            items,
+            k=self.max_items,
+            score_fn=lambda item: item.get('heat_score', 0),
+            group_fn=self._category_of,
+            max_per_group=2,
+            min_count=self.min_items
+        )
         
-        for item in items:
-            # 获取类别（如果没有则基于来源推断）
-            category = item.get('category', '其他')
-            if category == '其他':
-                # 基于来源推断类别
-                source = item.get('source_origin', '')
-                category = self._infer_category(source)
-            
-            # 检查类别数量
-            if category_count.get(category, 0) < 2:
-                # 添加排名信息
-                item['rank'] = len(selected) + 1
-                selected.append(item)
-                category_count[category] = category_count.get(category, 0) + 1
-            
-            if len(selected) >= self.max_items:
-                break
+        # 添加排名信息
+        for rank, item in enumerate(selected, 1):
+            item['rank'] = rank
         
         return selected
     
+    def _category_of(self, item: Dict) -> str:
+        """获取类别（如果没有则基于来源推断）"""
+        category = item.get('category', '其他')
+        if category == '其他':
+            category = self._infer_category(item.get('source_origin', ''))
+        return category
+    
     def _infer_category(self, source: str) -> str:
         """基于来源推断类别"""
         category_map = {
@@ -186,10 +152,11 @@ def main():
     parser.add_argument('--output', '-o', help='输出文件路径')
     parser.add_argument('--max', '-m', type=int, default=8, help='最大精选数量')
     parser.add_argument('--min-heat', type=int, default=50, help='最小热度分数')
+    parser.add_argument('--min-items', type=int, default=5, help='最少精选数量')
     
     args = parser.parse_args()
     
-    selector = HotspotSelector(max_items=args.max, min_heat_score=args.min_heat)
+    selector = HotspotSelector(max_items=args.max, min_heat_score=args.min_heat, min_items=args.min_items)
     result = selector.select(args.input, args.output)
     
     print(f"\n📋 精选结果:")
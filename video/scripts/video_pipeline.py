@@ -10,14 +10,19 @@ import json
 import subprocess
 from datetime import datetime
 from pathlib import Path
+from typing import Dict
 
-# 添加脚本路径
+# 添加脚本路径和 AiTrend 根目录
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from selector import HotspotSelector
 from llm_processor import VideoScriptGenerator
 from tts_generator import MinimaxTTS
 from script_converter import ScriptConverter
+from src.core.archive import get_article_archive
+from src.core.daily_aggregate import get_daily_aggregate
+from src.core.scoring import get_hot_score_engine
 
 
 class VideoPipeline:
@@ -180,10 +185,22 @@ class VideoPipeline:
             os.path.join('/home/ubuntu/.openclaw/workspace/AiTrend/data', f'output_{date}.json'),
         ]
         
+        # hourly 每轮维护的当天聚合文件
+        aggregate = get_daily_aggregate()
+        if aggregate:
+            candidates.insert(1, aggregate.path(date))
+        
         for candidate in candidates:
             if os.path.exists(candidate):
                 return candidate
         
+        # 都不存在时（如聚合启用前的日期）从采集归档补建
+        archive = get_article_archive()
+        if aggregate and archive and archive.partitions(date):
+            count = aggregate.rebuild(date, archive, get_hot_score_engine())
+            print(f"🗄️ 从采集归档补建当天聚合 {count} 条: {aggregate.path(date)}")
+            return aggregate.path(date)
+        
         # 如果没找到，返回第一个候选路径（让后续报错）
         return candidates[0]
     